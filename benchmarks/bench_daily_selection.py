@@ -0,0 +1,78 @@
+"""
+Benchmark: daily nearest-time selection, point-by-point vs columnar.
+
+Run:
+    python benchmarks/bench_daily_selection.py
+"""
+
+from __future__ import annotations
+
+import logging
+import timeit
+from datetime import datetime, time, timedelta, timezone
+
+from met_weather_service.services.forecast import (
+    MetSeries,
+    parse_met_series,
+    select_daily_temperature_from_series,
+    select_daily_temperature_near_time,
+    iter_met_points,
+)
+
+TZ_NAME = "Europe/Belgrade"
+TARGET = time(14, 0)
+NUMBER = 2_000
+
+
+def _met_payload() -> dict:
+    # MET layout around a DST change: hourly for 60 h, then 6-hourly up to ~10 days
+    start = datetime(2026, 3, 27, tzinfo=timezone.utc)
+    hours = list(range(60)) + list(range(60, 240, 6))
+    return {
+        "properties": {
+            "timeseries": [
+                {
+                    "time": (start + timedelta(hours=h)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    "data": {"instant": {"details": {"air_temperature": round(h * 0.1, 1)}}},
+                }
+                for h in hours
+            ]
+        }
+    }
+
+
+def main() -> None:
+    logging.disable(logging.INFO)
+
+    data = _met_payload()
+    series: MetSeries = parse_met_series(data)
+
+    assert select_daily_temperature_from_series(series, TZ_NAME, TARGET) == select_daily_temperature_near_time(
+        iter_met_points(data), TZ_NAME, TARGET
+    )
+
+    cases = {
+        "pointwise (parse + select per request)": lambda: select_daily_temperature_near_time(
+            iter_met_points(data), TZ_NAME, TARGET
+        ),
+        "pointwise (from cached series)": lambda: select_daily_temperature_near_time(
+            series.iter_points(), TZ_NAME, TARGET
+        ),
+        "columnar (cold, offsets computed)": lambda: select_daily_temperature_from_series(
+            MetSeries(epoch_s=series.epoch_s, temperature_c=series.temperature_c), TZ_NAME, TARGET
+        ),
+        "columnar (warm, offsets cached per tz)": lambda: select_daily_temperature_from_series(
+            series, TZ_NAME, TARGET
+        ),
+    }
+
+    print(f"points={len(series)} tz={TZ_NAME} target={TARGET.isoformat(timespec='minutes')} runs={NUMBER}")
+    baseline = None
+    for name, fn in cases.items():
+        best = min(timeit.repeat(fn, number=NUMBER, repeat=5)) / NUMBER
+        baseline = baseline or best
+        print(f"{name:42s} {best * 1e6:9.1f} us/call  x{baseline / best:5.1f}")
+
+
+if __name__ == "__main__":
+    main()
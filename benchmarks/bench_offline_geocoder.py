@@ -0,0 +1,99 @@
+"""
+Benchmark: offline reverse geocoding, KD-tree vs linear scan.
+
+Builds an index over synthetic places spread uniformly on the sphere (about the
+size of GeoNames cities500) and reports build time, memory and query latency.
+
+Run:
+    python benchmarks/bench_offline_geocoder.py [places]
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import random
+import sys
+import time
+import timeit
+import tracemalloc
+
+from met_weather_service.services.offline_geocoder import GazetteerEntry, OfflineGeocoder
+
+PLACES = 200_000
+QUERIES = 20_000
+SCAN_QUERIES = 20
+
+
+def _entries(n: int, rng: random.Random) -> list[GazetteerEntry]:
+    return [
+        GazetteerEntry(
+            name=f"Place {i}",
+            lat=math.degrees(math.asin(rng.uniform(-1.0, 1.0))),
+            lon=rng.uniform(-180.0, 180.0),
+            country_code=rng.choice(("RS", "HR", "HU", "RO", "BG", "NO", "SE")),
+            population=rng.randrange(500, 2_000_000),
+        )
+        for i in range(n)
+    ]
+
+
+def _linear_nearest(entries: list[GazetteerEntry], lat: float, lon: float) -> int:
+    phi, lam = math.radians(lat), math.radians(lon)
+    qx, qy, qz = math.cos(phi) * math.cos(lam), math.cos(phi) * math.sin(lam), math.sin(phi)
+    best, best_d = -1, math.inf
+    for i, e in enumerate(entries):
+        p, l = math.radians(e.lat), math.radians(e.lon)
+        dx = math.cos(p) * math.cos(l) - qx
+        dy = math.cos(p) * math.sin(l) - qy
+        dz = math.sin(p) - qz
+        d = dx * dx + dy * dy + dz * dz
+        if d < best_d:
+            best, best_d = i, d
+    return best
+
+
+def main() -> None:
+    logging.disable(logging.INFO)
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else PLACES
+    rng = random.Random(42)
+    entries = _entries(n, rng)
+    queries = [(rng.uniform(-90.0, 90.0), rng.uniform(-180.0, 180.0)) for _ in range(QUERIES)]
+
+    started = time.perf_counter()
+    geocoder = OfflineGeocoder(entries)
+    build_s = time.perf_counter() - started
+
+    # second build only for memory accounting (tracing slows it down a lot)
+    del geocoder
+    tracemalloc.start()
+    geocoder = OfflineGeocoder(entries)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    for lat, lon in queries[:SCAN_QUERIES]:
+        idx, _ = geocoder.nearest_index(lat, lon)
+        assert geocoder.place_at(idx).city == entries[_linear_nearest(entries, lat, lon)].name
+
+    def tree() -> None:
+        for lat, lon in queries:
+            geocoder.nearest(lat, lon)
+
+    def scan() -> None:
+        for lat, lon in queries[:SCAN_QUERIES]:
+            _linear_nearest(entries, lat, lon)
+
+    tree_us = min(timeit.repeat(tree, number=1, repeat=3)) / len(queries) * 1e6
+    scan_us = min(timeit.repeat(scan, number=1, repeat=1)) / SCAN_QUERIES * 1e6
+
+    print(f"places:        {n}")
+    print(f"build:         {build_s:8.2f} s")
+    print(f"index memory:  {retained / 1e6:8.1f} MB retained, {peak / 1e6:.1f} MB peak during build")
+    print(f"kd-tree query: {tree_us:8.1f} us/query")
+    print(f"linear scan:   {scan_us:8.1f} us/query")
+    print(f"speedup:       {scan_us / tree_us:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
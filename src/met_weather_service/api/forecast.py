@@ -1,20 +1,39 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
+import math
 import re
+import time as time_module
 from datetime import time
-from typing import Annotated
+from email.utils import parsedate_to_datetime
+from typing import Annotated, Any, AsyncIterator
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 import httpx
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
+from met_weather_service.core import fast_json
 from met_weather_service.core.config import get_settings
-from met_weather_service.services.forecast import DailyTemperatureSelector
-from met_weather_service.services.geocoder_gateway import GeocoderRateLimitExceeded, reverse_geocode
+from met_weather_service.services.forecast import (
+    DailyForecastPoints,
+    DailyTemperatureSelector,
+    ForecastPoint,
+    MultiTimeTemperatureSelector,
+)
+from met_weather_service.services.forecast_memo import select_daily_memoized
+from met_weather_service.services.geocoder_client import GeoPlace
+from met_weather_service.services.geocoder_gateway import GeocoderRateLimitExceeded, areverse_geocode
 from met_weather_service.services.met_client import truncate_coord
-from met_weather_service.services.met_gateway import get_locationforecast_compact, MetRateLimitExceeded
+from met_weather_service.services.met_gateway import (
+    MetCacheResult,
+    MetRateLimitExceeded,
+    aget_locationforecast_compact_result,
+    aiter_locationforecast_compact_results,
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/v1", tags=["forecast"])
@@ -40,7 +59,7 @@ class LocationInfo(BaseModel):
 
     target_time: str = Field(
         ...,
-        description="Requested local time in HH:MM format.",
+        description="Requested local time(s) in HH:MM format, comma-separated if several.",
         json_schema_extra={"example": "14:00"},
     )
     place_name: str | None = Field(
@@ -70,12 +89,73 @@ class DayForecast(BaseModel):
     )
 
 
+class TargetForecast(BaseModel):
+    at: str = Field(..., description="Requested local time (HH:MM).", json_schema_extra={"example": "08:00"})
+    time: str = Field(
+        ...,
+        description="Selected local datetime (ISO8601) in the selected timezone.",
+        json_schema_extra={"example": "2026-01-26T08:00:00+01:00"},
+    )
+    temperature_c: float = Field(..., description="Air temperature in Celsius.", json_schema_extra={"example": -1.5})
+
+
+class MultiTargetDayForecast(BaseModel):
+    date: str = Field(
+        ...,
+        description="Local date (YYYY-MM-DD) in the selected timezone.",
+        json_schema_extra={"example": "2026-01-26"},
+    )
+    targets: list[TargetForecast] = Field(..., description="One entry per requested target time, in request order.")
+
+
 class ForecastResponse(BaseModel):
     location: LocationInfo
-    days: list[DayForecast]
+    days: list[DayForecast] = Field(..., description="One entry per day for a single `at`; empty for several.")
+    days_multi: list[MultiTargetDayForecast] | None = Field(
+        None,
+        description="One entry per day when `at` lists several times; null for a single `at`.",
+    )
+
+
+class BatchForecastItem(BaseModel):
+    lat: float = Field(..., ge=-90, le=90, json_schema_extra={"example": 44.81259})
+    lon: float = Field(..., ge=-180, le=180, json_schema_extra={"example": 20.46129})
+    tz: str = Field("Europe/Belgrade", description="IANA timezone name.")
+    at: str = Field("14:00", description="Target local time(s) in strict HH:MM format, comma-separated if several.")
+
+
+class BatchForecastRequest(BaseModel):
+    items: list[BatchForecastItem] = Field(..., min_length=1)
+
+
+class ItemError(BaseModel):
+    status: int = Field(..., description="HTTP status the item would have on /v1/forecast.", json_schema_extra={"example": 502})
+    detail: str = Field(..., json_schema_extra={"example": "MET upstream error"})
+
+
+class BatchForecastResult(BaseModel):
+    index: int = Field(..., description="Position of the item in the request.")
+    location: LocationInfo | None = None
+    days: list[DayForecast] | None = None
+    days_multi: list[MultiTargetDayForecast] | None = None
+    error: ItemError | None = None
+
+
+class BatchForecastResponse(BaseModel):
+    results: list[BatchForecastResult]
 
 
 _HHMM_RE = re.compile(r"^\d{2}:\d{2}$")
+_MAX_TARGET_TIMES = 24
+
+# Reverse-geocode tasks outlive requests that stopped waiting, so their result still lands in the cache
+_place_tasks: set[asyncio.Task[Any]] = set()
+
+# RFC 7234 warn-codes used to mark responses built from stale MET data
+_STALE_WARNINGS = {
+    "revalidating": '110 - "Response is Stale"',
+    "error": '111 - "Revalidation Failed"',
+}
 
 
 def parse_hhmm(value: str) -> time:
@@ -91,6 +171,21 @@ def parse_hhmm(value: str) -> time:
     return time(hour=hh, minute=mm)
 
 
+def parse_target_times(value: str) -> tuple[time, ...]:
+    """
+    Parse `at`: one HH:MM value or several separated by commas.
+    """
+    parts = value.split(",")
+    if len(parts) > _MAX_TARGET_TIMES:
+        raise ValueError(f"at most {_MAX_TARGET_TIMES} target times allowed")
+
+    targets = tuple(parse_hhmm(part.strip()) for part in parts)
+    if len(set(targets)) != len(targets):
+        raise ValueError("duplicate target time")
+
+    return targets
+
+
 def validate_timezone(tz_name: str) -> str:
     try:
         ZoneInfo(tz_name)
@@ -100,23 +195,241 @@ def validate_timezone(tz_name: str) -> str:
         raise ValueError("timezone not available")
 
 
+def met_error_status(exc: Exception) -> tuple[int, str] | None:
+    """
+    Map a MET gateway exception to the (status, detail) used by /v1/forecast.
+    """
+    if isinstance(exc, RuntimeError):
+        return 500, str(exc)
+    if isinstance(exc, MetRateLimitExceeded):
+        return 429, "Too many requests"
+    if isinstance(exc, (httpx.HTTPError, ValueError)):
+        return 502, "MET upstream error"
+    return None
+
+
+def _day_models(days: list[ForecastPoint]) -> list[DayForecast]:
+    return [
+        DayForecast(
+            date=p.date,
+            time=p.time,
+            temperature_c=p.temperature_c,
+        )
+        for p in days
+    ]
+
+
+def _multi_day_models(days: list[DailyForecastPoints]) -> list[MultiTargetDayForecast]:
+    return [
+        MultiTargetDayForecast(
+            date=d.date,
+            targets=[
+                TargetForecast(at=t.target, time=t.time, temperature_c=t.temperature_c)
+                for t in d.targets
+            ],
+        )
+        for d in days
+    ]
+
+
+def _on_place_task_done(task: asyncio.Task[Any]) -> None:
+    _place_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        # already logged if the request was still waiting; this marks it retrieved
+        logger.debug("Reverse geocoding task failed", exc_info=task.exception())
+
+
+def _start_place_lookup(lat: float, lon: float) -> asyncio.Task[GeoPlace | None]:
+    """
+    Start reverse geocoding now so it overlaps with the MET fetch.
+    """
+    task = asyncio.create_task(areverse_geocode(lat, lon))
+    _place_tasks.add(task)
+    task.add_done_callback(_on_place_task_done)
+    return task
+
+
+async def cancel_place_lookups() -> None:
+    """
+    Cancel reverse geocoding still running after its response went out (shutdown).
+    """
+    tasks = list(_place_tasks)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _await_place(task: asyncio.Task[GeoPlace | None], timeout_s: float) -> GeoPlace | None:
+    """
+    Best-effort place: None on error or when the lookup misses its deadline.
+
+    The task is shielded, so a late answer is still stored in the geocoder cache.
+    """
+    try:
+        return await asyncio.wait_for(asyncio.shield(task), timeout=max(0.0, timeout_s))
+    except asyncio.TimeoutError:
+        logger.warning("Geocoder missed the include_place deadline, responding without place")
+    except GeocoderRateLimitExceeded:
+        logger.warning("Geocoder rate limit exceeded while include_place=true")
+    except Exception:
+        logger.exception("Geocoder failed while include_place=true")
+    return None
+
+
+def _met_validator(met: MetCacheResult) -> str:
+    if met.last_modified:
+        return met.last_modified
+    return hashlib.blake2b(met.content, digest_size=16).hexdigest()
+
+
+def _forecast_etag(met: MetCacheResult, location: dict[str, Any]) -> str:
+    """
+    Strong ETag for a /v1/forecast body: upstream body identity plus every
+    request-derived field that shapes the response (coordinates, tz, at, place).
+    """
+    parts = [get_settings().git_sha, _met_validator(met), *(str(v) for v in location.values())]
+    return '"' + hashlib.blake2b("\x1f".join(parts).encode(), digest_size=16).hexdigest() + '"'
+
+
+def _not_modified(request: Request, etag: str, last_modified: str | None) -> bool:
+    # RFC 9110 13.2.2: If-None-Match wins over If-Modified-Since
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [t.strip().removeprefix("W/") for t in if_none_match.split(",")]
+        return "*" in tags or etag in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+
+def _validator_headers(met: MetCacheResult, etag: str) -> dict[str, str]:
+    # Fresh for the rest of the MET entry's lifetime; stale data is not cacheable downstream
+    max_age = 0 if met.stale else max(0, math.floor(met.expires_at - time_module.time()))
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={max_age}"}
+    if met.last_modified:
+        headers["Last-Modified"] = met.last_modified
+    if met.stale:
+        headers["Warning"] = _STALE_WARNINGS[met.stale]
+    return headers
+
+
+def _day_dicts(days: list[ForecastPoint] | list[DailyForecastPoints]) -> dict[str, Any]:
+    # Same keys, shape and order as ForecastResponse.days / days_multi
+    if days and isinstance(days[0], DailyForecastPoints):
+        return {
+            "days": [],
+            "days_multi": [
+                {
+                    "date": d.date,
+                    "targets": [
+                        {"at": t.target, "time": t.time, "temperature_c": t.temperature_c}
+                        for t in d.targets
+                    ],
+                }
+                for d in days
+            ],
+        }
+    return {
+        "days": [{"date": p.date, "time": p.time, "temperature_c": p.temperature_c} for p in days],
+        "days_multi": None,
+    }
+
+
+def _select_points(
+        met: MetCacheResult,
+        tz_name: str,
+        target_times: tuple[time, ...],
+) -> list[ForecastPoint] | list[DailyForecastPoints]:
+    if len(target_times) == 1:
+        selector = DailyTemperatureSelector(tz_name=tz_name, target_time=target_times[0])
+        return select_daily_memoized(met, selector)
+
+    multi = MultiTimeTemperatureSelector(tz_name=tz_name, target_times=target_times)
+    return select_daily_memoized(met, multi)
+
+
+def _select_days(
+        met: MetCacheResult,
+        tz_name: str,
+        target_times: tuple[time, ...],
+) -> tuple[list[DayForecast], list[MultiTargetDayForecast] | None]:
+    """
+    Return (days, days_multi): days for a single target time, days_multi for several.
+    """
+    points = _select_points(met, tz_name, target_times)
+    if len(target_times) == 1:
+        return _day_models(points), None
+    return [], _multi_day_models(points)
+
+
+_ParsedItem = tuple[str, tuple[time, ...]]
+
+
+def _parse_batch_item(index: int, item: BatchForecastItem) -> _ParsedItem | BatchForecastResult:
+    """
+    Validate an item's tz/at before any fetch; returns them or the item's 422 result.
+    """
+    try:
+        return validate_timezone(item.tz), parse_target_times(item.at)
+    except ValueError as exc:
+        return BatchForecastResult(index=index, error=ItemError(status=422, detail=str(exc)))
+
+
+def _batch_item_result(
+        index: int,
+        item: BatchForecastItem,
+        parsed: _ParsedItem,
+        met: MetCacheResult | Exception,
+) -> BatchForecastResult:
+    tz_name, target_times = parsed
+
+    if isinstance(met, Exception):
+        mapped = met_error_status(met)
+        if mapped is None:
+            logger.error("Unexpected error in /v1/forecast/batch item=%s", index, exc_info=met)
+            mapped = (500, "Internal error")
+        return BatchForecastResult(index=index, error=ItemError(status=mapped[0], detail=mapped[1]))
+
+    days, days_multi = _select_days(met, tz_name, target_times)
+    return BatchForecastResult(
+        index=index,
+        location=LocationInfo(
+            lat=truncate_coord(item.lat),
+            lon=truncate_coord(item.lon),
+            timezone=tz_name,
+            target_time=item.at,
+        ),
+        days=days,
+        days_multi=days_multi,
+    )
+
+
 @router.get(
     "/forecast",
     response_model=ForecastResponse,
     summary="Daily temperature near a local time",
     description=(
             "Fetches MET forecast timeseries and selects, for each local date, "
-            "the point nearest to the requested local time. "
+            "the point nearest to the requested local time. Several comma-separated times "
+            "(e.g. 08:00,14:00,20:00) return one value per time for each day. "
             "Coordinates are truncated to 4 decimals as required by MET ToS."
     ),
     responses={
+        304: {"description": "Not modified (If-None-Match or If-Modified-Since matched)."},
         422: {"description": "Validation error (invalid timezone, time format or coordinates)."},
         500: {"description": "Service misconfiguration (e.g. MET_USER_AGENT missing)."},
         502: {"description": "Upstream MET/network error."},
         429: {"description": "Too many requests (service-side rate limiting to protect outer services)."},
     },
 )
-def forecast(
+async def forecast(
+        request: Request,
+        response: Response,
         lat: Annotated[
             float | None,
             Query(
@@ -145,8 +458,8 @@ def forecast(
         at: Annotated[
             str,
             Query(
-                description="Target local time in strict HH:MM format.",
-                examples=["14:00"],
+                description="Target local time in strict HH:MM format, or several comma-separated.",
+                examples=["14:00", "08:00,14:00,20:00"],
             ),
         ] = "14:00",
         include_place: Annotated[
@@ -156,7 +469,7 @@ def forecast(
                 examples=[True],
             ),
         ] = False,
-) -> ForecastResponse:
+) -> ForecastResponse | Response:
     logger.info("Request /v1/forecast lat=%s lon=%s tz=%s at=%s", lat, lon, tz, at)
 
     settings = get_settings()
@@ -168,15 +481,18 @@ def forecast(
 
     try:
         tz_name = validate_timezone(tz)
-        target_time = parse_hhmm(at)
+        target_times = parse_target_times(at)
     except ValueError as exc:
         raise HTTPException(status_code=422, detail=str(exc)) from exc
 
     used_lat = truncate_coord(lat)
     used_lon = truncate_coord(lon)
 
+    started = time_module.monotonic()
+    place_task = _start_place_lookup(used_lat, used_lon) if include_place else None
+
     try:
-        data = get_locationforecast_compact(used_lat, used_lon)
+        met = await aget_locationforecast_compact_result(used_lat, used_lon)
 
     except RuntimeError as exc:
         logger.exception("Service misconfiguration in /v1/forecast")
@@ -203,44 +519,141 @@ def forecast(
         logger.exception("Unexpected error in /v1/forecast")
         raise
 
-    selector = DailyTemperatureSelector(
-        tz_name=tz_name,
-        target_time=target_time,
-    )
-    days = selector.select_from_met_response(data)
-
     place_name = None
     country = None
     city = None
 
-    if include_place:
-        try:
-            place = reverse_geocode(used_lat, used_lon)
-            if place:
-                place_name = place.display_name
-                country = place.country
-                city = place.city
-        except GeocoderRateLimitExceeded:
-            logger.warning("Geocoder rate limit exceeded while include_place=true")
-        except Exception:
-            logger.exception("Geocoder failed while include_place=true")
-
-    return ForecastResponse(
-        location=LocationInfo(
-            lat=used_lat,
-            lon=used_lon,
-            timezone=tz_name,
-            target_time=at,
-            place_name=place_name,
-            country=country,
-            city=city,
-        ),
-        days=[
-            DayForecast(
-                date=p.date,
-                time=p.time,
-                temperature_c=p.temperature_c,
-            )
-            for p in days
-        ],
+    if place_task is not None:
+        remaining_s = float(settings.forecast_place_timeout_s) - (time_module.monotonic() - started)
+        place = await _await_place(place_task, remaining_s)
+        if place:
+            place_name = place.display_name
+            country = place.country
+            city = place.city
+
+    location = {
+        "lat": used_lat,
+        "lon": used_lon,
+        "timezone": tz_name,
+        "target_time": at,
+        "place_name": place_name,
+        "country": country,
+        "city": city,
+    }
+
+    etag = _forecast_etag(met, location)
+    headers = _validator_headers(met, etag)
+
+    # Last-Modified only dates the MET payload; the place name may change without it
+    if _not_modified(request, etag, None if include_place else met.last_modified):
+        return Response(status_code=304, headers=headers)
+
+    points = _select_points(met, tz_name, target_times)
+
+    if settings.forecast_fast_json:
+        # Bypass response_model validation: the payload is built from already
+        # validated values in the exact ForecastResponse shape.
+        return Response(
+            content=fast_json.dumps({"location": location, **_day_dicts(points)}),
+            media_type="application/json",
+            headers=headers,
+        )
+
+    response.headers.update(headers)
+
+    if len(target_times) == 1:
+        return ForecastResponse(location=LocationInfo(**location), days=_day_models(points))
+    return ForecastResponse(location=LocationInfo(**location), days=[], days_multi=_multi_day_models(points))
+
+
+@router.post(
+    "/forecast/batch",
+    response_model=BatchForecastResponse,
+    summary="Daily temperature for many locations in one call",
+    description=(
+            "Runs the /v1/forecast selection for each item. Items are deduplicated by truncated "
+            "coordinates and missing MET payloads are fetched concurrently under the MET rate limit. "
+            "Each result carries either location/days/days_multi or a per-item error with the status the "
+            "item would get on /v1/forecast."
+    ),
+    responses={
+        422: {"description": "Validation error (malformed body or too many items)."},
+    },
+)
+async def forecast_batch(body: BatchForecastRequest) -> BatchForecastResponse:
+    settings = get_settings()
+
+    if len(body.items) > settings.forecast_batch_max_items:
+        raise HTTPException(
+            status_code=422,
+            detail=f"too many items (max {settings.forecast_batch_max_items})",
+        )
+
+    logger.info("Request /v1/forecast/batch items=%d", len(body.items))
+
+    # invalid items get their 422 without their coordinates being fetched
+    parsed = [_parse_batch_item(index, item) for index, item in enumerate(body.items)]
+    valid = [item for item, p in zip(body.items, parsed) if not isinstance(p, BatchForecastResult)]
+
+    fetched: dict[tuple[float, float], MetCacheResult | Exception] = {}
+    async for key, met in aiter_locationforecast_compact_results(
+            ((item.lat, item.lon) for item in valid),
+            concurrency=settings.forecast_batch_concurrency,
+    ):
+        fetched[key] = met
+
+    return BatchForecastResponse(
+        results=[
+            p
+            if isinstance(p, BatchForecastResult)
+            else _batch_item_result(index, item, p, fetched[(truncate_coord(item.lat), truncate_coord(item.lon))])
+            for index, (item, p) in enumerate(zip(body.items, parsed))
+        ]
+    )
+
+
+async def _stream_batch_lines(items: list[BatchForecastItem], concurrency: int) -> AsyncIterator[bytes]:
+    # Invalid items are emitted right away; valid ones as their MET payload arrives.
+    waiting: dict[tuple[float, float], list[tuple[int, _ParsedItem]]] = {}
+
+    for index, item in enumerate(items):
+        parsed = _parse_batch_item(index, item)
+        if isinstance(parsed, BatchForecastResult):
+            yield parsed.model_dump_json().encode() + b"\n"
+            continue
+        waiting.setdefault((truncate_coord(item.lat), truncate_coord(item.lon)), []).append((index, parsed))
+
+    async for key, met in aiter_locationforecast_compact_results(waiting.keys(), concurrency=concurrency):
+        for index, parsed in waiting.pop(key):
+            yield _batch_item_result(index, items[index], parsed, met).model_dump_json().encode() + b"\n"
+
+
+@router.post(
+    "/forecast/stream",
+    response_class=StreamingResponse,
+    summary="Stream daily temperatures for many locations as NDJSON",
+    description=(
+            "Same body and per-item results as /v1/forecast/batch, but written as one JSON line "
+            "(BatchForecastResult) per item as soon as its MET payload is available, in completion "
+            "order. Use `index` to match lines to request items."
+    ),
+    responses={
+        200: {"content": {"application/x-ndjson": {}}, "description": "One BatchForecastResult per line."},
+        422: {"description": "Validation error (malformed body or too many items)."},
+    },
+)
+async def forecast_stream(body: BatchForecastRequest) -> StreamingResponse:
+    settings = get_settings()
+
+    if len(body.items) > settings.forecast_stream_max_items:
+        raise HTTPException(
+            status_code=422,
+            detail=f"too many items (max {settings.forecast_stream_max_items})",
+        )
+
+    logger.info("Request /v1/forecast/stream items=%d", len(body.items))
+
+    return StreamingResponse(
+        _stream_batch_lines(body.items, settings.forecast_batch_concurrency),
+        media_type="application/x-ndjson",
     )
@@ -9,8 +9,9 @@ from pydantic import BaseModel, Field
 
 from met_weather_service.services.geocoder_gateway import (
     GeocoderRateLimitExceeded,
-    forward_geocode,
-    reverse_geocode,
+    aforward_geocode,
+    areverse_geocode,
+    suggest_places,
 )
 from met_weather_service.services.met_client import truncate_coord
 
@@ -49,14 +50,14 @@ class ReverseResponse(BaseModel):
         502: {"description": "Upstream geocoder/network error."},
     },
 )
-def geocode(
+async def geocode(
         q: Annotated[str, Query(min_length=2, max_length=200, description="Place name query")],
         limit: Annotated[int, Query(ge=1, le=5, description="Max number of results")] = 5,
 ) -> GeocodeResponse:
     logger.info("Request /v1/geocode q=%s limit=%s", q, limit)
 
     try:
-        places = forward_geocode(q, limit=limit)
+        places = await aforward_geocode(q, limit=limit)
     except GeocoderRateLimitExceeded as exc:
         raise HTTPException(status_code=429, detail="Too many requests") from exc
     except RuntimeError as exc:
@@ -81,6 +82,37 @@ def geocode(
     )
 
 
+@router.get(
+    "/geocode/suggest",
+    response_model=GeocodeResponse,
+    summary="Place name autocomplete from the local index (no upstream calls)",
+    responses={
+        422: {"description": "Validation error."},
+    },
+)
+def geocode_suggest(
+        q: Annotated[str, Query(min_length=1, max_length=100, description="Place name prefix")],
+        limit: Annotated[int, Query(ge=1, le=10, description="Max number of suggestions")] = 5,
+) -> GeocodeResponse:
+    places = suggest_places(q, limit=limit)
+    logger.debug("Request /v1/geocode/suggest q=%s limit=%s results=%d", q, limit, len(places))
+
+    return GeocodeResponse(
+        query=q,
+        results=[
+            GeocodePlace(
+                display_name=p.display_name,
+                lat=truncate_coord(p.lat),
+                lon=truncate_coord(p.lon),
+                country=p.country,
+                city=p.city,
+                state=p.state,
+            )
+            for p in places
+        ],
+    )
+
+
 @router.get(
     "/reverse",
     response_model=ReverseResponse,
@@ -92,7 +124,7 @@ def geocode(
         502: {"description": "Upstream geocoder/network error."},
     },
 )
-def reverse(
+async def reverse(
         lat: Annotated[float, Query(ge=-90, le=90)],
         lon: Annotated[float, Query(ge=-180, le=180)],
 ) -> ReverseResponse:
@@ -102,7 +134,7 @@ def reverse(
     logger.info("Request /v1/reverse lat=%s lon=%s used_lat=%s used_lon=%s", lat, lon, used_lat, used_lon)
 
     try:
-        place = reverse_geocode(used_lat, used_lon)
+        place = await areverse_geocode(used_lat, used_lon)
     except GeocoderRateLimitExceeded as exc:
         raise HTTPException(status_code=429, detail="Too many requests") from exc
     except RuntimeError as exc:
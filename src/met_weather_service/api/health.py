@@ -1,11 +1,21 @@
 import logging
+from typing import Annotated, Any
 
 import httpx
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, Field
 
-from met_weather_service.core.config import get_settings
-from met_weather_service.services.met_gateway import get_locationforecast_compact, MetRateLimitExceeded
+from met_weather_service.core.config import Settings, get_settings
+from met_weather_service.services import forecast_memo, geocoder_gateway, met_gateway
+from met_weather_service.services.met_gateway import (
+    MetCacheResult,
+    MetRateLimitExceeded,
+    aget_locationforecast_compact_result,
+    check_configuration,
+    get_upstream_health,
+    peek_locationforecast_compact_result,
+)
+from met_weather_service.services.rate_limiter import PRIORITY_HEALTH
 
 logger = logging.getLogger(__name__)
 router = APIRouter(tags=["service"])
@@ -24,51 +34,171 @@ class HealthResponse(BaseModel):
 
 class HealthMetResponse(BaseModel):
     status: str = Field(..., json_schema_extra={"example": "ok"})
-    met: str = Field(..., json_schema_extra={"example": "ok"})
+    met: str = Field(
+        ...,
+        description="ok, or unknown when no MET call or cached data exists yet (passive mode).",
+        json_schema_extra={"example": "ok"},
+    )
     updated_at: str = Field(
         ...,
-        description="Value of properties.meta.updated_at from MET response.",
+        description="Value of properties.meta.updated_at from the (cached) MET response; empty if none.",
         json_schema_extra={"example": "2026-01-26T17:15:58Z"},
     )
 
 
+class ReadinessResponse(BaseModel):
+    status: str = Field(..., description="ready or degraded (upstream errors).", json_schema_extra={"example": "ready"})
+    met: str = Field(..., description="ok, degraded or unknown (no upstream calls yet).", json_schema_extra={"example": "ok"})
+    last_success_at: float | None = Field(None, description="Unix time of the last successful MET call.")
+    last_error_at: float | None = Field(None, description="Unix time of the last failed MET call.")
+    recent_calls: int = Field(..., description="MET calls within HEALTH_WINDOW_S.")
+    recent_errors: int = Field(..., description="Failed MET calls within HEALTH_WINDOW_S.")
+    error_rate: float = Field(..., json_schema_extra={"example": 0.0})
+    limiter_headroom: float | None = Field(
+        None,
+        description="Available share of the MET rate-limit bucket (null if unlimited).",
+        json_schema_extra={"example": 0.95},
+    )
+    cache_entries: int = Field(..., json_schema_extra={"example": 42})
+    cache_fill: float = Field(..., description="cache_entries / MET_CACHE_MAX_ENTRIES.", json_schema_extra={"example": 0.0042})
+
+
+class StatsResponse(BaseModel):
+    met: dict[str, Any] = Field(
+        ...,
+        description="MET cache usage, single-flight coalescing and rate-limiter counters (per priority class).",
+    )
+    geocoder: dict[str, Any] = Field(
+        ...,
+        description="Geocoder caches, proximity reuse, offline/suggest index sizes, single-flight and rate limiter.",
+    )
+    forecast_memo: dict[str, Any] = Field(..., description="Usage of the per-body daily selection memo.")
+
+
+# (body version, updated_at) of the last cached MET body read by the passive probe
+_updated_at_memo: tuple[int, str] = (0, "")
+
+
+def _updated_at(met: MetCacheResult) -> str:
+    global _updated_at_memo
+
+    version, value = _updated_at_memo
+    if version != met.version:
+        value = str(met.data.get("properties", {}).get("meta", {}).get("updated_at", ""))
+        _updated_at_memo = (met.version, value)
+    return value
+
+
+def _met_status(settings: Settings, upstream: dict[str, Any]) -> str:
+    if upstream["recent_calls"] == 0:
+        return "unknown" if upstream["last_success_at"] is None else "ok"
+    return "degraded" if upstream["error_rate"] >= settings.health_max_error_rate else "ok"
+
+
 @router.get("/health", response_model=HealthResponse, summary="Service health")
 def health() -> HealthResponse:
     settings = get_settings()
     return HealthResponse(status="ok", git_sha=settings.git_sha)
 
 
+@router.get(
+    "/health/ready",
+    response_model=ReadinessResponse,
+    summary="Readiness (passive)",
+    description=(
+            "Reports MET health from passive signals only: last successful call, recent error rate, "
+            "rate-limiter headroom and cache fill. Never calls MET. Upstream errors report "
+            "status=degraded but still 200, so an upstream outage does not take every replica out."
+    ),
+    responses={
+        503: {"description": "Service misconfiguration (e.g. MET_USER_AGENT missing)."},
+    },
+)
+def health_ready() -> ReadinessResponse:
+    settings = get_settings()
+
+    try:
+        check_configuration()
+    except RuntimeError as exc:
+        raise HTTPException(status_code=503, detail=str(exc)) from exc
+
+    upstream = get_upstream_health(settings.health_window_s)
+    met = _met_status(settings, upstream)
+
+    return ReadinessResponse(
+        status="degraded" if met == "degraded" else "ready",
+        met=met,
+        **upstream,
+    )
+
+
+@router.get(
+    "/health/stats",
+    response_model=StatsResponse,
+    summary="Cache, coalescing and rate-limit counters",
+    description="In-process counters of this worker. Reads local state only; never calls upstream.",
+)
+def health_stats() -> StatsResponse:
+    return StatsResponse(
+        met=met_gateway.get_stats(),
+        geocoder=geocoder_gateway.get_stats(),
+        forecast_memo=forecast_memo.get_stats(),
+    )
+
+
 @router.get(
     "/health/met",
     response_model=HealthMetResponse,
     summary="Upstream MET health",
-    description="Checks connectivity to MET for the default coordinates (Belgrade by default).",
+    description=(
+            "By default answers from cached data and passive signals for the default coordinates "
+            "(Belgrade by default) without calling MET. With active=true it fetches through the cache "
+            "under the low-priority health rate-limit class."
+    ),
     responses={
         500: {"description": "Service misconfiguration (e.g. MET_USER_AGENT missing)."},
-        502: {"description": "Upstream MET/network error."},
-        429: {"description": "Too many requests (service-side rate limiting to protect MET)."},
+        502: {"description": "Upstream MET/network error (active), or recent error rate too high (passive)."},
+        429: {"description": "Too many requests (active check found no spare rate-limit budget)."},
 
     },
 )
-def health_met() -> HealthMetResponse:
+async def health_met(
+        active: Annotated[
+            bool,
+            Query(description="If true, run an active check (may call MET under the health rate-limit class)."),
+        ] = False,
+) -> HealthMetResponse:
     settings = get_settings()
 
+    if not active:
+        try:
+            check_configuration()
+        except RuntimeError as exc:
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+        upstream = get_upstream_health(settings.health_window_s)
+        met_status = _met_status(settings, upstream)
+        if met_status == "degraded":
+            raise HTTPException(status_code=502, detail="MET upstream error")
+
+        cached = peek_locationforecast_compact_result(settings.default_lat, settings.default_lon)
+        return HealthMetResponse(
+            status="ok",
+            met="ok" if cached is not None else met_status,
+            updated_at=_updated_at(cached) if cached is not None else "",
+        )
+
     try:
-        data = get_locationforecast_compact(
+        met = await aget_locationforecast_compact_result(
             settings.default_lat,
             settings.default_lon,
-        )
-
-        updated_at = (
-            data.get("properties", {})
-            .get("meta", {})
-            .get("updated_at", "")
+            priority=PRIORITY_HEALTH,
         )
 
         return HealthMetResponse(
             status="ok",
             met="ok",
-            updated_at=str(updated_at),
+            updated_at=_updated_at(met),
         )
 
     except RuntimeError as exc:
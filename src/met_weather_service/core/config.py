@@ -18,6 +18,13 @@ def _get_env_int(name: str, default: int) -> int:
     return int(value) if value is not None and value.strip() else default
 
 
+def _get_env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
 @dataclass(frozen=True)
 class Settings:
     default_lat: float
@@ -26,14 +33,55 @@ class Settings:
     user_agent: str
     connect_timeout_s: float
     read_timeout_s: float
+    http_max_connections: int
+    http_max_keepalive_connections: int
+    http_keepalive_expiry_s: float
+    http_http2: bool
     met_cache_ttl_s: float
+    met_cache_min_ttl_s: float
+    met_cache_max_ttl_s: float
+    met_cache_stale_while_revalidate_s: float
+    met_cache_stale_if_error_s: float
+    met_cache_retain_s: float
+    met_cache_max_entries: int
+    met_cache_max_bytes: int
+    met_disk_cache_path: str
+    met_disk_cache_warm_max: int
     met_rl_max_calls: int
     met_rl_period_s: float
+    met_rl_max_wait_s: float
+    met_rl_max_waiters: int
+    met_rl_reserved_fraction: float
+    met_prefetch_watchlist: str
+    met_prefetch_top_n: int
+    met_prefetch_interval_s: float
+    met_prefetch_budget_fraction: float
+    forecast_memo_max_entries: int
+    forecast_batch_max_items: int
+    forecast_batch_concurrency: int
+    forecast_stream_max_items: int
+    forecast_fast_json: bool
+    forecast_place_timeout_s: float
     geocoder_base_url: str
     geocoder_user_agent: str
     geocoder_cache_ttl_s: float
+    geocoder_cache_max_entries: int
+    geocoder_cache_max_bytes: int
     geocoder_rl_max_calls: int
     geocoder_rl_period_s: float
+    geocoder_rl_max_wait_s: float
+    geocoder_rl_max_waiters: int
+    geocoder_reverse_reuse_radius_m: float
+    geocoder_offline_path: str
+    geocoder_offline_max_distance_km: float
+    geocoder_suggest_seed_path: str
+    geocoder_suggest_max_places: int
+    geocoder_suggest_max_resolved: int
+    rate_limit_backend: str
+    rate_limit_dir: str
+    cache_sweep_interval_s: float
+    health_window_s: float
+    health_max_error_rate: float
     git_sha: str
 
 
@@ -46,13 +94,54 @@ def get_settings() -> Settings:
         user_agent=_get_env("MET_USER_AGENT", ""),
         connect_timeout_s=_get_env_float("HTTP_CONNECT_TIMEOUT_S", 5.0),
         read_timeout_s=_get_env_float("HTTP_READ_TIMEOUT_S", 10.0),
+        http_max_connections=_get_env_int("HTTP_MAX_CONNECTIONS", 100),
+        http_max_keepalive_connections=_get_env_int("HTTP_MAX_KEEPALIVE_CONNECTIONS", 20),
+        http_keepalive_expiry_s=_get_env_float("HTTP_KEEPALIVE_EXPIRY_S", 30.0),
+        http_http2=_get_env_bool("HTTP_HTTP2", False),
         met_cache_ttl_s=_get_env_float("MET_CACHE_TTL_S", 300.0),
+        met_cache_min_ttl_s=_get_env_float("MET_CACHE_MIN_TTL_S", 60.0),
+        met_cache_max_ttl_s=_get_env_float("MET_CACHE_MAX_TTL_S", 3600.0),
+        met_cache_stale_while_revalidate_s=_get_env_float("MET_CACHE_STALE_WHILE_REVALIDATE_S", 0.0),
+        met_cache_stale_if_error_s=_get_env_float("MET_CACHE_STALE_IF_ERROR_S", 0.0),
+        met_cache_retain_s=_get_env_float("MET_CACHE_RETAIN_S", 3600.0),
+        met_cache_max_entries=_get_env_int("MET_CACHE_MAX_ENTRIES", 10_000),
+        met_cache_max_bytes=_get_env_int("MET_CACHE_MAX_BYTES", 256 * 1024 * 1024),
+        met_disk_cache_path=_get_env("MET_DISK_CACHE_PATH", ""),
+        met_disk_cache_warm_max=_get_env_int("MET_DISK_CACHE_WARM_MAX", 1000),
         met_rl_max_calls=int(_get_env_float("MET_RL_MAX_CALLS", 60.0)),
         met_rl_period_s=_get_env_float("MET_RL_PERIOD_S", 60.0),
+        met_rl_max_wait_s=_get_env_float("MET_RL_MAX_WAIT_S", 0.0),
+        met_rl_max_waiters=_get_env_int("MET_RL_MAX_WAITERS", 100),
+        met_rl_reserved_fraction=_get_env_float("MET_RL_RESERVED_FRACTION", 0.25),
+        met_prefetch_watchlist=_get_env("MET_PREFETCH_WATCHLIST", ""),
+        met_prefetch_top_n=_get_env_int("MET_PREFETCH_TOP_N", 0),
+        met_prefetch_interval_s=_get_env_float("MET_PREFETCH_INTERVAL_S", 15.0),
+        met_prefetch_budget_fraction=_get_env_float("MET_PREFETCH_BUDGET_FRACTION", 0.5),
+        forecast_memo_max_entries=_get_env_int("FORECAST_MEMO_MAX_ENTRIES", 10_000),
+        forecast_batch_max_items=_get_env_int("FORECAST_BATCH_MAX_ITEMS", 500),
+        forecast_batch_concurrency=_get_env_int("FORECAST_BATCH_CONCURRENCY", 16),
+        forecast_stream_max_items=_get_env_int("FORECAST_STREAM_MAX_ITEMS", 10_000),
+        forecast_fast_json=_get_env_bool("FORECAST_FAST_JSON", True),
+        forecast_place_timeout_s=_get_env_float("FORECAST_PLACE_TIMEOUT_S", 1.5),
         geocoder_base_url=_get_env("GEOCODER_BASE_URL", "https://nominatim.openstreetmap.org"),
         geocoder_user_agent=_get_env("GEOCODER_USER_AGENT", _get_env("MET_USER_AGENT", "")),
         geocoder_cache_ttl_s=_get_env_float("GEOCODER_CACHE_TTL_S", 86_400.0),
+        geocoder_cache_max_entries=_get_env_int("GEOCODER_CACHE_MAX_ENTRIES", 10_000),
+        geocoder_cache_max_bytes=_get_env_int("GEOCODER_CACHE_MAX_BYTES", 32 * 1024 * 1024),
         geocoder_rl_max_calls=_get_env_int("GEOCODER_RL_MAX_CALLS", 1),
         geocoder_rl_period_s=_get_env_float("GEOCODER_RL_PERIOD_S", 1.0),
+        geocoder_rl_max_wait_s=_get_env_float("GEOCODER_RL_MAX_WAIT_S", 3.0),
+        geocoder_rl_max_waiters=_get_env_int("GEOCODER_RL_MAX_WAITERS", 20),
+        geocoder_reverse_reuse_radius_m=_get_env_float("GEOCODER_REVERSE_REUSE_RADIUS_M", 100.0),
+        geocoder_offline_path=_get_env("GEOCODER_OFFLINE_PATH", ""),
+        geocoder_offline_max_distance_km=_get_env_float("GEOCODER_OFFLINE_MAX_DISTANCE_KM", 25.0),
+        geocoder_suggest_seed_path=_get_env("GEOCODER_SUGGEST_SEED_PATH", ""),
+        geocoder_suggest_max_places=_get_env_int("GEOCODER_SUGGEST_MAX_PLACES", 50_000),
+        geocoder_suggest_max_resolved=_get_env_int("GEOCODER_SUGGEST_MAX_RESOLVED", 10_000),
+        rate_limit_backend=_get_env("RATE_LIMIT_BACKEND", "memory").strip().lower(),
+        rate_limit_dir=_get_env("RATE_LIMIT_DIR", ""),
+        cache_sweep_interval_s=_get_env_float("CACHE_SWEEP_INTERVAL_S", 60.0),
+        health_window_s=_get_env_float("HEALTH_WINDOW_S", 300.0),
+        health_max_error_rate=_get_env_float("HEALTH_MAX_ERROR_RATE", 0.5),
         git_sha=_get_env("GIT_SHA", default="unknown"),
     )
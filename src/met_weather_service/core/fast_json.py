@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson as _orjson
+except ImportError:  # optional extra: pip install ".[fast-json]"
+    _orjson = None
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Encode plain dicts/lists/scalars to compact UTF-8 JSON bytes.
+
+    Uses orjson when installed, otherwise the stdlib encoder.
+    """
+    if _orjson is not None:
+        return _orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode()
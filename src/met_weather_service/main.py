@@ -1,20 +1,59 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
+from typing import AsyncIterator
 
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 
-from met_weather_service.api.forecast import router as forecast_router
+from met_weather_service.api.forecast import cancel_place_lookups, router as forecast_router
 from met_weather_service.api.geocoding import router as geocoding_router
 from met_weather_service.api.health import router as health_router
 from met_weather_service.api.ui import router as ui_router
+from met_weather_service.core.config import get_settings
 from met_weather_service.core.logging import configure_logging
+from met_weather_service.services.bounded_cache import run_sweeper
+from met_weather_service.services.geocoder_gateway import get_offline_geocoder, get_suggest_index
+from met_weather_service.services.http_client import aclose_http_client, close_http_client, get_http_client
+from met_weather_service.services.met_gateway import close_disk_cache, warm_cache_from_disk
+from met_weather_service.services.met_prefetch import is_enabled as prefetch_enabled, run_prefetcher
 
 configure_logging()
 
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    settings = get_settings()
+    get_http_client()
+    # file and SQLite I/O stays off the event loop
+    await asyncio.to_thread(warm_cache_from_disk)
+    await asyncio.to_thread(get_offline_geocoder)
+    await asyncio.to_thread(get_suggest_index)
+    tasks: list[asyncio.Task[None]] = []
+    if settings.cache_sweep_interval_s > 0:
+        tasks.append(asyncio.create_task(run_sweeper(settings.cache_sweep_interval_s)))
+    if prefetch_enabled(settings):
+        tasks.append(asyncio.create_task(run_prefetcher()))
+    try:
+        yield
+    finally:
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+        # shielded place lookups may outlive their request; they use the pooled async client
+        await cancel_place_lookups()
+        close_http_client()
+        await aclose_http_client()
+        close_disk_cache()
+
+
 app = FastAPI(
     title="MET Weather Service",
     version="0.1.0",
     description="Weather proxy service based on MET Norway (yr.no) API.",
+    lifespan=lifespan,
 )
 base_dir = Path(__file__).resolve().parent
 
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import heapq
+import threading
+from typing import Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+_MIN_COUNT = 1 / 64
+
+
+class AccessTracker(Generic[K]):
+    """
+    Decaying per-key access counter used to find hot cache keys.
+
+    decay() halves every count and forgets keys whose count falls below
+    _MIN_COUNT (a single access survives six decays), so counts reflect recent
+    traffic. At most max_keys keys are tracked; new keys are
+    ignored while the table is full.
+    """
+
+    def __init__(self, max_keys: int = 10_000) -> None:
+        self._lock = threading.Lock()
+        self._counts: dict[K, float] = {}
+        self._max_keys = max_keys
+
+    def record(self, key: K) -> None:
+        with self._lock:
+            count = self._counts.get(key)
+            if count is not None:
+                self._counts[key] = count + 1
+            elif len(self._counts) < self._max_keys:
+                self._counts[key] = 1.0
+
+    def top(self, n: int) -> list[K]:
+        with self._lock:
+            return heapq.nlargest(n, self._counts, key=self._counts.__getitem__)
+
+    def decay(self) -> None:
+        with self._lock:
+            self._counts = {k: c / 2 for k, c in self._counts.items() if c / 2 >= _MIN_COUNT}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._counts)
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Generic, Hashable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_registry: weakref.WeakSet[BoundedCache[Any, Any]] = weakref.WeakSet()
+
+
+def approx_size_bytes(obj: Any) -> int:
+    """
+    Approximate in-memory size of an object graph (containers, dataclasses).
+
+    Shared objects are counted once. Good enough for cache budgeting, not exact.
+    """
+    seen: set[int] = set()
+    stack = [obj]
+    total = 0
+
+    while stack:
+        o = stack.pop()
+        if id(o) in seen:
+            continue
+        seen.add(id(o))
+        total += sys.getsizeof(o)
+
+        if isinstance(o, dict):
+            stack.extend(o.keys())
+            stack.extend(o.values())
+        elif isinstance(o, (list, tuple, set, frozenset)):
+            stack.extend(o)
+        elif hasattr(o, "__dict__"):
+            stack.append(vars(o))
+
+    return total
+
+
+@dataclass
+class _Item(Generic[V]):
+    value: V
+    evict_at: float
+    size: int
+
+
+class BoundedCache(Generic[K, V]):
+    """
+    Thread-safe LRU cache bounded by entry count and an approximate byte budget.
+
+    Every item carries its own evict_at deadline; items past it are treated as
+    absent and removed by sweep(). Instances register themselves so that
+    run_sweeper() can sweep all caches in the background.
+    """
+
+    def __init__(self, name: str, *, max_entries: int = 10_000, max_bytes: int = 0) -> None:
+        self.name = name
+        self._lock = threading.Lock()
+        self._items: OrderedDict[K, _Item[V]] = OrderedDict()
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        _registry.add(self)
+
+    def configure(self, *, max_entries: int, max_bytes: int) -> None:
+        """
+        Update limits (0 means unlimited); trims immediately if they shrank.
+        """
+        with self._lock:
+            if (max_entries, max_bytes) == (self._max_entries, self._max_bytes):
+                return
+            self._max_entries = max_entries
+            self._max_bytes = max_bytes
+            self._evict_over_budget()
+
+    def get(self, key: K, now: float | None = None) -> V | None:
+        now = time.time() if now is None else now
+
+        with self._lock:
+            item = self._items.get(key)
+            if item is None or now >= item.evict_at:
+                self._misses += 1
+                return None
+
+            self._items.move_to_end(key)
+            self._hits += 1
+            return item.value
+
+    def peek(self, key: K, now: float | None = None) -> V | None:
+        """
+        Like get() but without touching LRU order or hit/miss counters.
+        """
+        now = time.time() if now is None else now
+
+        with self._lock:
+            item = self._items.get(key)
+            if item is None or now >= item.evict_at:
+                return None
+            return item.value
+
+    def set(self, key: K, value: V, *, evict_at: float, size: int | None = None) -> None:
+        size = approx_size_bytes(value) if size is None else size
+
+        with self._lock:
+            if self._max_bytes > 0 and size > self._max_bytes:
+                logger.warning("Cache %s item too large to store size=%d max_bytes=%d", self.name, size, self._max_bytes)
+                self._remove(key)
+                return
+
+            self._remove(key)
+            self._items[key] = _Item(value=value, evict_at=evict_at, size=size)
+            self._bytes += size
+            self._evict_over_budget()
+
+    def resize(self, key: K, size: int) -> None:
+        """
+        Update the recorded size of an item whose value grew in place.
+        """
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return
+            self._bytes += size - item.size
+            item.size = size
+            self._evict_over_budget()
+
+    def pop(self, key: K) -> V | None:
+        with self._lock:
+            item = self._remove(key)
+            return item.value if item is not None else None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+            self._expirations = 0
+
+    def sweep(self, now: float | None = None) -> int:
+        """
+        Remove items past their evict_at deadline. Returns number removed.
+        """
+        now = time.time() if now is None else now
+
+        with self._lock:
+            expired = [k for k, item in self._items.items() if now >= item.evict_at]
+            for k in expired:
+                self._remove(k)
+            self._expirations += len(expired)
+
+        if expired:
+            logger.debug("Cache %s swept expired=%d", self.name, len(expired))
+        return len(expired)
+
+    def keys(self) -> list[K]:
+        with self._lock:
+            return list(self._items.keys())
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._items),
+                "bytes": self._bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "max_entries": self._max_entries,
+                "max_bytes": self._max_bytes,
+            }
+
+    def _remove(self, key: K) -> _Item[V] | None:
+        item = self._items.pop(key, None)
+        if item is not None:
+            self._bytes -= item.size
+        return item
+
+    def _evict_over_budget(self) -> None:
+        while self._items and (
+                (self._max_entries > 0 and len(self._items) > self._max_entries)
+                or (self._max_bytes > 0 and self._bytes > self._max_bytes)
+        ):
+            _, item = self._items.popitem(last=False)
+            self._bytes -= item.size
+            self._evictions += 1
+
+
+def sweep_all_caches(now: float | None = None) -> int:
+    return sum(cache.sweep(now) for cache in list(_registry))
+
+
+async def run_sweeper(interval_s: float) -> None:
+    """
+    Periodically sweep expired items from all bounded caches (app lifespan task).
+
+    interval_s must be > 0; the lifespan does not start the sweeper otherwise.
+    """
+    while True:
+        await asyncio.sleep(interval_s)
+        try:
+            sweep_all_caches()
+        except Exception:
+            logger.exception("Cache sweep failed")
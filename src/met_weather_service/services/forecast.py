@@ -1,13 +1,23 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
-from datetime import datetime, time, timedelta
-from typing import Any, Iterable, Iterator
+import operator
+from array import array
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Iterable, Iterator, Sequence
 from zoneinfo import ZoneInfo
 
 logger = logging.getLogger(__name__)
 
+_SECONDS_PER_DAY = 86_400
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# Max span between two probes with equal UTC offset that is assumed to contain
+# no transition. Real-world zones never have two transitions within a day.
+_OFFSET_PROBE_SPAN_S = _SECONDS_PER_DAY
+
 
 @dataclass(frozen=True)
 class MetPoint:
@@ -22,6 +32,19 @@ class ForecastPoint:
     temperature_c: float
 
 
+@dataclass(frozen=True)
+class TargetPoint:
+    target: str  # requested HH:MM
+    time: str  # ISO8601 in selected timezone
+    temperature_c: float
+
+
+@dataclass(frozen=True)
+class DailyForecastPoints:
+    date: str  # YYYY-MM-DD in selected timezone
+    targets: tuple[TargetPoint, ...]  # one per requested target time, in request order
+
+
 def parse_met_iso_datetime(value: str) -> datetime:
     """
     Parse MET ISO datetime string into timezone-aware UTC datetime.
@@ -66,6 +89,62 @@ def iter_met_points(data: dict[str, Any]) -> Iterator[MetPoint]:
             continue
 
 
+@dataclass(frozen=True, eq=False)
+class MetSeries:
+    """
+    Columnar form of a MET timeseries, built once per upstream body.
+
+    epoch_s holds UTC timestamps (whole seconds) and temperature_c the matching
+    air temperatures, in upstream order. Malformed entries are already dropped.
+    Temperatures are kept as doubles so selected values match the JSON exactly.
+    """
+
+    epoch_s: array = field(default_factory=lambda: array("q"))
+    temperature_c: array = field(default_factory=lambda: array("d"))
+    # tz name -> local wall-clock seconds per point (the series is immutable once cached)
+    _local_s: dict[str, array] = field(default_factory=dict, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.epoch_s)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Size of the arrays, including the per-tz local timestamps computed so far.
+        """
+        return (
+                len(self.epoch_s) * self.epoch_s.itemsize
+                + len(self.temperature_c) * self.temperature_c.itemsize
+                + sum(len(local) * local.itemsize for local in list(self._local_s.values()))
+        )
+
+    def iter_points(self) -> Iterator[MetPoint]:
+        for ts, temp in zip(self.epoch_s, self.temperature_c):
+            yield MetPoint(utc_dt=datetime.fromtimestamp(ts, timezone.utc), temperature_c=temp)
+
+    def local_seconds(self, tz_name: str) -> array:
+        """
+        Local wall-clock timestamps (epoch seconds + UTC offset), computed once per tz.
+        """
+        local = self._local_s.get(tz_name)
+        if local is None:
+            offsets = utc_offsets(self.epoch_s, _zone(tz_name))
+            local = array("q", [ts + off for ts, off in zip(self.epoch_s, offsets)])
+            self._local_s[tz_name] = local
+        return local
+
+
+def parse_met_series(data: dict[str, Any]) -> MetSeries:
+    """
+    Normalize a MET Locationforecast response into a MetSeries.
+    """
+    series = MetSeries()
+    for p in iter_met_points(data):
+        series.epoch_s.append(int(p.utc_dt.timestamp()))
+        series.temperature_c.append(p.temperature_c)
+    return series
+
+
 def select_daily_temperature_near_time(
         points: Iterable[MetPoint],
         tz_name: str,
@@ -116,6 +195,185 @@ def select_daily_temperature_near_time(
     return out
 
 
+@lru_cache(maxsize=256)
+def _zone(tz_name: str) -> ZoneInfo:
+    return ZoneInfo(tz_name)
+
+
+def utc_offsets(epoch_s: Sequence[int], tz: ZoneInfo) -> list[int]:
+    """
+    UTC offset in seconds for each (ascending) UTC timestamp.
+
+    Instead of converting every point, the zone is probed at the ends of the
+    series and bisected only where offsets differ (a transition) or the span is
+    longer than _OFFSET_PROBE_SPAN_S, so a 10-day series needs ~20 lookups.
+    """
+    n = len(epoch_s)
+    offsets = [0] * n
+    if n == 0:
+        return offsets
+
+    def probe(i: int) -> int:
+        return int(datetime.fromtimestamp(epoch_s[i], tz).utcoffset().total_seconds())
+
+    if not all(map(operator.le, epoch_s, epoch_s[1:])):
+        return [probe(i) for i in range(n)]
+
+    stack = [(0, n - 1, probe(0), probe(n - 1))]
+    while stack:
+        lo, hi, off_lo, off_hi = stack.pop()
+        if off_lo == off_hi and epoch_s[hi] - epoch_s[lo] <= _OFFSET_PROBE_SPAN_S:
+            offsets[lo:hi + 1] = [off_lo] * (hi - lo + 1)
+            continue
+        if hi - lo <= 1:
+            offsets[lo] = off_lo
+            offsets[hi] = off_hi
+            continue
+        mid = (lo + hi) // 2
+        off_mid = probe(mid)
+        stack.append((lo, mid, off_lo, off_mid))
+        stack.append((mid, hi, off_mid, off_hi))
+
+    return offsets
+
+
+def _best_indices_per_day(
+        series: MetSeries,
+        tz_name: str,
+        target_times: Sequence[time],
+) -> dict[int, list[tuple[int, int]]]:
+    """
+    One pass over the series: local day -> [(delta_us, index)] per target time.
+    """
+    targets_us = [
+        (t.hour * 3600 + t.minute * 60 + t.second) * 1_000_000 + t.microsecond
+        for t in target_times
+    ]
+    n_targets = len(targets_us)
+
+    best: dict[int, list[tuple[int, int]]] = {}
+
+    for i, local in enumerate(series.local_seconds(tz_name)):
+        day, sod = divmod(local, _SECONDS_PER_DAY)
+        sod_us = sod * 1_000_000
+
+        row = best.get(day)
+        if row is None:
+            best[day] = [(abs(sod_us - t_us), i) for t_us in targets_us]
+            continue
+
+        for k in range(n_targets):
+            delta = abs(sod_us - targets_us[k])
+            if delta < row[k][0]:
+                row[k] = (delta, i)
+
+    return best
+
+
+def select_daily_temperature_from_series(
+        series: MetSeries,
+        tz_name: str,
+        target_time: time,
+) -> list[ForecastPoint]:
+    """
+    Columnar equivalent of select_daily_temperature_near_time().
+
+    Local timestamps are computed once per (series, tz), local days and
+    time-of-day come from integer arithmetic, and the argmin per day is tracked
+    in one pass. Only the selected points are turned into datetimes.
+
+    Results are identical to the point-by-point version, including DST days:
+    deltas are wall-clock differences (as with same-tzinfo datetime
+    subtraction), so a non-existent target time is matched by wall clock and,
+    for a repeated hour, the earlier point wins a tie.
+    """
+    tz = _zone(tz_name)
+    epoch_s = series.epoch_s
+    temps = series.temperature_c
+
+    target_us = (
+            (target_time.hour * 3600 + target_time.minute * 60 + target_time.second) * 1_000_000
+            + target_time.microsecond
+    )
+
+    # local day -> (delta_us, index)
+    best: dict[int, tuple[int, int]] = {}
+
+    for i, local in enumerate(series.local_seconds(tz_name)):
+        day, sod = divmod(local, _SECONDS_PER_DAY)
+        delta = abs(sod * 1_000_000 - target_us)
+
+        prev = best.get(day)
+        if prev is None or delta < prev[0]:
+            best[day] = (delta, i)
+
+    out: list[ForecastPoint] = []
+
+    for day in sorted(best.keys()):
+        i = best[day][1]
+        out.append(
+            ForecastPoint(
+                date=date.fromordinal(day + _EPOCH_ORDINAL).isoformat(),
+                time=datetime.fromtimestamp(epoch_s[i], tz).isoformat(),
+                temperature_c=temps[i],
+            )
+        )
+
+    logger.info(
+        "Selected daily forecast points: days=%d tz=%s target_time=%s",
+        len(out),
+        tz_name,
+        target_time.isoformat(timespec="minutes"),
+    )
+
+    return out
+
+
+def select_daily_temperatures_from_series(
+        series: MetSeries,
+        tz_name: str,
+        target_times: Sequence[time],
+) -> list[DailyForecastPoints]:
+    """
+    Like select_daily_temperature_from_series() for several target times at once.
+
+    All targets are matched in the same pass over the series; each target gets
+    the point select_daily_temperature_from_series() would pick for it alone.
+    """
+    tz = _zone(tz_name)
+    epoch_s = series.epoch_s
+    temps = series.temperature_c
+    labels = [t.isoformat(timespec="minutes") for t in target_times]
+
+    best = _best_indices_per_day(series, tz_name, target_times)
+
+    out: list[DailyForecastPoints] = []
+
+    for day in sorted(best.keys()):
+        out.append(
+            DailyForecastPoints(
+                date=date.fromordinal(day + _EPOCH_ORDINAL).isoformat(),
+                targets=tuple(
+                    TargetPoint(
+                        target=label,
+                        time=datetime.fromtimestamp(epoch_s[i], tz).isoformat(),
+                        temperature_c=temps[i],
+                    )
+                    for label, (_, i) in zip(labels, best[day])
+                ),
+            )
+        )
+
+    logger.info(
+        "Selected daily forecast points: days=%d tz=%s target_times=%s",
+        len(out),
+        tz_name,
+        ",".join(labels),
+    )
+
+    return out
+
+
 @dataclass(frozen=True)
 class DailyTemperatureSelector:
     tz_name: str
@@ -124,3 +382,15 @@ class DailyTemperatureSelector:
     def select_from_met_response(self, data: dict[str, Any]) -> list[ForecastPoint]:
         points = iter_met_points(data)
         return select_daily_temperature_near_time(points, self.tz_name, self.target_time)
+
+    def select_from_series(self, series: MetSeries) -> list[ForecastPoint]:
+        return select_daily_temperature_from_series(series, self.tz_name, self.target_time)
+
+
+@dataclass(frozen=True)
+class MultiTimeTemperatureSelector:
+    tz_name: str
+    target_times: tuple[time, ...]
+
+    def select_from_series(self, series: MetSeries) -> list[DailyForecastPoints]:
+        return select_daily_temperatures_from_series(series, self.tz_name, self.target_times)
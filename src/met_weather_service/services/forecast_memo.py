@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import logging
+from typing import Any, overload
+
+from met_weather_service.core.config import get_settings
+from met_weather_service.services.bounded_cache import BoundedCache
+from met_weather_service.services.forecast import (
+    DailyForecastPoints,
+    DailyTemperatureSelector,
+    ForecastPoint,
+    MultiTimeTemperatureSelector,
+)
+from met_weather_service.services.met_gateway import MetCacheResult
+
+logger = logging.getLogger(__name__)
+
+# (MET body version, selector) -> selected daily points
+_memo: BoundedCache[tuple[int, Any], tuple[Any, ...]] = BoundedCache("forecast_memo")
+
+
+def clear_memo() -> None:
+    _memo.clear()
+
+
+def get_stats() -> dict[str, int]:
+    return _memo.stats()
+
+
+@overload
+def select_daily_memoized(met: MetCacheResult, selector: DailyTemperatureSelector) -> list[ForecastPoint]: ...
+
+
+@overload
+def select_daily_memoized(met: MetCacheResult, selector: MultiTimeTemperatureSelector) -> list[DailyForecastPoints]: ...
+
+
+def select_daily_memoized(
+        met: MetCacheResult,
+        selector: DailyTemperatureSelector | MultiTimeTemperatureSelector,
+) -> list[ForecastPoint] | list[DailyForecastPoints]:
+    """
+    Select daily points from a MET result, memoized per upstream body.
+
+    The key includes the body version, which changes whenever the gateway stores
+    a new MET body, so memoized selections are invalidated automatically. A 304
+    revalidation keeps the version and therefore keeps the memo.
+    """
+    settings = get_settings()
+    _memo.configure(max_entries=int(settings.forecast_memo_max_entries), max_bytes=0)
+
+    key = (met.version, selector)
+    cached = _memo.get(key)
+    if cached is not None:
+        logger.debug("Forecast memo hit version=%s selector=%s", met.version, selector)
+        return list(cached)
+
+    days = selector.select_from_series(met.series)
+    _memo.set(
+        key,
+        tuple(days),
+        evict_at=met.expires_at + float(settings.met_cache_retain_s),
+        # bounded by entry count only; skip walking the result graph for a size
+        size=0,
+    )
+    return days
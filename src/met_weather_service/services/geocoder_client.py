@@ -7,6 +7,7 @@ from typing import Any
 import httpx
 
 from met_weather_service.core.config import get_settings
+from met_weather_service.services.http_client import use_async_http_client, use_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -34,14 +35,23 @@ def _pick_city(address: dict[str, Any]) -> str | None:
 class GeocoderClient:
     """
     Thin client for a geocoding provider (default: Nominatim).
+
+    Like MetClient, requests go through the shared pooled HTTP clients, so
+    constructing a GeocoderClient per call is cheap and connections are reused.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+            self,
+            http_client: httpx.Client | None = None,
+            async_http_client: httpx.AsyncClient | None = None,
+    ) -> None:
         settings = get_settings()
 
         if not settings.geocoder_user_agent:
             raise RuntimeError("GEOCODER_USER_AGENT is not set (required by geocoding provider policies).")
 
+        self._http_client = http_client
+        self._async_http_client = async_http_client
         self._base_url = settings.geocoder_base_url.rstrip("/")
         self._timeout = httpx.Timeout(
             settings.read_timeout_s,
@@ -53,7 +63,7 @@ class GeocoderClient:
             "Accept-Encoding": "gzip, deflate",
         }
 
-    def forward(self, query: str, *, limit: int = 5) -> list[GeoPlace]:
+    def _forward_params(self, query: str, limit: int) -> tuple[str, dict[str, str]]:
         url = f"{self._base_url}/search"
         params = {
             "q": query,
@@ -63,10 +73,10 @@ class GeocoderClient:
         }
 
         logger.info("Geocoder forward request: %s params=%s", url, params)
+        return url, params
 
-        with httpx.Client(headers=self._headers, timeout=self._timeout, follow_redirects=True) as client:
-            resp = client.get(url, params=params)
-
+    @staticmethod
+    def _parse_forward(resp: httpx.Response) -> list[GeoPlace]:
         logger.info("Geocoder forward response: status=%s", resp.status_code)
         resp.raise_for_status()
 
@@ -108,7 +118,23 @@ class GeocoderClient:
 
         return out
 
-    def reverse(self, lat: float, lon: float) -> GeoPlace | None:
+    def forward(self, query: str, *, limit: int = 5) -> list[GeoPlace]:
+        url, params = self._forward_params(query, limit)
+
+        with use_http_client(self._http_client) as client:
+            resp = client.get(url, params=params, headers=self._headers, timeout=self._timeout)
+
+        return self._parse_forward(resp)
+
+    async def aforward(self, query: str, *, limit: int = 5) -> list[GeoPlace]:
+        url, params = self._forward_params(query, limit)
+
+        async with use_async_http_client(self._async_http_client) as client:
+            resp = await client.get(url, params=params, headers=self._headers, timeout=self._timeout)
+
+        return self._parse_forward(resp)
+
+    def _reverse_params(self, lat: float, lon: float) -> tuple[str, dict[str, str]]:
         url = f"{self._base_url}/reverse"
         params = {
             "lat": str(lat),
@@ -118,10 +144,10 @@ class GeocoderClient:
         }
 
         logger.info("Geocoder reverse request: %s params=%s", url, params)
+        return url, params
 
-        with httpx.Client(headers=self._headers, timeout=self._timeout, follow_redirects=True) as client:
-            resp = client.get(url, params=params)
-
+    @staticmethod
+    def _parse_reverse(resp: httpx.Response, lat: float, lon: float) -> GeoPlace | None:
         logger.info("Geocoder reverse response: status=%s", resp.status_code)
         resp.raise_for_status()
 
@@ -156,3 +182,19 @@ class GeocoderClient:
             state=state,
             raw=payload,
         )
+
+    def reverse(self, lat: float, lon: float) -> GeoPlace | None:
+        url, params = self._reverse_params(lat, lon)
+
+        with use_http_client(self._http_client) as client:
+            resp = client.get(url, params=params, headers=self._headers, timeout=self._timeout)
+
+        return self._parse_reverse(resp, lat, lon)
+
+    async def areverse(self, lat: float, lon: float) -> GeoPlace | None:
+        url, params = self._reverse_params(lat, lon)
+
+        async with use_async_http_client(self._async_http_client) as client:
+            resp = await client.get(url, params=params, headers=self._headers, timeout=self._timeout)
+
+        return self._parse_reverse(resp, lat, lon)
@@ -3,13 +3,26 @@ from __future__ import annotations
 import logging
 import threading
 import time
+from pathlib import Path
+from typing import Any
 
 import httpx
 
-from met_weather_service.core.config import get_settings
+from met_weather_service.core.config import Settings, get_settings
+from met_weather_service.services.bounded_cache import BoundedCache
 from met_weather_service.services.geocoder_client import GeocoderClient, GeoPlace
 from met_weather_service.services.met_client import truncate_coord
-from met_weather_service.services.rate_limiter import SlidingWindowRateLimiter
+from met_weather_service.services.offline_geocoder import (
+    BUNDLED_GAZETTEER,
+    OfflineGeocoder,
+    load_gazetteer,
+    parse_gazetteer_line,
+)
+from met_weather_service.services.place_suggest import PlaceSuggestIndex
+from met_weather_service.services.proximity_index import ProximityIndex
+from met_weather_service.services.rate_limiter import TokenBucketRateLimiter, create_rate_limiter
+from met_weather_service.services.single_flight import SingleFlight
+from met_weather_service.services.sync_bridge import run_sync
 
 logger = logging.getLogger(__name__)
 
@@ -19,99 +32,366 @@ class GeocoderRateLimitExceeded(Exception):
 
 
 _cache_lock = threading.Lock()
-_forward_cache: dict[tuple[str, int], tuple[float, list[GeoPlace]]] = {}
-_reverse_cache: dict[tuple[float, float], tuple[float, GeoPlace | None]] = {}
+_forward_cache: BoundedCache[tuple[str, int], tuple[float, list[GeoPlace]]] = BoundedCache("geocoder_forward")
+_reverse_cache: BoundedCache[tuple[float, float], tuple[float, GeoPlace | None]] = BoundedCache("geocoder_reverse")
 
-_limiter: SlidingWindowRateLimiter | None = None
-_limiter_cfg: tuple[int, float] | None = None
+# Keys of _reverse_cache indexed by location, for reuse of nearby results.
+_proximity: ProximityIndex | None = None
+_proximity_hits = 0
+
+_limiter: TokenBucketRateLimiter | None = None
+_limiter_cfg: tuple[int, float, int, str, str] | None = None
+
+# Concurrent identical upstream lookups share one call
+_forward_flight: SingleFlight[list[GeoPlace]] = SingleFlight()
+_reverse_flight: SingleFlight[GeoPlace | None] = SingleFlight()
+
+# Autocomplete over places seen in forward results plus an optional seed gazetteer.
+_suggest = PlaceSuggestIndex()
+_suggest_seed_cfg: str | None = None
+
+_offline_lock = threading.Lock()
+_offline: OfflineGeocoder | None = None
+_offline_cfg: str | None = None
 
 
 def clear_cache() -> None:
     with _cache_lock:
         _forward_cache.clear()
         _reverse_cache.clear()
-        global _limiter, _limiter_cfg
+        global _limiter, _limiter_cfg, _proximity, _proximity_hits, _suggest_seed_cfg
+        _proximity = None
+        _proximity_hits = 0
+        _suggest.clear()
+        _suggest_seed_cfg = None
         _limiter = None
         _limiter_cfg = None
+    _forward_flight.reset_stats()
+    _reverse_flight.reset_stats()
 
 
-def _ensure_limiter() -> tuple[int, float]:
-    settings = get_settings()
+def get_stats() -> dict[str, dict[str, Any]]:
+    offline = _offline
+    proximity = _proximity
+    with _cache_lock:
+        proximity_hits = _proximity_hits
+    return {
+        "forward_cache": _forward_cache.stats(),
+        "reverse_cache": _reverse_cache.stats(),
+        "reverse_proximity": {
+            "points": len(proximity) if proximity is not None else 0,
+            "hits": proximity_hits,
+        },
+        "offline_index": {"places": len(offline) if offline is not None else 0},
+        "suggest_index": {"places": len(_suggest)},
+        "forward_flight": _forward_flight.stats(),
+        "reverse_flight": _reverse_flight.stats(),
+        "rate_limiter": _limiter.stats() if _limiter is not None else {},
+    }
+
+
+def get_offline_geocoder() -> OfflineGeocoder | None:
+    """
+    Return the offline reverse geocoder for GEOCODER_OFFLINE_PATH, or None if disabled.
+
+    "bundled" selects the small gazetteer shipped with the package. The index is
+    built once per path; a file that fails to load disables it until the path changes.
+    """
+    global _offline, _offline_cfg
+
+    path = get_settings().geocoder_offline_path.strip()
+    if not path:
+        return None
+
+    with _offline_lock:
+        if _offline_cfg == path:
+            return _offline
+
+        source = _resolve_gazetteer_path(path)
+        try:
+            _offline = load_gazetteer(source)
+        except (OSError, UnicodeDecodeError):
+            logger.exception("Offline gazetteer load failed path=%s", source)
+            _offline = None
+        _offline_cfg = path
+        return _offline
+
+
+def _resolve_gazetteer_path(path: str) -> Path:
+    return BUNDLED_GAZETTEER if path.lower() == "bundled" else Path(path)
+
+
+def get_suggest_index(settings: Settings | None = None) -> PlaceSuggestIndex:
+    """
+    Apply suggest index limits and load GEOCODER_SUGGEST_SEED_PATH once per path.
+    """
+    global _suggest_seed_cfg
+
+    settings = settings or get_settings()
+
+    _suggest.configure(
+        max_places=int(settings.geocoder_suggest_max_places),
+        max_resolved=int(settings.geocoder_suggest_max_resolved),
+    )
+
+    path = settings.geocoder_suggest_seed_path.strip()
+    with _cache_lock:
+        if _suggest_seed_cfg == path:
+            return _suggest
+        _suggest_seed_cfg = path
+
+        if path:
+            source = _resolve_gazetteer_path(path)
+            try:
+                with open(source, encoding="utf-8") as f:
+                    _suggest.add_gazetteer(e for e in map(parse_gazetteer_line, f) if e is not None)
+            except (OSError, UnicodeDecodeError):
+                logger.exception("Suggest seed gazetteer load failed path=%s", source)
+            else:
+                logger.info("Suggest index seeded path=%s places=%d", source, len(_suggest))
+
+    return _suggest
+
+
+def suggest_places(prefix: str, *, limit: int = 5) -> list[GeoPlace]:
+    """
+    Autocomplete from the local prefix index only (never calls upstream).
+    """
+    return get_suggest_index(get_settings()).suggest(prefix, limit=limit)
+
+
+def _offline_reverse(lat: float, lon: float) -> GeoPlace | None:
+    offline = get_offline_geocoder()
+    if offline is None:
+        return None
+
+    found = offline.nearest(lat, lon, max_distance_km=float(get_settings().geocoder_offline_max_distance_km))
+    if found is None:
+        return None
+
+    place, distance_km = found
+    logger.info("Geocoder reverse offline hit lat=%s lon=%s place=%s distance_km=%.1f", lat, lon, place.city, distance_km)
+    return place
+
+
+def _configure_caches(settings: Settings) -> None:
+    for cache in (_forward_cache, _reverse_cache):
+        cache.configure(
+            max_entries=int(settings.geocoder_cache_max_entries),
+            max_bytes=int(settings.geocoder_cache_max_bytes),
+        )
+
+
+def _get_limiter(settings: Settings) -> TokenBucketRateLimiter | None:
+    global _limiter, _limiter_cfg
+
     max_calls = int(settings.geocoder_rl_max_calls)
     period_s = float(settings.geocoder_rl_period_s)
+    max_waiters = int(settings.geocoder_rl_max_waiters)
 
-    global _limiter, _limiter_cfg
-    cfg = (max_calls, period_s)
+    cfg = (max_calls, period_s, max_waiters, settings.rate_limit_backend, settings.rate_limit_dir)
     if _limiter is None or _limiter_cfg != cfg:
         if max_calls > 0 and period_s > 0:
-            _limiter = SlidingWindowRateLimiter(max_calls=max_calls, period_s=period_s)
-            _limiter_cfg = cfg
+            _limiter = create_rate_limiter(
+                "geocoder",
+                max_calls,
+                period_s,
+                max_waiters=max_waiters,
+                backend=settings.rate_limit_backend,
+                directory=settings.rate_limit_dir,
+            )
         else:
             _limiter = None
-            _limiter_cfg = cfg
+        _limiter_cfg = cfg
 
-    return max_calls, period_s
+    return _limiter
 
 
-def _check_rate_limit() -> None:
-    max_calls, period_s = _ensure_limiter()
-    if _limiter is not None and not _limiter.allow():
-        logger.warning("Geocoder rate limit exceeded max_calls=%s period_s=%s", max_calls, period_s)
-        raise GeocoderRateLimitExceeded("Geocoder rate limit exceeded")
+def _rate_limit_exceeded(settings: Settings) -> GeocoderRateLimitExceeded:
+    logger.warning(
+        "Geocoder rate limit exceeded max_calls=%s period_s=%s max_wait_s=%s",
+        settings.geocoder_rl_max_calls,
+        settings.geocoder_rl_period_s,
+        settings.geocoder_rl_max_wait_s,
+    )
+    return GeocoderRateLimitExceeded("Geocoder rate limit exceeded")
 
 
-def forward_geocode(query: str, *, limit: int = 5) -> list[GeoPlace]:
-    settings = get_settings()
-    ttl_s = float(settings.geocoder_cache_ttl_s)
+async def _acheck_rate_limit(settings: Settings) -> None:
+    """
+    Take an upstream call slot, queueing up to GEOCODER_RL_MAX_WAIT_S.
+    """
+    limiter = _get_limiter(settings)
+    if limiter is not None and not await limiter.aacquire(float(settings.geocoder_rl_max_wait_s)):
+        raise _rate_limit_exceeded(settings)
+
+
+def _forward_lookup(settings: Settings, query: str, limit: int) -> tuple[tuple[str, int], list[GeoPlace] | None]:
+    """
+    Return (key, cached places or None) for the forward cache.
+    """
+    _configure_caches(settings)
 
     q_norm = " ".join(query.strip().split()).lower()
     key = (q_norm, int(limit))
-    now = time.time()
 
-    with _cache_lock:
-        cached = _forward_cache.get(key)
-        if cached and now < cached[0]:
-            logger.info("Geocoder forward cache hit key=%s", key)
-            return cached[1]
+    cached = _forward_cache.get(key)
+    if cached:
+        logger.info("Geocoder forward cache hit key=%s", key)
+        return key, cached[1]
+
+    return key, None
+
 
-    _check_rate_limit()
+def _forward_store(settings: Settings, key: tuple[str, int], places: list[GeoPlace]) -> None:
+    expires_at = time.time() + float(settings.geocoder_cache_ttl_s)
+    _forward_cache.set(key, (expires_at, places), evict_at=expires_at)
+
+
+async def _aforward_fetch(settings: Settings, key: tuple[str, int], query: str) -> list[GeoPlace]:
+    # a previous leader may have stored it while this call queued for the flight
+    cached = _forward_cache.peek(key)
+    if cached:
+        return cached[1]
+
+    await _acheck_rate_limit(settings)
 
     try:
-        places = GeocoderClient().forward(query, limit=limit)
+        places = await GeocoderClient().aforward(query, limit=key[1])
     except (httpx.HTTPError, ValueError):
-        logger.exception("Geocoder forward upstream failure q=%s", q_norm)
+        logger.exception("Geocoder forward upstream failure q=%s", key[0])
         raise
 
-    with _cache_lock:
-        _forward_cache[key] = (now + ttl_s, places)
+    _forward_store(settings, key, places)
+    return places
+
+
+async def aforward_geocode(query: str, *, limit: int = 5) -> list[GeoPlace]:
+    """
+    Forward-geocode through the shared cache, single-flight and rate limiter.
+    """
+    settings = get_settings()
+    suggest = get_suggest_index(settings)
+
+    key, places = _forward_lookup(settings, query, limit)
+    if places is None:
+        places = await _forward_flight.ado(key, lambda: _aforward_fetch(settings, key, query))
 
+    suggest.add_many(places)
     return places
 
 
-def reverse_geocode(lat: float, lon: float) -> GeoPlace | None:
+def forward_geocode(query: str, *, limit: int = 5) -> list[GeoPlace]:
+    """
+    Blocking wrapper around aforward_geocode() for tests and scripts.
+    """
+    return run_sync(aforward_geocode(query, limit=limit))
+
+
+def _get_proximity(settings: Settings) -> ProximityIndex | None:
+    """
+    Return the proximity index for GEOCODER_REVERSE_REUSE_RADIUS_M (None if disabled).
+
+    Rebuilt from the reverse cache keys when the radius changes.
+    """
+    global _proximity
+
+    radius_m = float(settings.geocoder_reverse_reuse_radius_m)
+    with _cache_lock:
+        if radius_m <= 0:
+            _proximity = None
+        elif _proximity is None or _proximity.radius_m != radius_m:
+            _proximity = ProximityIndex(radius_m)
+            _proximity.rebuild(_reverse_cache.keys())
+        return _proximity
+
+
+def _reverse_lookup(lat: float, lon: float) -> tuple[tuple[float, float], bool, GeoPlace | None]:
+    """
+    Return (key, hit, place) for the reverse cache.
+
+    Besides the exact truncated key, a place stored for any point within
+    GEOCODER_REVERSE_REUSE_RADIUS_M counts as a hit. A cached "no place" answer
+    is only reused for its own key: a neighbour may still resolve.
+    """
+    global _proximity_hits
+
     settings = get_settings()
-    ttl_s = float(settings.geocoder_cache_ttl_s)
+    _configure_caches(settings)
 
-    lat_t = truncate_coord(lat)
-    lon_t = truncate_coord(lon)
-    key = (lat_t, lon_t)
+    key = (truncate_coord(lat), truncate_coord(lon))
     now = time.time()
 
-    with _cache_lock:
-        cached = _reverse_cache.get(key)
-        if cached and now < cached[0]:
-            logger.info("Geocoder reverse cache hit key=%s", key)
-            return cached[1]
+    cached = _reverse_cache.get(key, now)
+    if cached:
+        logger.info("Geocoder reverse cache hit key=%s", key)
+        return key, True, cached[1]
+
+    index = _get_proximity(settings)
+    if index is not None:
+        for distance_m, point in index.within(lat, lon):
+            cached = _reverse_cache.get(point, now)
+            if not cached:
+                # evicted or expired from the cache since it was indexed
+                index.discard(point)
+            elif cached[1] is not None:
+                with _cache_lock:
+                    _proximity_hits += 1
+                logger.info("Geocoder reverse proximity hit key=%s near=%s distance_m=%.0f", key, point, distance_m)
+                return key, True, cached[1]
 
-    _check_rate_limit()
+    return key, False, None
 
+
+def _reverse_store(key: tuple[float, float], place: GeoPlace | None) -> None:
+    settings = get_settings()
+    expires_at = time.time() + float(settings.geocoder_cache_ttl_s)
+    _reverse_cache.set(key, (expires_at, place), evict_at=expires_at)
+
+    index = _get_proximity(settings)
+    if index is not None and place is not None:
+        index.add(key)
+        # LRU evictions are not reported to the index; drop stale points in bulk
+        if len(index) > 2 * len(_reverse_cache) + 1024:
+            index.rebuild(_reverse_cache.keys())
+
+
+async def _areverse_fetch(settings: Settings, key: tuple[float, float]) -> GeoPlace | None:
+    cached = _reverse_cache.peek(key)
+    if cached:
+        return cached[1]
+
+    await _acheck_rate_limit(settings)
+
+    lat_t, lon_t = key
     try:
-        place = GeocoderClient().reverse(lat_t, lon_t)
+        place = await GeocoderClient().areverse(lat_t, lon_t)
     except (httpx.HTTPError, ValueError):
         logger.exception("Geocoder reverse upstream failure lat=%s lon=%s", lat_t, lon_t)
         raise
 
-    with _cache_lock:
-        _reverse_cache[key] = (now + ttl_s, place)
-
+    _reverse_store(key, place)
     return place
+
+
+async def areverse_geocode(lat: float, lon: float) -> GeoPlace | None:
+    """
+    Reverse-geocode from the cache, the offline index, or upstream (single-flight, rate limited).
+    """
+    key, hit, place = _reverse_lookup(lat, lon)
+    if hit:
+        return place
+
+    place = _offline_reverse(lat, lon)
+    if place is not None:
+        return place
+
+    settings = get_settings()
+    return await _reverse_flight.ado(key, lambda: _areverse_fetch(settings, key))
+
+
+def reverse_geocode(lat: float, lon: float) -> GeoPlace | None:
+    """
+    Blocking wrapper around areverse_geocode() for tests and scripts.
+    """
+    return run_sync(areverse_geocode(lat, lon))
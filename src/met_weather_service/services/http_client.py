@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import importlib.util
+import logging
+import threading
+import weakref
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+from met_weather_service.core.config import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(eq=False)
+class _PooledClient:
+    """
+    A pooled client plus the number of calls currently using it.
+
+    A retired client (replaced after a config change or shut down) is closed
+    by whoever brings `users` down to zero.
+    """
+
+    client: Any
+    cfg: tuple[int, int, float, bool, float, float]
+    users: int = 0
+    retired: bool = False
+
+
+_client_lock = threading.Lock()
+_client: _PooledClient | None = None
+# AsyncClient pools are bound to the loop that created them, so there is one per loop
+_async_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _PooledClient] = weakref.WeakKeyDictionary()
+
+
+@functools.cache
+def _h2_available() -> bool:
+    if importlib.util.find_spec("h2") is None:
+        logger.warning("HTTP_HTTP2 is enabled but the 'h2' package is not installed, falling back to HTTP/1.1")
+        return False
+    return True
+
+
+def _client_config(settings: Settings) -> tuple[int, int, float, bool, float, float]:
+    return (
+        int(settings.http_max_connections),
+        int(settings.http_max_keepalive_connections),
+        float(settings.http_keepalive_expiry_s),
+        bool(settings.http_http2) and _h2_available(),
+        float(settings.connect_timeout_s),
+        float(settings.read_timeout_s),
+    )
+
+
+def _client_kwargs(cfg: tuple[int, int, float, bool, float, float]) -> dict[str, Any]:
+    max_connections, max_keepalive, keepalive_expiry_s, http2, connect_timeout_s, read_timeout_s = cfg
+
+    logger.info(
+        "Upstream HTTP client created max_connections=%s max_keepalive=%s keepalive_expiry_s=%s http2=%s",
+        max_connections,
+        max_keepalive,
+        keepalive_expiry_s,
+        http2,
+    )
+
+    return {
+        "limits": httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=keepalive_expiry_s,
+        ),
+        "timeout": httpx.Timeout(read_timeout_s, connect=connect_timeout_s),
+        "http2": http2,
+        "follow_redirects": True,
+    }
+
+
+def _current_locked(
+        pooled: _PooledClient | None,
+        cfg: tuple[int, int, float, bool, float, float],
+        factory: type,
+) -> tuple[_PooledClient, _PooledClient | None]:
+    """
+    Return the pooled client for cfg, building it if pooled is missing or stale.
+
+    The second item is a replaced client nobody is using any more; the caller
+    closes it outside the lock.
+    """
+    if pooled is not None and pooled.cfg == cfg:
+        return pooled, None
+
+    idle = None
+    if pooled is not None:
+        pooled.retired = True
+        if pooled.users == 0:
+            idle = pooled
+
+    return _PooledClient(factory(**_client_kwargs(cfg)), cfg), idle
+
+
+def _release(pooled: _PooledClient) -> bool:
+    """
+    Drop one user; True if the caller must now close the retired client.
+    """
+    with _client_lock:
+        pooled.users -= 1
+        return pooled.retired and pooled.users == 0
+
+
+def _checkout_sync(*, lease: bool) -> _PooledClient:
+    global _client
+
+    cfg = _client_config(get_settings())
+
+    with _client_lock:
+        pooled, idle = _current_locked(_client, cfg, httpx.Client)
+        _client = pooled
+        if lease:
+            pooled.users += 1
+
+    if idle is not None:
+        idle.client.close()
+
+    return pooled
+
+
+async def _checkout_async(*, lease: bool) -> _PooledClient:
+    cfg = _client_config(get_settings())
+    loop = asyncio.get_running_loop()
+
+    with _client_lock:
+        pooled, idle = _current_locked(_async_clients.get(loop), cfg, httpx.AsyncClient)
+        _async_clients[loop] = pooled
+        if lease:
+            pooled.users += 1
+
+    if idle is not None:
+        await idle.client.aclose()
+
+    return pooled
+
+
+@contextmanager
+def use_http_client(client: httpx.Client | None = None) -> Iterator[httpx.Client]:
+    """
+    Lease the process-wide pooled HTTP client for one upstream call.
+
+    The client is created lazily and rebuilt if pool settings change; a
+    replaced client stays open until the last call leasing it finishes, then
+    it is closed. Connections are kept alive between calls, so cache misses
+    do not pay a new TCP/TLS handshake each time. An explicit client (tests,
+    scripts) is passed through untouched.
+    """
+    if client is not None:
+        yield client
+        return
+
+    pooled = _checkout_sync(lease=True)
+    try:
+        yield pooled.client
+    finally:
+        if _release(pooled):
+            pooled.client.close()
+
+
+@asynccontextmanager
+async def use_async_http_client(client: httpx.AsyncClient | None = None) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Async counterpart of use_http_client().
+
+    Must be used from a running event loop. Each loop gets its own pool, since
+    an AsyncClient cannot be shared across loops.
+    """
+    if client is not None:
+        yield client
+        return
+
+    pooled = await _checkout_async(lease=True)
+    try:
+        yield pooled.client
+    finally:
+        if _release(pooled):
+            await pooled.client.aclose()
+
+
+def get_http_client() -> httpx.Client:
+    """
+    Return the current pooled HTTP client (e.g. to warm it up on startup).
+
+    Upstream calls should use use_http_client() so a config change cannot
+    close the client under them.
+    """
+    return _checkout_sync(lease=False).client
+
+
+async def get_async_http_client() -> httpx.AsyncClient:
+    """
+    Return the current pooled async HTTP client of the running loop.
+    """
+    return (await _checkout_async(lease=False)).client
+
+
+def close_http_client() -> None:
+    """
+    Close the pooled HTTP client (called on application shutdown).
+
+    Calls still using it finish first; the last one closes it.
+    """
+    global _client
+
+    with _client_lock:
+        pooled = _client
+        _client = None
+        if pooled is None:
+            return
+        pooled.retired = True
+        idle = pooled.users == 0
+
+    if idle:
+        pooled.client.close()
+        logger.info("Upstream HTTP client closed")
+
+
+async def aclose_http_client() -> None:
+    """
+    Close the running loop's pooled async HTTP client (called on application shutdown).
+    """
+    with _client_lock:
+        pooled = _async_clients.pop(asyncio.get_running_loop(), None)
+        if pooled is None:
+            return
+        pooled.retired = True
+        idle = pooled.users == 0
+
+    if idle:
+        await pooled.client.aclose()
+        logger.info("Upstream async HTTP client closed")
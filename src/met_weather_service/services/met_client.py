@@ -8,6 +8,7 @@ from typing import Any
 import httpx
 
 from met_weather_service.core.config import get_settings
+from met_weather_service.services.http_client import use_async_http_client, use_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +18,9 @@ class MetResponse:
     status_code: int
     data: dict[str, Any] | None
     last_modified: str | None
+    expires: str | None = None
+    date: str | None = None
+    content: bytes | None = None
 
 
 def truncate_coord(value: float) -> float:
@@ -27,12 +31,25 @@ def truncate_coord(value: float) -> float:
 
 
 class MetClient:
-    def __init__(self) -> None:
+    """
+    Thin client for MET Locationforecast.
+
+    Requests go through the shared pooled HTTP client, so constructing
+    a MetClient per call is cheap and connections are reused.
+    """
+
+    def __init__(
+            self,
+            http_client: httpx.Client | None = None,
+            async_http_client: httpx.AsyncClient | None = None,
+    ) -> None:
         settings = get_settings()
 
         if not settings.user_agent:
             raise RuntimeError("MET_USER_AGENT is not set (required by MET Norway ToS).")
 
+        self._http_client = http_client
+        self._async_http_client = async_http_client
         self._base_url = settings.met_base_url
         self._timeout = httpx.Timeout(
             settings.read_timeout_s,
@@ -44,13 +61,12 @@ class MetClient:
             "Accept-Encoding": "gzip, deflate",
         }
 
-    def fetch_locationforecast_compact(
+    def _build_request(
             self,
             lat: float,
             lon: float,
-            *,
-            if_modified_since: str | None = None,
-    ) -> MetResponse:
+            if_modified_since: str | None,
+    ) -> tuple[str, dict[str, float], dict[str, str]]:
         lat = truncate_coord(lat)
         lon = truncate_coord(lon)
 
@@ -68,13 +84,10 @@ class MetClient:
             if_modified_since,
         )
 
-        with httpx.Client(
-                headers=headers,
-                timeout=self._timeout,
-                follow_redirects=True,
-        ) as client:
-            resp = client.get(url, params=params)
+        return url, params, headers
 
+    @staticmethod
+    def _parse_response(resp: httpx.Response) -> MetResponse:
         logger.info("MET response: status=%s", resp.status_code)
 
         if resp.status_code == 203:
@@ -86,6 +99,8 @@ class MetClient:
                 status_code=304,
                 data=None,
                 last_modified=resp.headers.get("Last-Modified"),
+                expires=resp.headers.get("Expires"),
+                date=resp.headers.get("Date"),
             )
 
         resp.raise_for_status()
@@ -95,4 +110,38 @@ class MetClient:
             status_code=resp.status_code,
             data=payload,
             last_modified=resp.headers.get("Last-Modified"),
+            expires=resp.headers.get("Expires"),
+            date=resp.headers.get("Date"),
+            content=resp.content,
         )
+
+    def fetch_locationforecast_compact(
+            self,
+            lat: float,
+            lon: float,
+            *,
+            if_modified_since: str | None = None,
+    ) -> MetResponse:
+        url, params, headers = self._build_request(lat, lon, if_modified_since)
+
+        with use_http_client(self._http_client) as client:
+            resp = client.get(url, params=params, headers=headers, timeout=self._timeout)
+
+        return self._parse_response(resp)
+
+    async def afetch_locationforecast_compact(
+            self,
+            lat: float,
+            lon: float,
+            *,
+            if_modified_since: str | None = None,
+    ) -> MetResponse:
+        """
+        Async variant of fetch_locationforecast_compact() on the pooled AsyncClient.
+        """
+        url, params, headers = self._build_request(lat, lon, if_modified_since)
+
+        async with use_async_http_client(self._async_http_client) as client:
+            resp = await client.get(url, params=params, headers=headers, timeout=self._timeout)
+
+        return self._parse_response(resp)
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS met_locationforecast (
+    lat REAL NOT NULL,
+    lon REAL NOT NULL,
+    content BLOB NOT NULL,
+    last_modified TEXT,
+    expires_at REAL NOT NULL,
+    stored_at REAL NOT NULL,
+    PRIMARY KEY (lat, lon)
+)
+"""
+
+
+@dataclass(frozen=True)
+class DiskCacheRecord:
+    lat: float
+    lon: float
+    content: bytes
+    last_modified: str | None
+    expires_at: float
+    stored_at: float
+
+
+class MetDiskCache:
+    """
+    Persistent MET response store (SQLite, WAL mode).
+
+    Holds raw MET bytes plus Last-Modified/expiry per truncated (lat, lon).
+    Several worker processes on a host can open the same file: WAL lets readers
+    proceed while one process writes. The store is best-effort; SQLite errors
+    are logged and treated as misses.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=5.0, check_same_thread=False, isolation_level=None)
+        try:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(_SCHEMA)
+        except sqlite3.Error:
+            self._conn.close()
+            raise
+
+    def get(self, key: tuple[float, float]) -> DiskCacheRecord | None:
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT lat, lon, content, last_modified, expires_at, stored_at "
+                    "FROM met_locationforecast WHERE lat = ? AND lon = ?",
+                    key,
+                ).fetchone()
+        except sqlite3.Error:
+            logger.warning("MET disk cache read failed key=%s", key, exc_info=True)
+            return None
+
+        return DiskCacheRecord(*row) if row else None
+
+    def put(self, key: tuple[float, float], content: bytes, last_modified: str | None, expires_at: float, now: float) -> None:
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO met_locationforecast "
+                    "(lat, lon, content, last_modified, expires_at, stored_at) VALUES (?, ?, ?, ?, ?, ?)",
+                    (key[0], key[1], content, last_modified, expires_at, now),
+                )
+        except sqlite3.Error:
+            logger.warning("MET disk cache write failed key=%s", key, exc_info=True)
+
+    def touch(self, key: tuple[float, float], last_modified: str | None, expires_at: float, now: float) -> None:
+        """
+        Update metadata after a 304 revalidation (body unchanged).
+        """
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "UPDATE met_locationforecast SET last_modified = ?, expires_at = ?, stored_at = ? "
+                    "WHERE lat = ? AND lon = ?",
+                    (last_modified, expires_at, now, key[0], key[1]),
+                )
+        except sqlite3.Error:
+            logger.warning("MET disk cache update failed key=%s", key, exc_info=True)
+
+    def recent(self, limit: int, *, not_before: float) -> list[DiskCacheRecord]:
+        """
+        Most recently stored records whose expiry is not older than not_before.
+        """
+        try:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT lat, lon, content, last_modified, expires_at, stored_at "
+                    "FROM met_locationforecast WHERE expires_at >= ? ORDER BY stored_at DESC LIMIT ?",
+                    (not_before, limit),
+                ).fetchall()
+        except sqlite3.Error:
+            logger.warning("MET disk cache scan failed", exc_info=True)
+            return []
+
+        return [DiskCacheRecord(*row) for row in rows]
+
+    def prune(self, *, expired_before: float) -> int:
+        try:
+            with self._lock:
+                cur = self._conn.execute(
+                    "DELETE FROM met_locationforecast WHERE expires_at < ?",
+                    (expired_before,),
+                )
+        except sqlite3.Error:
+            logger.warning("MET disk cache prune failed", exc_info=True)
+            return 0
+
+        return cur.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -1,18 +1,41 @@
 from __future__ import annotations
 
+import asyncio
+import itertools
+import json
 import logging
+import sqlite3
 import threading
 import time
 from dataclasses import dataclass
-from typing import Any
-
-from met_weather_service.core.config import get_settings
-from met_weather_service.services.met_client import MetClient, truncate_coord
-from met_weather_service.services.rate_limiter import SlidingWindowRateLimiter
+from functools import cached_property
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Iterable
+
+import httpx
+
+from met_weather_service.core.config import Settings, get_settings
+from met_weather_service.services.access_tracker import AccessTracker
+from met_weather_service.services.bounded_cache import BoundedCache
+from met_weather_service.services.forecast import MetSeries, parse_met_series
+from met_weather_service.services.met_client import MetClient, MetResponse, truncate_coord
+from met_weather_service.services.met_disk_cache import DiskCacheRecord, MetDiskCache
+from met_weather_service.services.rate_limiter import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    TokenBucketRateLimiter,
+    create_rate_limiter,
+)
+from met_weather_service.services.single_flight import SingleFlight
+from met_weather_service.services.sync_bridge import run_sync
+from met_weather_service.services.upstream_health import UpstreamHealth
 
 
 class MetRateLimitExceeded(Exception):
-    pass
+    def __init__(self, message: str, *, priority: str = PRIORITY_INTERACTIVE) -> None:
+        super().__init__(message)
+        # rate-limit class of the call that was rejected
+        self.priority = priority
 
 
 logger = logging.getLogger(__name__)
@@ -20,111 +43,711 @@ logger = logging.getLogger(__name__)
 
 @dataclass
 class _CacheEntry:
-    data: dict[str, Any]
+    # Raw MET body plus its columnar timeseries; the nested dict is not kept
+    content: bytes
+    series: MetSeries
     last_modified: str | None
     expires_at: float
+    stale_while_revalidate_s: float = 0.0
+    stale_if_error_s: float = 0.0
+    size_bytes: int = 0
+    # Process-unique id of the body; changes whenever a new body is stored (not on 304)
+    version: int = 0
+
+
+@dataclass(frozen=True)
+class MetCacheResult:
+    """
+    MET payload together with the cache metadata it was served from.
+
+    stale is None for fresh data, "revalidating" when served within the
+    stale-while-revalidate window and "error" when served within the
+    stale-if-error window after a failed refresh ("expired" only from
+    peek_locationforecast_compact_result()). version identifies the body,
+    so results derived from it can be memoized per version.
+
+    series is the pre-parsed timeseries; data decodes the raw body on first access.
+    """
+
+    content: bytes
+    series: MetSeries
+    last_modified: str | None
+    expires_at: float
+    version: int
+    stale: str | None = None
+
+    @cached_property
+    def data(self) -> dict[str, Any]:
+        return json.loads(self.content)
 
 
-_cache_lock = threading.Lock()
-_cache: dict[tuple[float, float], _CacheEntry] = {}
+_versions = itertools.count(1)
 
-_limiter: SlidingWindowRateLimiter | None = None
-_limiter_cfg: tuple[int, float] | None = None
+# Errors that may be hidden by serving a stale entry (stale-if-error)
+_STALE_IF_ERROR_EXCEPTIONS = (MetRateLimitExceeded, httpx.HTTPError, ValueError)
+
+# Expired entries are retained (up to MET_CACHE_RETAIN_S) for conditional revalidation
+_cache: BoundedCache[tuple[float, float], _CacheEntry] = BoundedCache("met")
+
+# Optional persistent L2 tier shared by worker processes (MET_DISK_CACHE_PATH)
+_disk_cache_lock = threading.Lock()
+_disk_cache: MetDiskCache | None = None
+_disk_cache_path: str | None = None
+
+_limiter: TokenBucketRateLimiter | None = None
+_limiter_cfg: tuple[int, float, int, int, str, str] | None = None
+
+# Concurrent misses for the same key share one upstream fetch/revalidation
+_flight: SingleFlight[_CacheEntry] = SingleFlight()
+
+# Outcomes of real upstream calls (passive health for readiness probes)
+_upstream = UpstreamHealth()
+
+# Recent request counts per key; the prefetcher revalidates the hottest as they expire
+_access: AccessTracker[tuple[float, float]] = AccessTracker()
+
+# Keeps references to background revalidation tasks until they finish
+_background_tasks: set[asyncio.Task[Any]] = set()
 
 
 def clear_cache() -> None:
     """
     Test helper. Clears in-memory cache.
     """
-    with _cache_lock:
-        _cache.clear()
+    _cache.clear()
+    _access.clear()
+    _upstream.clear()
+    close_disk_cache()
     global _limiter, _limiter_cfg
     _limiter = None
     _limiter_cfg = None
+    _flight.reset_stats()
 
 
-def get_locationforecast_compact(lat: float, lon: float) -> dict[str, Any]:
-    """
-    Return MET locationforecast compact payload.
+def close_disk_cache() -> None:
+    global _disk_cache, _disk_cache_path
 
-    Strategy:
-    - Coordinates are truncated to 4 decimals (ToS).
-    - In-memory TTL cache per (lat_trunc, lon_trunc).
-    - When TTL expires and we have Last-Modified, revalidate with If-Modified-Since:
-        - 200: update cache with new body
-        - 304: refresh TTL and keep cached body
+    with _disk_cache_lock:
+        if _disk_cache is not None:
+            _disk_cache.close()
+        _disk_cache = None
+        _disk_cache_path = None
+
+
+def get_stats() -> dict[str, dict[str, float]]:
     """
+    Return gateway counters: cache usage, upstream single-flight and rate limiter stats.
+    """
+    return {
+        "cache": _cache.stats(),
+        "single_flight": _flight.stats(),
+        "rate_limiter": _limiter.stats() if _limiter is not None else {},
+    }
+
+
+def _get_checked_settings() -> Settings:
     settings = get_settings()
 
     if not settings.user_agent:
         raise RuntimeError("MET_USER_AGENT is not set (required by MET Norway ToS).")
 
+    return settings
+
+
+def check_configuration() -> None:
+    """
+    Raise RuntimeError if the gateway cannot call MET (e.g. MET_USER_AGENT missing).
+    """
+    _get_checked_settings()
+
+
+def _configure_cache(settings: Settings) -> None:
+    _cache.configure(
+        max_entries=int(settings.met_cache_max_entries),
+        max_bytes=int(settings.met_cache_max_bytes),
+    )
+
+
+def _get_disk_cache(settings: Settings) -> MetDiskCache | None:
+    """
+    Return the disk tier for MET_DISK_CACHE_PATH, or None if unset or it cannot be opened.
+
+    An unusable path (unwritable directory, corrupt file) disables the tier
+    until the path changes; the in-memory cache keeps working.
+    """
+    global _disk_cache, _disk_cache_path
+
+    path = settings.met_disk_cache_path
+    with _disk_cache_lock:
+        if path != _disk_cache_path:
+            if _disk_cache is not None:
+                _disk_cache.close()
+            _disk_cache = None
+            _disk_cache_path = path
+            if path:
+                try:
+                    _disk_cache = MetDiskCache(path)
+                except (sqlite3.Error, OSError):
+                    logger.exception("MET disk cache unavailable, disabling the disk tier path=%s", path)
+        return _disk_cache
+
+
+def _disk_tier_enabled(settings: Settings) -> bool:
+    # configured and not already known to be unusable (checked without opening it)
+    path = settings.met_disk_cache_path
+    return bool(path) and not (path == _disk_cache_path and _disk_cache is None)
+
+
+def _get_limiter(settings: Settings) -> TokenBucketRateLimiter | None:
     global _limiter, _limiter_cfg
 
     max_calls = int(settings.met_rl_max_calls)
     period_s = float(settings.met_rl_period_s)
 
     if max_calls > 0 and period_s > 0:
-        cfg = (max_calls, period_s)
+        cfg = (
+            max_calls,
+            period_s,
+            int(settings.met_rl_max_waiters),
+            int(max_calls * float(settings.met_rl_reserved_fraction)),
+            settings.rate_limit_backend,
+            settings.rate_limit_dir,
+        )
         if _limiter is None or _limiter_cfg != cfg:
-            _limiter = SlidingWindowRateLimiter(max_calls=max_calls, period_s=period_s)
+            _limiter = create_rate_limiter(
+                "met",
+                max_calls,
+                period_s,
+                max_waiters=cfg[2],
+                reserved=cfg[3],
+                backend=settings.rate_limit_backend,
+                directory=settings.rate_limit_dir,
+            )
             _limiter_cfg = cfg
 
-    ttl_s = float(settings.met_cache_ttl_s)
+    return _limiter
 
-    lat_t = truncate_coord(lat)
-    lon_t = truncate_coord(lon)
-    key = (lat_t, lon_t)
 
-    now = time.time()
+def _rate_limit_exceeded(settings: Settings, priority: str) -> MetRateLimitExceeded:
+    logger.warning(
+        "MET upstream rate limit exceeded priority=%s max_calls=%s period_s=%s max_wait_s=%s",
+        priority,
+        settings.met_rl_max_calls,
+        settings.met_rl_period_s,
+        settings.met_rl_max_wait_s,
+    )
+    return MetRateLimitExceeded("MET upstream rate limit exceeded", priority=priority)
+
+
+async def _acheck_rate_limit(settings: Settings, priority: str) -> None:
+    limiter = _get_limiter(settings)
+    if limiter is not None and not await limiter.aacquire(float(settings.met_rl_max_wait_s), priority=priority):
+        raise _rate_limit_exceeded(settings, priority)
+
+
+def _lookup(key: tuple[float, float], now: float, *, count: bool = True) -> tuple[_CacheEntry | None, bool]:
+    """
+    Return (entry, is_fresh) for the cache key.
+
+    count=False re-checks the cache without affecting LRU order or hit/miss stats.
+    """
+    entry = _cache.get(key, now) if count else _cache.peek(key, now)
+    if entry and count:
+        _remeasure(key, entry)
+
+    if entry and now < entry.expires_at:
+        logger.info("MET cache hit key=%s ttl_left_s=%.2f", key, entry.expires_at - now)
+        return entry, True
+
+    return entry, False
+
+
+def _result(entry: _CacheEntry, stale: str | None = None) -> MetCacheResult:
+    return MetCacheResult(
+        content=entry.content,
+        series=entry.series,
+        last_modified=entry.last_modified,
+        expires_at=entry.expires_at,
+        version=entry.version,
+        stale=stale,
+    )
+
+
+def _parse_http_date(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        logger.warning("Invalid HTTP date from MET: %s", value)
+        return None
+
+
+def _freshness_ttl_s(settings: Settings, resp: MetResponse, now: float) -> float:
+    """
+    Freshness lifetime of a MET response.
+
+    MET ToS require honoring Expires. The lifetime is Expires - Date (the upstream
+    clock, so local clock skew does not matter), clamped to
+    [MET_CACHE_MIN_TTL_S, MET_CACHE_MAX_TTL_S]. Without a usable Expires header
+    MET_CACHE_TTL_S is used.
+    """
+    expires = _parse_http_date(resp.expires)
+    if expires is None:
+        return float(settings.met_cache_ttl_s)
+
+    date = _parse_http_date(resp.date)
+    ttl_s = expires - (date if date is not None else now)
+
+    min_ttl_s = float(settings.met_cache_min_ttl_s)
+    max_ttl_s = float(settings.met_cache_max_ttl_s)
+    return max(min_ttl_s, min(ttl_s, max_ttl_s))
 
-    with _cache_lock:
-        entry = _cache.get(key)
-        if entry and now < entry.expires_at:
-            logger.info("MET cache hit key=%s ttl_left_s=%.2f", key, entry.expires_at - now)
-            return entry.data
 
-    if_modified_since: str | None = None
-    if entry:
-        if_modified_since = entry.last_modified
+def _put(settings: Settings, key: tuple[float, float], entry: _CacheEntry) -> None:
+    retain_s = max(
+        entry.stale_while_revalidate_s,
+        entry.stale_if_error_s,
+        float(settings.met_cache_retain_s),
+    )
+    _cache.set(key, entry, evict_at=entry.expires_at + retain_s, size=entry.size_bytes)
+
+
+def _entry_size_bytes(content: bytes, series: MetSeries) -> int:
+    return len(content) + series.nbytes
+
+
+def _remeasure(key: tuple[float, float], entry: _CacheEntry) -> None:
+    # The series caches per-tz local timestamps after it is stored; keep the byte budget honest
+    size_bytes = _entry_size_bytes(entry.content, entry.series)
+    if size_bytes != entry.size_bytes:
+        entry.size_bytes = size_bytes
+        _cache.resize(key, size_bytes)
+
+
+def _entry_from_disk(settings: Settings, record: DiskCacheRecord) -> _CacheEntry | None:
+    try:
+        data = json.loads(record.content)
+    except ValueError:
+        logger.warning("MET disk cache record is not valid JSON key=%s", (record.lat, record.lon))
+        return None
+
+    series = parse_met_series(data)
+    return _CacheEntry(
+        content=record.content,
+        series=series,
+        last_modified=record.last_modified,
+        expires_at=record.expires_at,
+        stale_while_revalidate_s=float(settings.met_cache_stale_while_revalidate_s),
+        stale_if_error_s=float(settings.met_cache_stale_if_error_s),
+        size_bytes=_entry_size_bytes(record.content, series),
+        version=next(_versions),
+    )
+
+
+def _load_from_disk(settings: Settings, key: tuple[float, float], entry: _CacheEntry | None) -> _CacheEntry | None:
+    """
+    L2 lookup: if the disk tier holds a newer copy than L1, promote it to L1.
+
+    This also lets workers reuse what another process fetched (or revalidate
+    an entry they never held with If-Modified-Since).
+    """
+    disk = _get_disk_cache(settings)
+    if disk is None:
+        return entry
+
+    record = disk.get(key)
+    if record is None or (entry is not None and record.expires_at <= entry.expires_at):
+        return entry
 
-    if _limiter is not None and not _limiter.allow():
-        logger.warning("MET upstream rate limit exceeded max_calls=%s period_s=%s", max_calls, period_s)
-        raise MetRateLimitExceeded("MET upstream rate limit exceeded")
+    disk_entry = _entry_from_disk(settings, record)
+    if disk_entry is None:
+        return entry
 
-    client = MetClient()
-    resp = client.fetch_locationforecast_compact(lat_t, lon_t, if_modified_since=if_modified_since)
+    _put(settings, key, disk_entry)
+    logger.info("MET disk cache hit key=%s ttl_left_s=%.2f", key, disk_entry.expires_at - time.time())
+    return disk_entry
+
+
+def warm_cache_from_disk() -> int:
+    """
+    Load the most recently stored disk records into L1 (called on startup).
+    Returns number of entries loaded.
+    """
+    settings = get_settings()
+    disk = _get_disk_cache(settings)
+    if disk is None:
+        return 0
+
+    _configure_cache(settings)
+
+    not_before = time.time() - float(settings.met_cache_retain_s)
+    disk.prune(expired_before=not_before)
+
+    loaded = 0
+    # oldest first, so the most recently stored end up most recently used
+    for record in reversed(disk.recent(int(settings.met_disk_cache_warm_max), not_before=not_before)):
+        entry = _entry_from_disk(settings, record)
+        if entry is not None:
+            _put(settings, (record.lat, record.lon), entry)
+            loaded += 1
+
+    logger.info("MET cache warmed from disk entries=%d path=%s", loaded, disk.path)
+    return loaded
+
+
+def _persist_entry(
+        settings: Settings,
+        key: tuple[float, float],
+        entry: _CacheEntry,
+        now: float,
+        *,
+        revalidated: bool,
+) -> None:
+    """
+    Write an entry to the disk tier: metadata only after a 304, the full body otherwise.
+    """
+    disk = _get_disk_cache(settings)
+    if disk is None:
+        return
+    if revalidated:
+        disk.touch(key, entry.last_modified, entry.expires_at, now)
+    else:
+        disk.put(key, entry.content, entry.last_modified, entry.expires_at, now)
+
+
+def _store_response(
+        settings: Settings,
+        key: tuple[float, float],
+        entry: _CacheEntry | None,
+        resp: MetResponse,
+        now: float,
+        *,
+        persist: bool = True,
+) -> _CacheEntry:
+    """
+    Apply an upstream response to L1. persist=False leaves the disk write to the
+    caller (see _persist_entry()), so async callers can run it off the event loop.
+    """
+    ttl_s = _freshness_ttl_s(settings, resp, now)
+    swr_s = float(settings.met_cache_stale_while_revalidate_s)
+    sie_s = float(settings.met_cache_stale_if_error_s)
 
     # 304 Not Modified -> keep cached body, refresh TTL
     if resp.status_code == 304:
         if not entry:
             raise ValueError("MET returned 304 but no cached response is available")
 
-        new_expires = now + ttl_s
-        new_last_modified = resp.last_modified or entry.last_modified
-
-        with _cache_lock:
-            _cache[key] = _CacheEntry(
-                data=entry.data,
-                last_modified=new_last_modified,
-                expires_at=new_expires,
-            )
+        new_entry = _CacheEntry(
+            content=entry.content,
+            series=entry.series,
+            last_modified=resp.last_modified or entry.last_modified,
+            expires_at=now + ttl_s,
+            stale_while_revalidate_s=swr_s,
+            stale_if_error_s=sie_s,
+            size_bytes=_entry_size_bytes(entry.content, entry.series),
+            version=entry.version,
+        )
+        _put(settings, key, new_entry)
+        if persist:
+            _persist_entry(settings, key, new_entry, now, revalidated=True)
 
         logger.info("MET cache revalidated (304) key=%s new_ttl_s=%.2f", key, ttl_s)
-        return entry.data
+        return new_entry
 
     # 200 OK (or other 2xx) -> must have JSON body
     if resp.data is None:
         raise ValueError("MET returned response without JSON body")
 
+    # Normalize once: keep the compact raw body and columnar series, drop the nested dict
+    content = resp.content if resp.content is not None else json.dumps(resp.data).encode()
+    series = parse_met_series(resp.data)
+
     new_entry = _CacheEntry(
-        data=resp.data,
+        content=content,
+        series=series,
         last_modified=resp.last_modified,
         expires_at=now + ttl_s,
+        stale_while_revalidate_s=swr_s,
+        stale_if_error_s=sie_s,
+        size_bytes=_entry_size_bytes(content, series),
+        version=next(_versions),
     )
-
-    with _cache_lock:
-        _cache[key] = new_entry
+    _put(settings, key, new_entry)
+    if persist:
+        _persist_entry(settings, key, new_entry, now, revalidated=False)
 
     logger.info("MET cache stored key=%s ttl_s=%.2f last_modified=%s", key, ttl_s, resp.last_modified)
-    return resp.data
+    return new_entry
+
+
+async def _afetch(
+        settings: Settings,
+        key: tuple[float, float],
+        priority: str,
+) -> _CacheEntry:
+    now = time.time()
+
+    # Another flight (or another worker, via the disk tier) may have refreshed the entry
+    entry, fresh = _lookup(key, now, count=False)
+    if entry and fresh:
+        return entry
+
+    # SQLite may wait on another worker's write lock; keep it off the event loop
+    use_disk = _disk_tier_enabled(settings)
+    if use_disk:
+        entry = await asyncio.to_thread(_load_from_disk, settings, key, entry)
+    if entry and now < entry.expires_at:
+        return entry
+
+    await _acheck_rate_limit(settings, priority)
+
+    try:
+        resp = await MetClient().afetch_locationforecast_compact(
+            *key,
+            if_modified_since=entry.last_modified if entry else None,
+        )
+        new_entry = _store_response(settings, key, entry, resp, now, persist=False)
+    except (httpx.HTTPError, ValueError):
+        _upstream.record_error()
+        raise
+
+    _upstream.record_success()
+
+    if use_disk:
+        await asyncio.to_thread(
+            _persist_entry, settings, key, new_entry, now, revalidated=resp.status_code == 304
+        )
+    return new_entry
+
+
+async def _aflight_fetch(settings: Settings, key: tuple[float, float], priority: str) -> _CacheEntry:
+    """
+    Single-flight fetch in the caller's rate-limit class.
+
+    The shared call runs in the leader's class; if a lower-class leader was
+    rejected by the limiter, the call is retried once in this caller's class.
+    """
+    try:
+        return await _flight.ado(key, lambda: _afetch(settings, key, priority))
+    except MetRateLimitExceeded as exc:
+        if exc.priority == priority:
+            raise
+        return await _flight.ado(key, lambda: _afetch(settings, key, priority))
+
+
+def _within_swr(entry: _CacheEntry | None, now: float) -> bool:
+    return entry is not None and now < entry.expires_at + entry.stale_while_revalidate_s
+
+
+def _within_sie(entry: _CacheEntry | None, now: float) -> bool:
+    return entry is not None and now < entry.expires_at + entry.stale_if_error_s
+
+
+def _on_background_task_done(task: asyncio.Task[Any]) -> None:
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("MET background revalidation failed", exc_info=task.exception())
+
+
+async def aget_locationforecast_compact_result(
+        lat: float,
+        lon: float,
+        *,
+        priority: str = PRIORITY_INTERACTIVE,
+) -> MetCacheResult:
+    """
+    Return MET locationforecast compact payload with cache metadata.
+
+    Strategy:
+    - Coordinates are truncated to 4 decimals (ToS).
+    - In-memory TTL cache per (lat_trunc, lon_trunc).
+    - When TTL expires and we have Last-Modified, revalidate with If-Modified-Since:
+        - 200: update cache with new body
+        - 304: refresh TTL and keep cached body
+    - Within the stale-while-revalidate window the stale body is returned at once
+      and revalidation runs in the background.
+    - Within the stale-if-error window upstream/rate-limit errors are hidden by
+      returning the stale body.
+    - Concurrent misses for the same key are coalesced into a single upstream call;
+      waiting callers share its result or error.
+    - priority selects the rate-limit class of an upstream call made for this
+      request; background revalidation always uses PRIORITY_BACKGROUND.
+    """
+    settings = _get_checked_settings()
+    _configure_cache(settings)
+    key = (truncate_coord(lat), truncate_coord(lon))
+    _access.record(key)
+    now = time.time()
+
+    entry, fresh = _lookup(key, now)
+    if entry and fresh:
+        return _result(entry)
+
+    if entry and _within_swr(entry, now):
+        if not _flight.is_running(key):
+            task = asyncio.create_task(_flight.ado(key, lambda: _afetch(settings, key, PRIORITY_BACKGROUND)))
+            _background_tasks.add(task)
+            task.add_done_callback(_on_background_task_done)
+        logger.info("MET cache serving stale while revalidating key=%s", key)
+        return _result(entry, stale="revalidating")
+
+    try:
+        return _result(await _aflight_fetch(settings, key, priority))
+    except _STALE_IF_ERROR_EXCEPTIONS:
+        if entry and _within_sie(entry, now):
+            logger.warning("MET refresh failed, serving stale entry key=%s", key, exc_info=True)
+            return _result(entry, stale="error")
+        raise
+
+
+def get_locationforecast_compact_result(
+        lat: float,
+        lon: float,
+        *,
+        priority: str = PRIORITY_INTERACTIVE,
+) -> MetCacheResult:
+    """
+    Blocking wrapper around aget_locationforecast_compact_result() for tests and scripts.
+    """
+    return run_sync(aget_locationforecast_compact_result(lat, lon, priority=priority))
+
+
+def get_upstream_health(window_s: float) -> dict[str, Any]:
+    """
+    Passive MET health: recent upstream outcomes, limiter headroom and cache fill.
+    Reads local state only; never calls MET or spends rate-limit budget.
+    """
+    settings = get_settings()
+    cache = _cache.stats()
+    limiter = _get_limiter(settings)
+
+    headroom = None
+    if limiter is not None:
+        headroom = max(0.0, limiter.stats()["tokens"]) / max(1, int(settings.met_rl_max_calls))
+
+    return {
+        **_upstream.snapshot(window_s),
+        "limiter_headroom": headroom,
+        "cache_entries": cache["entries"],
+        "cache_fill": cache["entries"] / cache["max_entries"] if cache["max_entries"] else 0.0,
+    }
+
+
+def peek_locationforecast_compact_result(lat: float, lon: float) -> MetCacheResult | None:
+    """
+    Cached MET result for the coordinates without any upstream call, or None.
+
+    Does not count as an access. Entries past their freshness (but still
+    retained) are returned with stale="expired".
+    """
+    key = (truncate_coord(lat), truncate_coord(lon))
+    now = time.time()
+
+    entry = _cache.peek(key, now)
+    if entry is None:
+        return None
+    return _result(entry, stale=None if now < entry.expires_at else "expired")
+
+
+def hot_keys(limit: int) -> list[tuple[float, float]]:
+    """
+    Most requested keys recently (see decay_access_counts()).
+    """
+    return _access.top(limit)
+
+
+def decay_access_counts() -> None:
+    _access.decay()
+
+
+def cache_expires_at(key: tuple[float, float]) -> float | None:
+    """
+    Freshness deadline of the L1 entry for key, or None when it is not cached.
+    """
+    entry = _cache.peek(key)
+    return entry.expires_at if entry is not None else None
+
+
+async def arevalidate(lat: float, lon: float) -> None:
+    """
+    Revalidate the entry once it has expired (If-Modified-Since), or fetch it if missing.
+
+    A fresh entry is left alone: MET must not be asked again before Expires.
+    Goes through the same single-flight as user requests, uses the
+    PRIORITY_BACKGROUND rate-limit class and does not count as an access.
+    Errors propagate to the caller.
+    """
+    settings = _get_checked_settings()
+    _configure_cache(settings)
+    key = (truncate_coord(lat), truncate_coord(lon))
+
+    await _flight.ado(key, lambda: _afetch(settings, key, PRIORITY_BACKGROUND))
+
+
+def get_locationforecast_compact(
+        lat: float,
+        lon: float,
+        *,
+        priority: str = PRIORITY_INTERACTIVE,
+) -> dict[str, Any]:
+    """
+    Return MET locationforecast compact payload.
+
+    Blocking wrapper around aget_locationforecast_compact() for tests and scripts.
+    """
+    return run_sync(aget_locationforecast_compact(lat, lon, priority=priority))
+
+
+async def aget_locationforecast_compact(
+        lat: float,
+        lon: float,
+        *,
+        priority: str = PRIORITY_INTERACTIVE,
+) -> dict[str, Any]:
+    """
+    Return MET locationforecast compact payload.
+
+    See aget_locationforecast_compact_result() for caching behavior.
+    """
+    return (await aget_locationforecast_compact_result(lat, lon, priority=priority)).data
+
+
+async def aiter_locationforecast_compact_results(
+        coords: Iterable[tuple[float, float]],
+        *,
+        concurrency: int,
+) -> AsyncIterator[tuple[tuple[float, float], MetCacheResult | Exception]]:
+    """
+    Fetch MET results for many locations concurrently.
+
+    Coordinates are truncated and deduplicated; `concurrency` workers fetch them
+    (all still go through the cache, single-flight and rate limiter). Yields
+    (key, result or exception) in completion order. The result queue is bounded,
+    so a slow consumer pauses the workers instead of buffering results. Closing
+    the iterator early cancels the workers and waits for them to finish.
+    """
+    keys = list(dict.fromkeys((truncate_coord(lat), truncate_coord(lon)) for lat, lon in coords))
+    if not keys:
+        return
+
+    pending = iter(keys)
+    n_workers = max(1, min(concurrency, len(keys)))
+    done: asyncio.Queue[tuple[tuple[float, float], MetCacheResult | Exception]] = asyncio.Queue(maxsize=n_workers)
+
+    async def worker() -> None:
+        for key in pending:
+            try:
+                met: MetCacheResult | Exception = await aget_locationforecast_compact_result(*key)
+            except Exception as exc:
+                met = exc
+            await done.put((key, met))
+
+    workers = [asyncio.create_task(worker()) for _ in range(n_workers)]
+    try:
+        for _ in range(len(keys)):
+            yield await done.get()
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+
+from met_weather_service.core.config import Settings, get_settings
+from met_weather_service.services import met_gateway
+from met_weather_service.services.met_client import truncate_coord
+
+logger = logging.getLogger(__name__)
+
+
+def parse_watchlist(value: str) -> list[tuple[float, float]]:
+    """
+    Parse MET_PREFETCH_WATCHLIST: "lat,lon;lat,lon;...". Invalid entries are skipped.
+    """
+    keys: list[tuple[float, float]] = []
+
+    for part in value.split(";"):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            lat_str, lon_str = part.split(",")
+            lat, lon = float(lat_str), float(lon_str)
+        except ValueError:
+            logger.warning("Ignoring invalid MET_PREFETCH_WATCHLIST entry: %s", part)
+            continue
+        if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+            logger.warning("Ignoring out-of-range MET_PREFETCH_WATCHLIST entry: %s", part)
+            continue
+        keys.append((truncate_coord(lat), truncate_coord(lon)))
+
+    return list(dict.fromkeys(keys))
+
+
+def is_enabled(settings: Settings) -> bool:
+    if not (settings.met_prefetch_watchlist.strip() or settings.met_prefetch_top_n > 0):
+        return False
+    if float(settings.met_prefetch_interval_s) <= 0:
+        logger.warning("MET prefetch disabled: MET_PREFETCH_INTERVAL_S must be > 0")
+        return False
+    return True
+
+
+def tick_budget(settings: Settings) -> int:
+    """
+    Max prefetch calls per tick: MET_PREFETCH_BUDGET_FRACTION of the MET rate
+    limit, scaled from the limiter period to the tick interval.
+    """
+    max_calls = int(settings.met_rl_max_calls)
+    period_s = float(settings.met_rl_period_s)
+    interval_s = float(settings.met_prefetch_interval_s)
+
+    if max_calls <= 0 or period_s <= 0:
+        # No upstream limit configured: bounded only by the candidate list
+        return max(1, int(settings.met_prefetch_top_n) + len(parse_watchlist(settings.met_prefetch_watchlist)))
+
+    return max(1, math.floor(max_calls * float(settings.met_prefetch_budget_fraction) * interval_s / period_s))
+
+
+def due_keys(settings: Settings, now: float) -> list[tuple[float, float]]:
+    """
+    Watch-list and hot keys that are missing or have expired, longest expired first.
+    Hot keys are only revalidated, never fetched cold.
+
+    MET's terms forbid requesting data again before its Expires time, so keys
+    are never due early; the tick after expiry revalidates them.
+    """
+    watch = parse_watchlist(settings.met_prefetch_watchlist)
+    hot = met_gateway.hot_keys(int(settings.met_prefetch_top_n)) if settings.met_prefetch_top_n > 0 else []
+
+    due: list[tuple[float, tuple[float, float]]] = []
+
+    for key in dict.fromkeys([*watch, *hot]):
+        expires_at = met_gateway.cache_expires_at(key)
+        if expires_at is None:
+            if key in watch:
+                due.append((now, key))
+            continue
+        if expires_at <= now:
+            due.append((expires_at, key))
+
+    due.sort()
+    return [key for _, key in due]
+
+
+async def prefetch_once(settings: Settings) -> int:
+    """
+    Run one prefetch tick; calls are spaced evenly across the tick interval.
+    Returns the number of keys revalidated or fetched.
+    """
+    keys = due_keys(settings, time.time())[:tick_budget(settings)]
+    met_gateway.decay_access_counts()
+    if not keys:
+        return 0
+
+    spacing_s = float(settings.met_prefetch_interval_s) / len(keys)
+    refreshed = 0
+
+    for i, key in enumerate(keys):
+        if i:
+            await asyncio.sleep(spacing_s)
+        try:
+            await met_gateway.arevalidate(*key)
+            refreshed += 1
+        except met_gateway.MetRateLimitExceeded:
+            logger.info("MET prefetch stopped: rate limit reached refreshed=%d due=%d", refreshed, len(keys))
+            break
+        except Exception:
+            logger.warning("MET prefetch failed key=%s", key, exc_info=True)
+
+    logger.info("MET prefetch tick refreshed=%d due=%d", refreshed, len(keys))
+    return refreshed
+
+
+async def run_prefetcher() -> None:
+    """
+    Revalidation loop for hot and watch-listed coordinates (app lifespan task).
+
+    Only started when is_enabled() holds, which requires a positive interval.
+    """
+    while True:
+        settings = get_settings()
+        started = time.monotonic()
+        try:
+            await prefetch_once(settings)
+        except Exception:
+            logger.exception("MET prefetch tick failed")
+        elapsed_s = time.monotonic() - started
+        await asyncio.sleep(max(0.0, float(settings.met_prefetch_interval_s) - elapsed_s))
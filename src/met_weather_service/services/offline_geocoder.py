@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import logging
+import math
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+from met_weather_service.services.geocoder_client import GeoPlace
+
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS_KM = 6371.0088
+
+BUNDLED_GAZETTEER = Path(__file__).resolve().parent.parent / "data" / "gazetteer_seed.tsv"
+
+# Ranges at most this long are scanned linearly instead of split further.
+_LEAF_SIZE = 8
+
+# GeoNames dump columns (cities500.txt, allCountries.txt, ...)
+_GN_NAME = 1
+_GN_LAT = 4
+_GN_LON = 5
+_GN_COUNTRY = 8
+_GN_POPULATION = 14
+_GN_MIN_COLUMNS = 15
+
+
+@dataclass(frozen=True)
+class GazetteerEntry:
+    name: str
+    lat: float
+    lon: float
+    country_code: str
+    population: int
+
+
+def _unit_vector(lat: float, lon: float) -> tuple[float, float, float]:
+    phi = math.radians(lat)
+    lam = math.radians(lon)
+    cos_phi = math.cos(phi)
+    return cos_phi * math.cos(lam), cos_phi * math.sin(lam), math.sin(phi)
+
+
+def chord_to_km(chord_sq: float) -> float:
+    """
+    Great-circle distance for a squared chord length between unit vectors.
+    """
+    return 2.0 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(chord_sq) / 2.0))
+
+
+def km_to_chord_sq(km: float) -> float:
+    chord = 2.0 * math.sin(min(math.pi, km / EARTH_RADIUS_KM) / 2.0)
+    return chord * chord
+
+
+def parse_gazetteer_line(line: str) -> GazetteerEntry | None:
+    """
+    Parse one TSV line: a GeoNames dump row or the short form
+    "name, lat, lon, country_code[, population]". Comments and bad rows yield None.
+    """
+    if not line.strip() or line.startswith("#"):
+        return None
+
+    cols = line.rstrip("\r\n").split("\t")
+    try:
+        if len(cols) >= _GN_MIN_COLUMNS:
+            name, lat, lon = cols[_GN_NAME], float(cols[_GN_LAT]), float(cols[_GN_LON])
+            country, population = cols[_GN_COUNTRY], int(cols[_GN_POPULATION] or 0)
+        elif len(cols) >= 4:
+            name, lat, lon, country = cols[0], float(cols[1]), float(cols[2]), cols[3]
+            population = int(cols[4] or 0) if len(cols) > 4 else 0
+        else:
+            return None
+    except ValueError:
+        return None
+
+    if not name or not (-90.0 <= lat <= 90.0 and -180.0 <= lon <= 180.0):
+        return None
+    return GazetteerEntry(name=name, lat=lat, lon=lon, country_code=country, population=population)
+
+
+class OfflineGeocoder:
+    """
+    Nearest-place lookup over a static gazetteer.
+
+    Places are stored as unit vectors in an implicit KD-tree (median splits
+    over flat arrays, no per-node objects), so nearest-neighbour queries cost
+    O(log n) and Euclidean chord distance ranks places exactly like
+    great-circle distance. Names are kept in one string with an offsets array.
+    Immutable after construction and safe to share between threads.
+    """
+
+    def __init__(self, entries: Iterable[GazetteerEntry]) -> None:
+        xs = array("d")
+        ys = array("d")
+        zs = array("d")
+        lats = array("d")
+        lons = array("d")
+        population = array("q")
+        names: list[str] = []
+        countries: list[str] = []
+
+        for e in entries:
+            x, y, z = _unit_vector(e.lat, e.lon)
+            xs.append(x)
+            ys.append(y)
+            zs.append(z)
+            lats.append(e.lat)
+            lons.append(e.lon)
+            population.append(e.population)
+            names.append(e.name)
+            countries.append(e.country_code)
+
+        order = self._build(xs, ys, zs)
+
+        self._x = array("d", (xs[i] for i in order))
+        self._y = array("d", (ys[i] for i in order))
+        self._z = array("d", (zs[i] for i in order))
+        self._lat = array("d", (lats[i] for i in order))
+        self._lon = array("d", (lons[i] for i in order))
+        self._population = array("q", (population[i] for i in order))
+
+        offsets = array("I", [0])
+        for i in order:
+            offsets.append(offsets[-1] + len(names[i]))
+        self._names = "".join(names[i] for i in order)
+        self._name_offsets = offsets
+
+        # Country codes repeat a lot; intern them to one object per code.
+        interned: dict[str, str] = {}
+        self._countries = [interned.setdefault(countries[i], countries[i]) for i in order]
+
+    @staticmethod
+    def _build(xs: array, ys: array, zs: array) -> list[int]:
+        """
+        Arrange point indexes so that every range [lo, hi) longer than a leaf
+        has its splitting point at (lo + hi) // 2, split on axis depth % 3.
+        """
+        axes = (xs, ys, zs)
+        order = list(range(len(xs)))
+        stack = [(0, len(order), 0)]
+
+        while stack:
+            lo, hi, depth = stack.pop()
+            if hi - lo <= _LEAF_SIZE:
+                continue
+            order[lo:hi] = sorted(order[lo:hi], key=axes[depth % 3].__getitem__)
+            mid = (lo + hi) >> 1
+            stack.append((lo, mid, depth + 1))
+            stack.append((mid + 1, hi, depth + 1))
+
+        return order
+
+    def __len__(self) -> int:
+        return len(self._x)
+
+    def nearest_index(self, lat: float, lon: float) -> tuple[int, float]:
+        """
+        Return (index, squared chord distance) of the closest place, or (-1, inf).
+        """
+        qx, qy, qz = _unit_vector(lat, lon)
+        xs, ys, zs = self._x, self._y, self._z
+
+        best = -1
+        best_d = math.inf
+        # (lo, hi, depth, lower bound of squared distance for the range)
+        stack = [(0, len(xs), 0, 0.0)]
+
+        while stack:
+            lo, hi, depth, bound = stack.pop()
+            if bound >= best_d:
+                continue
+
+            if hi - lo <= _LEAF_SIZE:
+                for i in range(lo, hi):
+                    dx = xs[i] - qx
+                    dy = ys[i] - qy
+                    dz = zs[i] - qz
+                    d = dx * dx + dy * dy + dz * dz
+                    if d < best_d:
+                        best, best_d = i, d
+                continue
+
+            mid = (lo + hi) >> 1
+            dx = xs[mid] - qx
+            dy = ys[mid] - qy
+            dz = zs[mid] - qz
+            d = dx * dx + dy * dy + dz * dz
+            if d < best_d:
+                best, best_d = mid, d
+
+            axis = depth % 3
+            diff = -(dx if axis == 0 else dy if axis == 1 else dz)
+            if diff < 0:
+                near, far = (lo, mid), (mid + 1, hi)
+            else:
+                near, far = (mid + 1, hi), (lo, mid)
+
+            # far side first so the near side is popped (and tightens best_d) first
+            stack.append((far[0], far[1], depth + 1, max(bound, diff * diff)))
+            stack.append((near[0], near[1], depth + 1, bound))
+
+        return best, best_d
+
+    def place_at(self, index: int) -> GeoPlace:
+        name = self._names[self._name_offsets[index]:self._name_offsets[index + 1]]
+        country = self._countries[index] or None
+        return GeoPlace(
+            display_name=f"{name}, {country}" if country else name,
+            lat=self._lat[index],
+            lon=self._lon[index],
+            country=country,
+            city=name,
+            state=None,
+            raw={"source": "offline", "population": self._population[index]},
+        )
+
+    def nearest(self, lat: float, lon: float, *, max_distance_km: float = 0.0) -> tuple[GeoPlace, float] | None:
+        """
+        Closest place and its distance in km; None if empty or beyond max_distance_km (0 = no limit).
+        """
+        index, chord_sq = self.nearest_index(lat, lon)
+        if index < 0:
+            return None
+        if max_distance_km > 0 and chord_sq > km_to_chord_sq(max_distance_km):
+            return None
+        return self.place_at(index), chord_to_km(chord_sq)
+
+
+def load_gazetteer(path: str | Path) -> OfflineGeocoder:
+    """
+    Build an OfflineGeocoder from a TSV gazetteer file (see parse_gazetteer_line).
+    """
+    with open(path, encoding="utf-8") as f:
+        geocoder = OfflineGeocoder(e for e in map(parse_gazetteer_line, f) if e is not None)
+
+    logger.info("Offline gazetteer loaded path=%s places=%d", path, len(geocoder))
+    return geocoder
@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import math
+import re
+import threading
+import unicodedata
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from typing import Iterable
+
+from met_weather_service.services.geocoder_client import GeoPlace
+from met_weather_service.services.met_client import truncate_coord
+from met_weather_service.services.offline_geocoder import GazetteerEntry
+
+# Index keys start at the beginning of the name and at each of its first words.
+_MAX_WORD_STARTS = 8
+# Rankings are memoized for prefixes matching more than _MEMO_MIN_RANGE keys and
+# updated in place; prefixes of up to _MEMO_PREFIX_LEN characters are ranked at seed load.
+_MEMO_MIN_RANGE = 256
+_MEMO_PREFIX_LEN = 3
+_MEMO_TOP = 10
+# Sorts after every character a normalized name can contain.
+_PREFIX_END = "\U0010ffff"
+
+_WORD_SEP = re.compile(r"[\s,()/-]+")
+
+PlaceId = tuple[str, float, float]
+
+
+def normalize_name(text: str) -> str:
+    """
+    Lowercase, strip accents and collapse separators ("Niš, RS" -> "nis rs").
+    """
+    folded = text.casefold()
+    if not folded.isascii():
+        decomposed = unicodedata.normalize("NFKD", folded)
+        folded = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return " ".join(_WORD_SEP.split(folded)).strip()
+
+
+def _index_keys(place: GeoPlace) -> tuple[str, ...]:
+    name = normalize_name(place.display_name)
+    keys = {name}
+    pos = 0
+    for _ in range(_MAX_WORD_STARTS):
+        pos = name.find(" ", pos) + 1
+        if pos <= 0:
+            break
+        keys.add(name[pos:])
+    if place.city:
+        keys.add(normalize_name(place.city))
+    keys.discard("")
+    return tuple(keys)
+
+
+@dataclass
+class _Entry:
+    place: GeoPlace
+    popularity: float
+    keys: tuple[str, ...]
+    seeded: bool = False
+
+
+class PlaceSuggestIndex:
+    """
+    In-process prefix index for place-name autocomplete.
+
+    Index keys are normalized names kept in sorted lists (one for the seed,
+    one for resolved places), so two bisects per list bound the run of keys
+    matching a prefix. Each place is reachable from the start of its display
+    name and from its word starts ("sad" finds "Novi Sad"). The whole matching
+    range is ranked by popularity: a population-based prior for gazetteer
+    places plus one per time the place was resolved.
+
+    Rankings of prefixes matching many keys are memoized and kept current as
+    places are added or bumped (popularity only grows), so a keystroke never
+    rescans a large range; short prefixes are ranked when the seed is loaded.
+
+    Gazetteer and resolved places are capped separately (0 = unlimited): the
+    seed keeps its most populous rows, and a full resolved set evicts its
+    least popular place, so a large seed never locks out resolved places.
+    """
+
+    def __init__(self, *, max_places: int = 50_000, max_resolved: int = 10_000) -> None:
+        self._lock = threading.Lock()
+        self._max_places = max_places
+        self._max_resolved = max_resolved
+        self._places: dict[PlaceId, _Entry] = {}
+        self._resolved: set[PlaceId] = set()
+        # (popularity, pid) of resolved places; entries go stale on bumps and are skipped
+        self._eviction_heap: list[tuple[float, PlaceId]] = []
+        self._seed_keys: list[tuple[str, PlaceId]] = []
+        self._resolved_keys: list[tuple[str, PlaceId]] = []
+        self._memo: dict[str, list[PlaceId]] = {}
+
+    def configure(self, *, max_places: int, max_resolved: int) -> None:
+        with self._lock:
+            self._max_places = max_places
+            self._max_resolved = max_resolved
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._places)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._places.clear()
+            self._resolved.clear()
+            self._eviction_heap.clear()
+            self._seed_keys.clear()
+            self._resolved_keys.clear()
+            self._memo.clear()
+
+    @staticmethod
+    def _place_id(place: GeoPlace) -> PlaceId:
+        return place.display_name, truncate_coord(place.lat), truncate_coord(place.lon)
+
+    def _rank(self, pid: PlaceId) -> tuple[float, PlaceId]:
+        # most popular first, then alphabetical
+        return -self._places[pid].popularity, pid
+
+    def _memo_offer_locked(self, pid: PlaceId, keys: tuple[str, ...]) -> None:
+        """
+        Merge a new or more popular place into the memoized rankings it can enter.
+        """
+        rank = self._rank(pid)
+        prefixes = {key[:n] for key in keys for n in range(1, len(key) + 1)}
+        for prefix in prefixes:
+            top = self._memo.get(prefix)
+            if top is None:
+                continue
+            if pid not in top:
+                if len(top) >= _MEMO_TOP and rank >= self._rank(top[-1]):
+                    continue
+                top.append(pid)
+            top.sort(key=self._rank)
+            del top[_MEMO_TOP:]
+
+    def _evict_locked(self) -> None:
+        while self._eviction_heap:
+            popularity, pid = heapq.heappop(self._eviction_heap)
+            entry = self._places.get(pid)
+            if pid in self._resolved and entry is not None and entry.popularity == popularity:
+                break
+        else:
+            return
+
+        del self._places[pid]
+        self._resolved.discard(pid)
+        for key in entry.keys:
+            i = bisect_left(self._resolved_keys, (key, pid))
+            if i < len(self._resolved_keys) and self._resolved_keys[i] == (key, pid):
+                del self._resolved_keys[i]
+            # rankings it was part of are re-ranked by the next query
+            for n in range(1, len(key) + 1):
+                if pid in self._memo.get(key[:n], ()):
+                    del self._memo[key[:n]]
+
+    def add(self, place: GeoPlace, *, popularity: float = 1.0) -> None:
+        """
+        Add a resolved place or raise the popularity of one already indexed.
+        """
+        with self._lock:
+            pid = self._place_id(place)
+            entry = self._places.get(pid)
+            if entry is not None:
+                entry.popularity += popularity
+                if pid in self._resolved:
+                    heapq.heappush(self._eviction_heap, (entry.popularity, pid))
+                self._memo_offer_locked(pid, entry.keys)
+                return
+
+            if 0 < self._max_resolved <= len(self._resolved):
+                self._evict_locked()
+            # bumps leave stale heap entries behind; drop them in bulk
+            if len(self._eviction_heap) > 2 * len(self._resolved) + 1024:
+                self._eviction_heap = [(self._places[p].popularity, p) for p in self._resolved]
+                heapq.heapify(self._eviction_heap)
+
+            entry = self._places[pid] = _Entry(place=place, popularity=popularity, keys=_index_keys(place))
+            self._resolved.add(pid)
+            heapq.heappush(self._eviction_heap, (popularity, pid))
+            for key in entry.keys:
+                insort(self._resolved_keys, (key, pid))
+            self._memo_offer_locked(pid, entry.keys)
+
+    def add_many(self, places: Iterable[GeoPlace], *, popularity: float = 1.0) -> None:
+        for place in places:
+            self.add(place, popularity=popularity)
+
+    def add_gazetteer(self, entries: Iterable[GazetteerEntry]) -> None:
+        """
+        Bulk-load gazetteer rows (one sort at the end); log10(population) is the initial popularity.
+
+        Only the max_places most populous rows are kept.
+        """
+        with self._lock:
+            if self._max_places > 0:
+                room = self._max_places - sum(1 for e in self._places.values() if e.seeded)
+                entries = heapq.nlargest(max(room, 0), entries, key=lambda e: e.population)
+
+            for e in entries:
+                place = GeoPlace(
+                    display_name=f"{e.name}, {e.country_code}" if e.country_code else e.name,
+                    lat=e.lat,
+                    lon=e.lon,
+                    country=e.country_code or None,
+                    city=e.name,
+                    state=None,
+                    raw={"source": "gazetteer", "population": e.population},
+                )
+                popularity = math.log10(e.population + 1)
+                pid = self._place_id(place)
+                entry = self._places.get(pid)
+                if entry is not None:
+                    entry.popularity += popularity
+                    continue
+                entry = self._places[pid] = _Entry(place=place, popularity=popularity, keys=_index_keys(place), seeded=True)
+                self._seed_keys.extend((key, pid) for key in entry.keys)
+            self._seed_keys.sort()
+            self._rebuild_memo_locked()
+
+    def _rebuild_memo_locked(self) -> None:
+        self._memo.clear()
+        keys = sorted(self._seed_keys + self._resolved_keys)
+        for n in range(1, _MEMO_PREFIX_LEN + 1):
+            for prefix, group in itertools.groupby(keys, key=lambda item: item[0][:n]):
+                pids = {pid for _, pid in group}
+                if len(pids) > _MEMO_MIN_RANGE:
+                    self._memo[prefix] = heapq.nsmallest(_MEMO_TOP, pids, key=self._rank)
+
+    def suggest(self, prefix: str, *, limit: int = 5) -> list[GeoPlace]:
+        query = normalize_name(prefix)
+        if not query:
+            return []
+
+        with self._lock:
+            best = self._memo.get(query)
+            if best is None or limit > _MEMO_TOP:
+                best = self._rank_locked(query, max(limit, _MEMO_TOP))
+            return [self._places[pid].place for pid in best[:limit]]
+
+    def _rank_locked(self, query: str, limit: int) -> list[PlaceId]:
+        matched: set[PlaceId] = set()
+        for keys in (self._seed_keys, self._resolved_keys):
+            start = bisect_left(keys, (query,))
+            end = bisect_left(keys, (query + _PREFIX_END,), lo=start)
+            matched.update(pid for _, pid in keys[start:end])
+
+        places = self._places
+        best = [pid for _, pid in heapq.nsmallest(limit, ((-places[pid].popularity, pid) for pid in matched))]
+        if len(matched) > _MEMO_MIN_RANGE and limit == _MEMO_TOP:
+            self._memo[query] = best
+        return best
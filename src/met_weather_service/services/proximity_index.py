@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import math
+import threading
+from typing import Iterable
+
+EARTH_RADIUS_M = 6_371_008.8
+
+_METRES_PER_DEG_LAT = math.pi * EARTH_RADIUS_M / 180.0
+
+Point = tuple[float, float]
+
+
+def haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    dphi = phi2 - phi1
+    dlam = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlam / 2) ** 2
+    return 2.0 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(a)))
+
+
+class ProximityIndex:
+    """
+    Thread-safe grid index answering "which stored points lie within radius_m".
+
+    The sphere is cut into cells radius_m tall (and as many degrees wide), so a
+    query only inspects its own row and the two neighbouring rows. Rows hold
+    a sparse {column: points} dict; columns wrap at the antimeridian, and near
+    the poles, where a cell gets narrow, the whole row is scanned.
+    """
+
+    def __init__(self, radius_m: float) -> None:
+        if radius_m <= 0:
+            raise ValueError("radius_m must be positive")
+
+        self.radius_m = float(radius_m)
+        self._cell_deg = min(self.radius_m / _METRES_PER_DEG_LAT, 180.0)
+        self._n_cols = max(1, math.ceil(360.0 / self._cell_deg))
+        self._lock = threading.Lock()
+        self._rows: dict[int, dict[int, set[Point]]] = {}
+        self._size = 0
+
+    def _cell(self, lat: float, lon: float) -> tuple[int, int]:
+        row = math.floor((lat + 90.0) / self._cell_deg)
+        col = math.floor((lon + 180.0) / self._cell_deg) % self._n_cols
+        return row, col
+
+    def add(self, point: Point) -> None:
+        row, col = self._cell(*point)
+        with self._lock:
+            cell = self._rows.setdefault(row, {}).setdefault(col, set())
+            if point not in cell:
+                cell.add(point)
+                self._size += 1
+
+    def discard(self, point: Point) -> None:
+        row, col = self._cell(*point)
+        with self._lock:
+            cols = self._rows.get(row)
+            cell = cols.get(col) if cols is not None else None
+            if cell is None or point not in cell:
+                return
+            cell.remove(point)
+            self._size -= 1
+            if not cell:
+                del cols[col]
+                if not cols:
+                    del self._rows[row]
+
+    def rebuild(self, points: Iterable[Point]) -> None:
+        with self._lock:
+            self._rows.clear()
+            self._size = 0
+        for point in points:
+            self.add(point)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._rows.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._size
+
+    def within(self, lat: float, lon: float) -> list[tuple[float, Point]]:
+        """
+        Stored points within radius_m of (lat, lon) as (distance_m, point), nearest first.
+        """
+        row, col = self._cell(lat, lon)
+
+        # widest row in the band decides how many columns radius_m can span
+        edge_lat = min(90.0, abs(lat) + self._cell_deg)
+        cos_edge = math.cos(math.radians(edge_lat))
+        span = math.ceil(1.0 / cos_edge) if cos_edge > 1e-9 else self._n_cols
+
+        candidates: list[Point] = []
+        with self._lock:
+            for r in (row - 1, row, row + 1):
+                cols = self._rows.get(r)
+                if not cols:
+                    continue
+                if 2 * span + 1 >= min(len(cols), self._n_cols):
+                    for cell in cols.values():
+                        candidates.extend(cell)
+                else:
+                    for c in range(col - span, col + span + 1):
+                        cell = cols.get(c % self._n_cols)
+                        if cell:
+                            candidates.extend(cell)
+
+        found = []
+        for point in candidates:
+            d = haversine_m(lat, lon, point[0], point[1])
+            if d <= self.radius_m:
+                found.append((d, point))
+        found.sort()
+        return found
@@ -1,32 +1,264 @@
 from __future__ import annotations
 
+import asyncio
+import logging
+import mmap
+import os
+import struct
+import tempfile
 import threading
 import time
-from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator
 
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None
 
-class SlidingWindowRateLimiter:
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _BucketState:
+    tokens: float
+    updated: float  # time.monotonic(); 0.0 means not initialized yet
+
+
+# Priority classes: interactive requests may use every token and wait for the
+# next one; background and health work only take tokens above the reserve and
+# never wait, so they get whatever interactive traffic leaves over.
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_BACKGROUND = "background"
+PRIORITY_HEALTH = "health"
+PRIORITIES = (PRIORITY_INTERACTIVE, PRIORITY_BACKGROUND, PRIORITY_HEALTH)
+
+
+class TokenBucketRateLimiter:
     """
-    Simple per-process sliding-window limiter.
+    O(1)-memory token bucket with FIFO waiting (GCRA-style reservations).
+
+    Holds up to max_calls tokens, refilled at max_calls / period_s per second.
+    A caller takes a token if one is available; otherwise acquire()/aacquire()
+    reserve the next token (the balance goes negative) and sleep until it is
+    due. Reservations are handed out in arrival order, so wakeups are FIFO
+    without a condition variable. A caller is rejected without reserving if its
+    slot is further than timeout away or max_waiters callers are already waiting.
 
-    allow() returns True if action is allowed now, otherwise False.
+    reserved tokens are kept for PRIORITY_INTERACTIVE: other priorities are
+    rejected unless a token is left above the reserve, and they never wait.
     """
-    def __init__(self, max_calls: int, period_s: float) -> None:
-        self._max_calls = max_calls
-        self._period_s = period_s
+
+    def __init__(self, max_calls: int, period_s: float, *, max_waiters: int = 100, reserved: int = 0) -> None:
+        self._capacity = float(max_calls)
+        self._rate = max_calls / period_s
+        self._max_waiters = max_waiters
+        self._reserved = float(min(reserved, max(max_calls - 1, 0)))
         self._lock = threading.Lock()
-        self._events: deque[float] = deque()
+        self._bucket = _BucketState(tokens=self._capacity, updated=time.monotonic())
+        self._waiting = 0
+        self._counters = {p: {"granted": 0, "delayed": 0, "rejected": 0} for p in PRIORITIES}
+
+    @contextmanager
+    def _state(self) -> Iterator[_BucketState]:
+        """
+        Exclusive access to the bucket state (overridden by shared backends).
+        """
+        with self._lock:
+            yield self._bucket
+
+    def _refill(self, state: _BucketState, now: float) -> None:
+        # A timestamp from the future was written under another clock (the
+        # shared file outlived a reboot): start over instead of draining the bucket.
+        if state.updated == 0.0 or state.updated > now:
+            state.tokens = self._capacity
+        else:
+            state.tokens = min(self._capacity, state.tokens + max(0.0, now - state.updated) * self._rate)
+        state.updated = now
+
+    def _reserve(self, timeout: float, priority: str) -> float | None:
+        """
+        Take or reserve one token. Returns seconds to wait, or None if rejected.
+        """
+        counters = self._counters[priority]
+
+        with self._state() as state:
+            self._refill(state, time.monotonic())
+
+            if priority != PRIORITY_INTERACTIVE:
+                if state.tokens - 1.0 >= self._reserved:
+                    state.tokens -= 1.0
+                    counters["granted"] += 1
+                    return 0.0
+                counters["rejected"] += 1
+                return None
+
+            if state.tokens >= 1.0:
+                state.tokens -= 1.0
+                counters["granted"] += 1
+                return 0.0
+
+            wait_s = (1.0 - state.tokens) / self._rate
+            if wait_s > timeout or self._waiting >= self._max_waiters:
+                counters["rejected"] += 1
+                return None
+
+            state.tokens -= 1.0
+            self._waiting += 1
+            counters["delayed"] += 1
+            return wait_s
+
+    def _release_waiter(self, *, refund: bool = False) -> None:
+        if not refund:
+            with self._lock:
+                self._waiting -= 1
+            return
+
+        # an abandoned reservation returns its token to those behind it
+        with self._state() as state:
+            self._waiting -= 1
+            self._refill(state, time.monotonic())
+            state.tokens = min(self._capacity, state.tokens + 1.0)
+
+    def allow(self, priority: str = PRIORITY_INTERACTIVE) -> bool:
+        return self._reserve(0.0, priority) is not None
 
-    def allow(self) -> bool:
-        now = time.monotonic()
-        cutoff = now - self._period_s
+    def acquire(self, timeout: float = 0.0, *, priority: str = PRIORITY_INTERACTIVE) -> bool:
+        """
+        Wait up to timeout seconds for a token (blocking). Returns False if rejected.
 
+        An interrupted waiter (e.g. KeyboardInterrupt) gives its reserved token back.
+        """
+        wait_s = self._reserve(timeout, priority)
+        if wait_s is None:
+            return False
+        if wait_s > 0:
+            try:
+                time.sleep(wait_s)
+            except BaseException:
+                self._release_waiter(refund=True)
+                raise
+            self._release_waiter()
+        return True
+
+    async def aacquire(self, timeout: float = 0.0, *, priority: str = PRIORITY_INTERACTIVE) -> bool:
+        """
+        Async acquire(); a cancelled waiter gives its reserved token back.
+        """
+        wait_s = self._reserve(timeout, priority)
+        if wait_s is None:
+            return False
+        if wait_s > 0:
+            try:
+                await asyncio.sleep(wait_s)
+            except asyncio.CancelledError:
+                self._release_waiter(refund=True)
+                raise
+            self._release_waiter()
+        return True
+
+    def stats(self) -> dict[str, Any]:
+        with self._state() as state:
+            self._refill(state, time.monotonic())
+            by_priority = {p: dict(c) for p, c in self._counters.items()}
+            return {
+                "tokens": state.tokens,
+                "reserved": self._reserved,
+                "waiting": self._waiting,
+                "granted": sum(c["granted"] for c in by_priority.values()),
+                "delayed": sum(c["delayed"] for c in by_priority.values()),
+                "rejected": sum(c["rejected"] for c in by_priority.values()),
+                "by_priority": by_priority,
+            }
+
+
+_STATE_FORMAT = struct.Struct("<dd")
+
+
+class SharedTokenBucketRateLimiter(TokenBucketRateLimiter):
+    """
+    TokenBucketRateLimiter whose bucket lives in a memory-mapped file, so all
+    worker processes on a host that use the same path share one budget.
+
+    Each operation takes an flock on the file and reads/writes 16 bytes through
+    the mapping (a few microseconds). time.monotonic() is system-wide on Linux,
+    so timestamps are comparable across processes. Waiter counts and counters
+    stay per process. Requires fcntl (POSIX).
+    """
+
+    def __init__(
+            self,
+            path: str,
+            max_calls: int,
+            period_s: float,
+            *,
+            max_waiters: int = 100,
+            reserved: int = 0,
+    ) -> None:
+        if fcntl is None:
+            raise RuntimeError("Shared rate limiter requires fcntl (POSIX)")
+
+        super().__init__(max_calls, period_s, max_waiters=max_waiters, reserved=reserved)
+        self.path = path
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(self._fd).st_size < _STATE_FORMAT.size:
+                # zero-filled state = not initialized; the first caller fills the bucket
+                os.ftruncate(self._fd, _STATE_FORMAT.size)
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        self._map = mmap.mmap(self._fd, _STATE_FORMAT.size)
+
+    @contextmanager
+    def _state(self) -> Iterator[_BucketState]:
+        with self._lock:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                state = _BucketState(*_STATE_FORMAT.unpack_from(self._map))
+                yield state
+                _STATE_FORMAT.pack_into(self._map, 0, state.tokens, state.updated)
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def close(self) -> None:
         with self._lock:
-            while self._events and self._events[0] <= cutoff:
-                self._events.popleft()
+            if self._map.closed:
+                return
+            self._map.close()
+            os.close(self._fd)
 
-            if len(self._events) >= self._max_calls:
-                return False
+    def __del__(self) -> None:
+        # limiters replaced after a config change are simply dropped by the gateways
+        if getattr(self, "_map", None) is not None:
+            self.close()
+
+
+def create_rate_limiter(
+        name: str,
+        max_calls: int,
+        period_s: float,
+        *,
+        max_waiters: int = 100,
+        reserved: int = 0,
+        backend: str = "memory",
+        directory: str = "",
+) -> TokenBucketRateLimiter:
+    """
+    Build the limiter for an upstream. backend "file" shares the budget between
+    processes through <directory>/<name>.bucket; "memory" is per process.
+    """
+    if backend == "file":
+        if fcntl is None:
+            logger.warning("RATE_LIMIT_BACKEND=file is not supported on this platform, using per-process limiter")
+        else:
+            path = os.path.join(directory or os.path.join(tempfile.gettempdir(), "met-weather-service"), f"{name}.bucket")
+            return SharedTokenBucketRateLimiter(path, max_calls, period_s, max_waiters=max_waiters, reserved=reserved)
+    elif backend != "memory":
+        logger.warning("Unknown RATE_LIMIT_BACKEND=%s, using per-process limiter", backend)
 
-            self._events.append(now)
-            return True
+    return TokenBucketRateLimiter(max_calls, period_s, max_waiters=max_waiters, reserved=reserved)
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class _LeaderAborted(Exception):
+    """
+    The leader was cancelled or interrupted; a waiter takes over the call.
+    """
+
+
+def _copy_exception(exc: Exception) -> Exception:
+    """
+    Per-waiter copy of a shared exception, so concurrent raises do not splice
+    their tracebacks into one instance (falls back to clearing the traceback).
+    """
+    try:
+        clone = type(exc).__new__(type(exc), *exc.args)
+        clone.args = exc.args
+        clone.__dict__.update(exc.__dict__)
+    except Exception:
+        return exc.with_traceback(None)
+    clone.__cause__ = exc.__cause__
+    clone.__suppress_context__ = exc.__suppress_context__
+    return clone
+
+
+class SingleFlight(Generic[T]):
+    """
+    Per-key in-flight call deduplication.
+
+    The first caller for a key (the leader) runs the call; callers arriving while
+    it is in flight wait for and share its result or exception. Works across
+    threads and event loops because the shared state is a concurrent Future.
+
+    Only Exception subclasses are shared, and each waiter raises its own copy.
+    If the leader is cancelled or interrupted (CancelledError, KeyboardInterrupt,
+    ...), the key is dropped and the waiters rejoin, so one of them becomes the
+    new leader.
+
+    Note: a sync do() must not be called from an event loop thread while an async
+    leader for the same key runs on that loop (it would block the loop).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, Future[T]] = {}
+        self._leaders = 0
+        self._coalesced = 0
+
+    def _join(self, key: Hashable) -> tuple[Future[T], bool]:
+        with self._lock:
+            fut = self._calls.get(key)
+            if fut is not None:
+                self._coalesced += 1
+                return fut, False
+
+            fut = Future()
+            self._calls[key] = fut
+            self._leaders += 1
+            return fut, True
+
+    def _finish(self, key: Hashable) -> None:
+        with self._lock:
+            self._calls.pop(key, None)
+
+    def _settle_error(self, key: Hashable, fut: Future[T], exc: BaseException) -> None:
+        self._finish(key)
+        fut.set_exception(exc if isinstance(exc, Exception) else _LeaderAborted())
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        while True:
+            fut, leader = self._join(key)
+            if leader:
+                break
+            try:
+                return fut.result()
+            except _LeaderAborted:
+                continue
+            except Exception as exc:
+                error = _copy_exception(exc)
+            raise error
+
+        try:
+            result = fn()
+        except BaseException as exc:
+            self._settle_error(key, fut, exc)
+            raise
+
+        self._finish(key)
+        fut.set_result(result)
+        return result
+
+    async def ado(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        while True:
+            fut, leader = self._join(key)
+            if leader:
+                break
+            try:
+                # shield: a cancelled follower must not cancel the shared call
+                return await asyncio.shield(asyncio.wrap_future(fut))
+            except _LeaderAborted:
+                continue
+            except Exception as exc:
+                error = _copy_exception(exc)
+            raise error
+
+        try:
+            result = await fn()
+        except BaseException as exc:
+            self._settle_error(key, fut, exc)
+            raise
+
+        self._finish(key)
+        fut.set_result(result)
+        return result
+
+    def is_running(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._calls
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "leaders": self._leaders,
+                "coalesced": self._coalesced,
+                "in_flight": len(self._calls),
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._leaders = 0
+            self._coalesced = 0
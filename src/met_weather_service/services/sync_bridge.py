@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import asyncio
+import atexit
+import threading
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+from met_weather_service.services.http_client import aclose_http_client
+
+T = TypeVar("T")
+
+_lock = threading.Lock()
+_loop: asyncio.AbstractEventLoop | None = None
+_thread: threading.Thread | None = None
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    global _loop, _thread
+
+    with _lock:
+        if _loop is None or _thread is None or not _thread.is_alive():
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="sync-bridge", daemon=True)
+            thread.start()
+            _loop, _thread = loop, thread
+        return _loop
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run an async service call from sync code (tests, scripts) and return its result.
+
+    All sync callers share one long-lived loop in a background thread, so the
+    async implementation keeps its pooled AsyncClient, single-flight and
+    background revalidation tasks between calls. Blocks the calling thread;
+    async code should await the coroutine instead.
+    """
+    loop = _get_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError("run_sync() cannot be called from the sync bridge loop")
+
+    future = asyncio.run_coroutine_threadsafe(coro, loop)
+    try:
+        return future.result()
+    except BaseException:
+        # interrupted (e.g. KeyboardInterrupt): don't leave the call running
+        future.cancel()
+        raise
+
+
+def close_sync_bridge() -> None:
+    """
+    Close the bridge loop's pooled HTTP client and stop the loop (if it was started).
+    """
+    global _loop, _thread
+
+    with _lock:
+        loop, thread = _loop, _thread
+        _loop = _thread = None
+    if loop is None or thread is None:
+        return
+
+    if thread.is_alive():
+        asyncio.run_coroutine_threadsafe(aclose_http_client(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+    loop.close()
+
+
+atexit.register(close_sync_bridge)
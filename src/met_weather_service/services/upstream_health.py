@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+
+
+class UpstreamHealth:
+    """
+    Passive upstream health: outcomes of the last max_samples real upstream calls.
+
+    Only calls that reached (or tried to reach) the upstream are recorded, so
+    cache hits and rate-limit rejections do not move the error rate.
+    """
+
+    def __init__(self, max_samples: int = 256) -> None:
+        self._lock = threading.Lock()
+        self._samples: deque[tuple[float, bool]] = deque(maxlen=max_samples)
+        self._last_success_at: float | None = None
+        self._last_error_at: float | None = None
+
+    def record_success(self, now: float | None = None) -> None:
+        now = time.time() if now is None else now
+        with self._lock:
+            self._samples.append((now, True))
+            self._last_success_at = now
+
+    def record_error(self, now: float | None = None) -> None:
+        now = time.time() if now is None else now
+        with self._lock:
+            self._samples.append((now, False))
+            self._last_error_at = now
+
+    def clear(self) -> None:
+        with self._lock:
+            self._samples.clear()
+            self._last_success_at = None
+            self._last_error_at = None
+
+    def snapshot(self, window_s: float, now: float | None = None) -> dict[str, float | int | None]:
+        """
+        Last success/error times and the error rate over the last window_s seconds.
+        """
+        now = time.time() if now is None else now
+        cutoff = now - window_s
+
+        with self._lock:
+            recent = [ok for ts, ok in self._samples if ts >= cutoff]
+            errors = recent.count(False)
+            return {
+                "last_success_at": self._last_success_at,
+                "last_error_at": self._last_error_at,
+                "recent_calls": len(recent),
+                "recent_errors": errors,
+                "error_rate": errors / len(recent) if recent else 0.0,
+            }
@@ -160,6 +160,31 @@ async function onSearch() {
     }
 }
 
+let suggestTimer = null;
+let suggestSeq = 0;
+
+function onPlaceInput() {
+    clearTimeout(suggestTimer);
+    const q = $("place").value.trim();
+    if (!q) {
+        $("geocodeResults").innerHTML = "";
+        return;
+    }
+
+    // local index only, so a short debounce is enough
+    suggestTimer = setTimeout(async () => {
+        const seq = ++suggestSeq;
+        try {
+            const data = await fetchJson(`/v1/geocode/suggest?q=${encodeURIComponent(q)}&limit=5`);
+            if (seq === suggestSeq && data.results && data.results.length > 0) {
+                renderGeocodeResults(data.results);
+            }
+        } catch (e) {
+            // suggestions are best-effort; "Search place" still queries the geocoder
+        }
+    }, 150);
+}
+
 async function onForecast() {
     clearMessages();
 
@@ -202,4 +227,5 @@ document.addEventListener("DOMContentLoaded", () => {
     $("btnSearch").addEventListener("click", onSearch);
     $("btnForecast").addEventListener("click", onForecast);
     $("btnClearPlace").addEventListener("click", onClearPlace);
+    $("place").addEventListener("input", onPlaceInput);
 });
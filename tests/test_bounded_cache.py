@@ -0,0 +1,48 @@
+from met_weather_service.services.bounded_cache import BoundedCache
+
+
+def test_lru_eviction_by_entry_count() -> None:
+    cache: BoundedCache[str, int] = BoundedCache("test", max_entries=2)
+    cache.set("a", 1, evict_at=100.0, size=10)
+    cache.set("b", 2, evict_at=100.0, size=10)
+
+    assert cache.get("a", now=0.0) == 1  # "b" becomes least recently used
+    cache.set("c", 3, evict_at=100.0, size=10)
+
+    assert cache.get("b", now=0.0) is None
+    assert cache.get("a", now=0.0) == 1
+    assert cache.get("c", now=0.0) == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_byte_budget_and_expiry_sweep() -> None:
+    cache: BoundedCache[str, str] = BoundedCache("test", max_entries=0, max_bytes=100)
+    cache.set("a", "x", evict_at=10.0, size=60)
+    cache.set("b", "y", evict_at=50.0, size=60)
+
+    stats = cache.stats()
+    assert stats["entries"] == 1
+    assert stats["bytes"] == 60
+
+    cache.set("c", "z", evict_at=10.0, size=30)
+    assert cache.get("c", now=20.0) is None  # past evict_at counts as a miss
+
+    assert cache.sweep(now=20.0) == 1
+    stats = cache.stats()
+    assert stats["entries"] == 1
+    assert stats["bytes"] == 60
+    assert stats["misses"] == 1
+
+
+def test_resize_updates_byte_budget() -> None:
+    cache: BoundedCache[str, str] = BoundedCache("test", max_entries=0, max_bytes=100)
+    cache.set("a", "x", evict_at=100.0, size=40)
+    cache.set("b", "y", evict_at=100.0, size=40)
+
+    cache.resize("b", 50)
+    assert cache.stats()["bytes"] == 90
+
+    # growing past the budget evicts the least recently used item
+    cache.resize("b", 70)
+    assert cache.get("a", now=0.0) is None
+    assert cache.stats()["bytes"] == 70
@@ -0,0 +1,170 @@
+import asyncio
+import json
+
+import httpx
+import respx
+from fastapi.testclient import TestClient
+
+from met_weather_service.core.config import get_settings
+from met_weather_service.main import app
+from met_weather_service.services import met_gateway
+
+MET_URL = "https://api.met.no/weatherapi/locationforecast/2.0/compact"
+
+
+def _payload() -> dict:
+    return {
+        "properties": {
+            "timeseries": [
+                {"time": "2026-01-26T13:00:00Z", "data": {"instant": {"details": {"air_temperature": 2.0}}}},
+                {"time": "2026-01-27T13:00:00Z", "data": {"instant": {"details": {"air_temperature": 4.0}}}},
+            ],
+        }
+    }
+
+
+@respx.mock
+def test_batch_dedupes_locations_and_reports_item_errors() -> None:
+    met_gateway.clear_cache()
+    route = respx.get(MET_URL).mock(return_value=httpx.Response(200, json=_payload()))
+
+    client = TestClient(app)
+    resp = client.post(
+        "/v1/forecast/batch",
+        json={
+            "items": [
+                {"lat": 44.81259, "lon": 20.46129},
+                {"lat": 44.8125, "lon": 20.4612, "tz": "UTC", "at": "13:00"},
+                {"lat": 44.8125, "lon": 20.4612, "tz": "Not/AZone"},
+            ]
+        },
+    )
+
+    assert resp.status_code == 200
+    results = resp.json()["results"]
+
+    assert len(route.calls) == 1
+    assert [r["index"] for r in results] == [0, 1, 2]
+
+    assert results[0]["location"]["lat"] == 44.8125
+    assert [d["temperature_c"] for d in results[0]["days"]] == [2.0, 4.0]
+    assert results[1]["location"]["timezone"] == "UTC"
+    assert results[1]["days"][0]["time"] == "2026-01-26T13:00:00+00:00"
+
+    assert results[2]["days"] is None
+    assert results[2]["error"] == {"status": 422, "detail": "timezone not available"}
+
+
+@respx.mock
+def test_batch_upstream_error_is_per_item() -> None:
+    met_gateway.clear_cache()
+    respx.get(MET_URL, params={"lat": "44.8125", "lon": "20.4612"}).mock(
+        return_value=httpx.Response(200, json=_payload())
+    )
+    respx.get(MET_URL, params={"lat": "45.0", "lon": "19.0"}).mock(return_value=httpx.Response(503))
+
+    client = TestClient(app)
+    resp = client.post(
+        "/v1/forecast/batch",
+        json={"items": [{"lat": 44.8125, "lon": 20.4612}, {"lat": 45.0, "lon": 19.0}]},
+    )
+
+    assert resp.status_code == 200
+    ok, failed = resp.json()["results"]
+    assert ok["error"] is None
+    assert failed["error"] == {"status": 502, "detail": "MET upstream error"}
+
+
+@respx.mock
+def test_batch_does_not_fetch_locations_of_invalid_items() -> None:
+    met_gateway.clear_cache()
+    route = respx.get(MET_URL).mock(return_value=httpx.Response(200, json=_payload()))
+
+    client = TestClient(app)
+    resp = client.post(
+        "/v1/forecast/batch",
+        json={
+            "items": [
+                {"lat": 44.8125, "lon": 20.4612},
+                {"lat": 45.0, "lon": 19.0, "at": "25:00"},
+                {"lat": 46.0, "lon": 18.0, "tz": "Not/AZone"},
+            ]
+        },
+    )
+
+    assert resp.status_code == 200
+    ok, bad_at, bad_tz = resp.json()["results"]
+    assert ok["error"] is None
+    assert bad_at["error"]["status"] == 422
+    assert bad_tz["error"] == {"status": 422, "detail": "timezone not available"}
+    assert [dict(c.request.url.params) for c in route.calls] == [{"lat": "44.8125", "lon": "20.4612"}]
+
+
+def test_batch_rejects_too_many_items(monkeypatch) -> None:
+    monkeypatch.setenv("FORECAST_BATCH_MAX_ITEMS", "2")
+    get_settings.cache_clear()
+
+    client = TestClient(app)
+    resp = client.post(
+        "/v1/forecast/batch",
+        json={"items": [{"lat": 1.0, "lon": 1.0}] * 3},
+    )
+
+    assert resp.status_code == 422
+
+
+@respx.mock
+def test_stream_emits_one_line_per_item() -> None:
+    met_gateway.clear_cache()
+    route = respx.get(MET_URL).mock(return_value=httpx.Response(200, json=_payload()))
+
+    client = TestClient(app)
+    resp = client.post(
+        "/v1/forecast/stream",
+        json={
+            "items": [
+                {"lat": 44.8125, "lon": 20.4612},
+                {"lat": 44.8125, "lon": 20.4612, "at": "99:00"},
+                {"lat": 45.0, "lon": 19.0, "at": "08:00,20:00"},
+                {"lat": 44.81259, "lon": 20.46129},
+            ]
+        },
+    )
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    assert len(route.calls) == 2
+
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    by_index = {line["index"]: line for line in lines}
+
+    assert sorted(by_index) == [0, 1, 2, 3]
+    # validation errors do not wait for upstream
+    assert lines[0]["index"] == 1
+    assert by_index[1]["error"]["status"] == 422
+    assert by_index[0]["days"] == by_index[3]["days"]
+    assert [t["at"] for t in by_index[2]["days_multi"][0]["targets"]] == ["08:00", "20:00"]
+
+
+@respx.mock
+def test_closing_stream_early_waits_for_cancelled_workers(monkeypatch) -> None:
+    met_gateway.clear_cache()
+    monkeypatch.setenv("MET_RL_MAX_CALLS", "100")
+    get_settings.cache_clear()
+
+    async def slow_response(request: httpx.Request) -> httpx.Response:
+        if request.url.params["lat"] != "1.0":
+            await asyncio.sleep(10)
+        return httpx.Response(200, json=_payload())
+
+    respx.get(MET_URL).mock(side_effect=slow_response)
+
+    async def run() -> set[asyncio.Task]:
+        coords = [(1.0, 1.0), (2.0, 2.0), (3.0, 3.0)]
+        results = met_gateway.aiter_locationforecast_compact_results(coords, concurrency=3)
+        key, _ = await anext(results)
+        assert key == (1.0, 1.0)
+        await results.aclose()
+        return asyncio.all_tasks() - {asyncio.current_task()}
+
+    assert asyncio.run(run()) == set()
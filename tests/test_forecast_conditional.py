@@ -0,0 +1,118 @@
+import time
+from types import SimpleNamespace
+
+import httpx
+import respx
+from fastapi.testclient import TestClient
+
+from met_weather_service.core.config import get_settings
+from met_weather_service.main import app
+from met_weather_service.api import forecast
+from met_weather_service.services import geocoder_gateway, met_gateway
+
+MET_URL = "https://api.met.no/weatherapi/locationforecast/2.0/compact"
+NOMINATIM = "https://nominatim.openstreetmap.org"
+LAST_MODIFIED = "Mon, 26 Jan 2026 11:00:00 GMT"
+
+
+def _payload() -> dict:
+    return {
+        "properties": {
+            "timeseries": [
+                {"time": "2026-01-26T13:00:00Z", "data": {"instant": {"details": {"air_temperature": 2.0}}}},
+            ],
+        }
+    }
+
+
+def _setup(monkeypatch) -> TestClient:
+    met_gateway.clear_cache()
+    monkeypatch.setenv("MET_CACHE_TTL_S", "300")
+    get_settings.cache_clear()
+    # freeze wall time only where cache expiry and max-age are computed
+    clock = SimpleNamespace(time=lambda: 1000.0, monotonic=time.monotonic)
+    monkeypatch.setattr(met_gateway, "time", clock)
+    monkeypatch.setattr(forecast, "time_module", clock)
+    respx.get(MET_URL).mock(
+        return_value=httpx.Response(200, json=_payload(), headers={"Last-Modified": LAST_MODIFIED})
+    )
+    return TestClient(app)
+
+
+@respx.mock
+def test_forecast_sets_validators_and_honors_if_none_match(monkeypatch) -> None:
+    client = _setup(monkeypatch)
+    params = {"lat": 44.8125, "lon": 20.4612, "at": "14:00"}
+
+    first = client.get("/v1/forecast", params=params)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert etag.startswith('"') and etag.endswith('"')
+    assert first.headers["Last-Modified"] == LAST_MODIFIED
+    assert first.headers["Cache-Control"] == "public, max-age=300"
+
+    again = client.get("/v1/forecast", params=params, headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["ETag"] == etag
+
+    # other request parameters -> other representation
+    other = client.get("/v1/forecast", params={**params, "at": "15:00"}, headers={"If-None-Match": etag})
+    assert other.status_code == 200
+    assert other.headers["ETag"] != etag
+
+
+@respx.mock
+def test_forecast_honors_if_modified_since(monkeypatch) -> None:
+    client = _setup(monkeypatch)
+
+    not_modified = client.get("/v1/forecast", headers={"If-Modified-Since": LAST_MODIFIED})
+    assert not_modified.status_code == 304
+
+    older = client.get("/v1/forecast", headers={"If-Modified-Since": "Mon, 26 Jan 2026 10:00:00 GMT"})
+    assert older.status_code == 200
+
+    # If-None-Match takes precedence
+    mismatch = client.get(
+        "/v1/forecast",
+        headers={"If-None-Match": '"other"', "If-Modified-Since": LAST_MODIFIED},
+    )
+    assert mismatch.status_code == 200
+
+
+@respx.mock
+def test_forecast_etag_same_for_both_serializers(monkeypatch) -> None:
+    client = _setup(monkeypatch)
+    fast = client.get("/v1/forecast")
+
+    monkeypatch.setenv("FORECAST_FAST_JSON", "0")
+    get_settings.cache_clear()
+    slow = client.get("/v1/forecast", headers={"If-None-Match": fast.headers["ETag"]})
+
+    assert slow.status_code == 304
+    assert client.get("/v1/forecast").headers["ETag"] == fast.headers["ETag"]
+
+
+@respx.mock
+def test_forecast_ignores_if_modified_since_with_include_place(monkeypatch) -> None:
+    client = _setup(monkeypatch)
+    geocoder_gateway.clear_cache()
+    monkeypatch.setenv("GEOCODER_BASE_URL", NOMINATIM)
+    monkeypatch.setenv("GEOCODER_RL_MAX_CALLS", "10")
+    monkeypatch.setenv("GEOCODER_RL_PERIOD_S", "1")
+    get_settings.cache_clear()
+    respx.get(f"{NOMINATIM}/reverse").mock(
+        return_value=httpx.Response(
+            200,
+            json={"display_name": "Belgrade, Serbia", "lat": "44.8125", "lon": "20.4612", "address": {"city": "Belgrade"}},
+        )
+    )
+
+    params = {"include_place": "true"}
+    r = client.get("/v1/forecast", params=params, headers={"If-Modified-Since": LAST_MODIFIED})
+    assert r.status_code == 200
+    assert r.json()["location"]["city"] == "Belgrade"
+
+    # the ETag covers the place name, so it still validates
+    etag = r.headers["ETag"]
+    assert client.get("/v1/forecast", params=params, headers={"If-None-Match": etag}).status_code == 304
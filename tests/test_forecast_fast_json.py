@@ -0,0 +1,47 @@
+import httpx
+import pytest
+import respx
+from fastapi.testclient import TestClient
+
+from met_weather_service.core import fast_json
+from met_weather_service.core.config import get_settings
+from met_weather_service.main import app
+from met_weather_service.services import met_gateway
+
+MET_URL = "https://api.met.no/weatherapi/locationforecast/2.0/compact"
+
+
+def _payload() -> dict:
+    return {
+        "properties": {
+            "timeseries": [
+                {"time": "2026-01-26T07:00:00Z", "data": {"instant": {"details": {"air_temperature": -1.5}}}},
+                {"time": "2026-01-26T13:00:00Z", "data": {"instant": {"details": {"air_temperature": 2.0}}}},
+                {"time": "2026-01-27T13:00:00Z", "data": {"instant": {"details": {"air_temperature": 4.25}}}},
+            ],
+        }
+    }
+
+
+def _get(monkeypatch, fast: bool, at: str) -> httpx.Response:
+    monkeypatch.setenv("FORECAST_FAST_JSON", "1" if fast else "0")
+    get_settings.cache_clear()
+    return TestClient(app).get("/v1/forecast", params={"lat": 44.8125, "lon": 20.4612, "at": at})
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+@pytest.mark.parametrize("at", ["14:00", "08:00,14:00"])
+@respx.mock
+def test_fast_json_matches_model_serialization(monkeypatch, use_orjson: bool, at: str) -> None:
+    met_gateway.clear_cache()
+    respx.get(MET_URL).mock(return_value=httpx.Response(200, json=_payload()))
+    if not use_orjson:
+        monkeypatch.setattr(fast_json, "_orjson", None)
+
+    fast = _get(monkeypatch, True, at)
+    slow = _get(monkeypatch, False, at)
+
+    assert fast.status_code == slow.status_code == 200
+    assert fast.headers["content-type"] == slow.headers["content-type"]
+    assert fast.json() == slow.json()
+    assert list(fast.json()["location"]) == list(slow.json()["location"])
@@ -0,0 +1,81 @@
+import httpx
+import respx
+from fastapi.testclient import TestClient
+
+from met_weather_service.core.config import get_settings
+from met_weather_service.main import app
+from met_weather_service.services import forecast_memo, met_gateway
+from met_weather_service.services.forecast import DailyTemperatureSelector
+
+MET_URL = "https://api.met.no/weatherapi/locationforecast/2.0/compact"
+
+
+def _payload(temp: float) -> dict:
+    return {
+        "properties": {
+            "timeseries": [
+                {"time": "2026-01-26T13:00:00Z", "data": {"instant": {"details": {"air_temperature": temp}}}},
+            ],
+        }
+    }
+
+
+@respx.mock
+def test_selection_is_memoized_until_upstream_body_changes(monkeypatch) -> None:
+    met_gateway.clear_cache()
+    forecast_memo.clear_memo()
+    monkeypatch.setenv("MET_CACHE_TTL_S", "300")
+    get_settings.cache_clear()
+
+    calls = {"n": 0}
+    original = DailyTemperatureSelector.select_from_series
+
+    def counting(self, series):
+        calls["n"] += 1
+        return original(self, series)
+
+    monkeypatch.setattr(DailyTemperatureSelector, "select_from_series", counting)
+
+    respx.get(MET_URL).mock(
+        side_effect=[
+            httpx.Response(200, json=_payload(2.0)),
+            httpx.Response(200, json=_payload(7.0)),
+        ]
+    )
+
+    client = TestClient(app)
+    r1 = client.get("/v1/forecast", params={"tz": "UTC", "at": "13:00"})
+    r2 = client.get("/v1/forecast", params={"tz": "UTC", "at": "13:00"})
+    assert r1.json() == r2.json()
+    assert calls["n"] == 1
+
+    # a different target time is a separate memo entry
+    client.get("/v1/forecast", params={"tz": "UTC", "at": "12:00"})
+    assert calls["n"] == 2
+
+    # a new upstream body invalidates the memo
+    met_gateway._cache.clear()
+    r3 = client.get("/v1/forecast", params={"tz": "UTC", "at": "13:00"})
+    assert r3.json()["days"][0]["temperature_c"] == 7.0
+    assert calls["n"] == 3
+
+
+@respx.mock
+def test_cached_entry_size_includes_local_timestamps(monkeypatch) -> None:
+    met_gateway.clear_cache()
+    forecast_memo.clear_memo()
+    monkeypatch.setenv("MET_CACHE_TTL_S", "300")
+    get_settings.cache_clear()
+    respx.get(MET_URL).mock(return_value=httpx.Response(200, json=_payload(2.0)))
+
+    client = TestClient(app)
+    client.get("/v1/forecast", params={"tz": "UTC", "at": "13:00"})
+    met = met_gateway.peek_locationforecast_compact_result(44.8125, 20.4612)
+    assert met_gateway.get_stats()["cache"]["bytes"] == len(met.content) + 2 * 8 * len(met.series)
+
+    # each tz adds local timestamps to the cached series; the next access accounts for them
+    client.get("/v1/forecast", params={"tz": "Asia/Tokyo", "at": "13:00"})
+    client.get("/v1/forecast", params={"tz": "Asia/Tokyo", "at": "13:00"})
+
+    assert met.series.nbytes == 4 * 8 * len(met.series)
+    assert met_gateway.get_stats()["cache"]["bytes"] == len(met.content) + met.series.nbytes
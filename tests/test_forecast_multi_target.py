@@ -0,0 +1,52 @@
+import httpx
+import respx
+from fastapi.testclient import TestClient
+
+from met_weather_service.main import app
+from met_weather_service.services import met_gateway
+
+MET_URL = "https://api.met.no/weatherapi/locationforecast/2.0/compact"
+
+
+def _payload() -> dict:
+    # Europe/Belgrade is UTC+1 in January
+    return {
+        "properties": {
+            "timeseries": [
+                {"time": f"2026-01-26T{h:02d}:00:00Z", "data": {"instant": {"details": {"air_temperature": float(h)}}}}
+                for h in range(0, 24)
+            ],
+        }
+    }
+
+
+@respx.mock
+def test_forecast_multiple_target_times() -> None:
+    met_gateway.clear_cache()
+    route = respx.get(MET_URL).mock(return_value=httpx.Response(200, json=_payload()))
+
+    client = TestClient(app)
+    resp = client.get("/v1/forecast", params={"lat": 44.8125, "lon": 20.4612, "at": "08:00,14:00,20:00"})
+
+    assert resp.status_code == 200
+    assert len(route.calls) == 1
+
+    body = resp.json()
+    assert body["location"]["target_time"] == "08:00,14:00,20:00"
+
+    assert body["days"] == []
+    day = body["days_multi"][0]
+    assert day["date"] == "2026-01-26"
+    assert [(t["at"], t["temperature_c"]) for t in day["targets"]] == [
+        ("08:00", 7.0),
+        ("14:00", 13.0),
+        ("20:00", 19.0),
+    ]
+
+
+def test_forecast_rejects_bad_target_time_lists() -> None:
+    client = TestClient(app)
+
+    for at in ("08:00,", "08:00,25:00", "08:00,08:00", "08:00;14:00"):
+        resp = client.get("/v1/forecast", params={"at": at})
+        assert resp.status_code == 422, at
@@ -0,0 +1,123 @@
+import asyncio
+import time
+
+import httpx
+import respx
+from fastapi.testclient import TestClient
+
+from met_weather_service import main
+from met_weather_service.api import forecast
+from met_weather_service.core.config import get_settings
+from met_weather_service.main import app
+from met_weather_service.services import geocoder_gateway, met_gateway
+
+MET_URL = "https://api.met.no/weatherapi/locationforecast/2.0/compact"
+NOMINATIM = "https://nominatim.openstreetmap.org"
+REVERSE_URL = f"{NOMINATIM}/reverse"
+
+_MET_PAYLOAD = {
+    "properties": {
+        "timeseries": [
+            {"time": "2026-01-26T13:00:00Z", "data": {"instant": {"details": {"air_temperature": 2.0}}}},
+        ],
+    }
+}
+
+_REVERSE_PAYLOAD = {
+    "display_name": "Belgrade, City of Belgrade, Central Serbia, Serbia",
+    "lat": "44.8125",
+    "lon": "20.4612",
+    "address": {"city": "Belgrade", "country": "Serbia"},
+}
+
+
+def _setup(monkeypatch, place_timeout_s: float) -> None:
+    met_gateway.clear_cache()
+    geocoder_gateway.clear_cache()
+    monkeypatch.setenv("MET_CACHE_TTL_S", "0")
+    monkeypatch.setenv("GEOCODER_BASE_URL", NOMINATIM)
+    monkeypatch.setenv("GEOCODER_CACHE_TTL_S", "3600")
+    monkeypatch.setenv("GEOCODER_RL_MAX_CALLS", "10")
+    monkeypatch.setenv("GEOCODER_RL_PERIOD_S", "1")
+    monkeypatch.setenv("FORECAST_PLACE_TIMEOUT_S", str(place_timeout_s))
+    get_settings.cache_clear()
+
+
+def _delayed(delay_s: float, json: object, spans: list[tuple[float, float]] | None = None):
+    async def respond(request: httpx.Request) -> httpx.Response:
+        started = time.monotonic()
+        await asyncio.sleep(delay_s)
+        if spans is not None:
+            spans.append((started, time.monotonic()))
+        return httpx.Response(200, json=json)
+
+    return respond
+
+
+def _wait_until(condition, timeout_s: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout_s
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+@respx.mock
+def test_place_lookup_overlaps_met_fetch(monkeypatch) -> None:
+    _setup(monkeypatch, place_timeout_s=5)
+    met_spans: list[tuple[float, float]] = []
+    place_spans: list[tuple[float, float]] = []
+    respx.get(MET_URL).mock(side_effect=_delayed(0.2, _MET_PAYLOAD, met_spans))
+    respx.get(REVERSE_URL).mock(side_effect=_delayed(0.2, _REVERSE_PAYLOAD, place_spans))
+
+    with TestClient(app) as client:
+        r = client.get("/v1/forecast", params={"include_place": "true"})
+
+    assert r.status_code == 200
+    assert r.json()["location"]["city"] == "Belgrade"
+    # each upstream call started before the other one finished
+    (met_start, met_end), (place_start, place_end) = met_spans[0], place_spans[0]
+    assert place_start < met_end
+    assert met_start < place_end
+
+
+@respx.mock
+def test_slow_place_lookup_is_dropped_but_fills_cache(monkeypatch) -> None:
+    _setup(monkeypatch, place_timeout_s=0.1)
+    respx.get(MET_URL).mock(return_value=httpx.Response(200, json=_MET_PAYLOAD))
+    reverse = respx.get(REVERSE_URL).mock(side_effect=_delayed(1.0, _REVERSE_PAYLOAD))
+
+    with TestClient(app) as client:
+        r = client.get("/v1/forecast", params={"include_place": "true"})
+        assert r.status_code == 200
+        assert r.json()["location"]["place_name"] is None
+
+        # the shielded lookup finishes in the background and is cached
+        _wait_until(lambda: not forecast._place_tasks)
+        r = client.get("/v1/forecast", params={"include_place": "true"})
+        assert r.json()["location"]["city"] == "Belgrade"
+
+    assert reverse.call_count == 1
+
+
+@respx.mock
+def test_shutdown_cancels_pending_place_lookups(monkeypatch) -> None:
+    _setup(monkeypatch, place_timeout_s=0.05)
+    respx.get(MET_URL).mock(return_value=httpx.Response(200, json=_MET_PAYLOAD))
+    respx.get(REVERSE_URL).mock(side_effect=_delayed(30, _REVERSE_PAYLOAD))
+
+    pending_at_close: list[int] = []
+    aclose = main.aclose_http_client
+
+    async def recording_aclose() -> None:
+        pending_at_close.append(len(forecast._place_tasks))
+        await aclose()
+
+    monkeypatch.setattr(main, "aclose_http_client", recording_aclose)
+
+    with TestClient(app) as client:
+        r = client.get("/v1/forecast", params={"include_place": "true"})
+        assert r.json()["location"]["place_name"] is None
+        assert len(forecast._place_tasks) == 1
+
+    # cancelled and finished before the pooled client they use is closed
+    assert pending_at_close == [0]
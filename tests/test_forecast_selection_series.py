@@ -0,0 +1,66 @@
+from datetime import datetime, time, timedelta, timezone
+
+import pytest
+
+from met_weather_service.services.forecast import (
+    MetSeries,
+    select_daily_temperature_from_series,
+    select_daily_temperature_near_time,
+    select_daily_temperatures_from_series,
+)
+
+
+def _series(start: datetime, hours: int, step_h: int = 1) -> MetSeries:
+    series = MetSeries()
+    for i in range(0, hours, step_h):
+        series.epoch_s.append(int((start + timedelta(hours=i)).timestamp()))
+        series.temperature_c.append(round(-5.0 + i * 0.1, 1))
+    return series
+
+
+@pytest.mark.parametrize(
+    ("tz_name", "start"),
+    [
+        # spring forward / fall back
+        ("Europe/Belgrade", datetime(2026, 3, 27, tzinfo=timezone.utc)),
+        ("Europe/Belgrade", datetime(2026, 10, 23, tzinfo=timezone.utc)),
+        ("America/New_York", datetime(2026, 3, 6, tzinfo=timezone.utc)),
+        ("America/New_York", datetime(2026, 10, 30, tzinfo=timezone.utc)),
+        # 30-minute DST shift and non-hour offsets
+        ("Australia/Lord_Howe", datetime(2026, 4, 2, tzinfo=timezone.utc)),
+        ("Asia/Kathmandu", datetime(2026, 1, 26, tzinfo=timezone.utc)),
+        ("Pacific/Chatham", datetime(2026, 9, 24, tzinfo=timezone.utc)),
+        ("UTC", datetime(2026, 1, 26, tzinfo=timezone.utc)),
+    ],
+)
+@pytest.mark.parametrize("target", [time(0, 0), time(1, 30), time(2, 30), time(3, 0), time(14, 0), time(23, 59)])
+def test_series_selection_matches_pointwise_selection(tz_name: str, start: datetime, target: time) -> None:
+    # MET layout: hourly for ~2.5 days, then 6-hourly
+    series = _series(start, 60)
+    tail = _series(start + timedelta(hours=60), 24 * 8, step_h=6)
+    series.epoch_s.extend(tail.epoch_s)
+    series.temperature_c.extend(tail.temperature_c)
+
+    expected = select_daily_temperature_near_time(series.iter_points(), tz_name, target)
+    actual = select_daily_temperature_from_series(series, tz_name, target)
+
+    assert actual == expected
+
+
+def test_series_selection_empty() -> None:
+    assert select_daily_temperature_from_series(MetSeries(), "UTC", time(14, 0)) == []
+
+
+@pytest.mark.parametrize("tz_name", ["Europe/Belgrade", "America/New_York", "Asia/Kathmandu"])
+def test_multi_target_selection_matches_single_target(tz_name: str) -> None:
+    series = _series(datetime(2026, 3, 27, tzinfo=timezone.utc), 24 * 5, step_h=2)
+    targets = (time(8, 0), time(14, 0), time(20, 0))
+
+    days = select_daily_temperatures_from_series(series, tz_name, targets)
+
+    for k, target in enumerate(targets):
+        single = select_daily_temperature_from_series(series, tz_name, target)
+        assert [(d.date, d.targets[k].time, d.targets[k].temperature_c) for d in days] == [
+            (p.date, p.time, p.temperature_c) for p in single
+        ]
+    assert {t.target for d in days for t in d.targets} == {"08:00", "14:00", "20:00"}
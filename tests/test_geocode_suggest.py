@@ -0,0 +1,153 @@
+import random
+
+import httpx
+import respx
+from fastapi.testclient import TestClient
+
+from met_weather_service.core.config import get_settings
+from met_weather_service.main import app
+from met_weather_service.services import geocoder_gateway
+from met_weather_service.services.geocoder_client import GeoPlace
+from met_weather_service.services.offline_geocoder import GazetteerEntry
+from met_weather_service.services import place_suggest
+from met_weather_service.services.place_suggest import PlaceSuggestIndex, normalize_name
+
+NOMINATIM = "https://nominatim.openstreetmap.org"
+SEARCH_URL = f"{NOMINATIM}/search"
+
+
+def _place(name: str, lat: float, lon: float) -> GeoPlace:
+    return GeoPlace(display_name=name, lat=lat, lon=lon, country=None, city=None, state=None, raw={})
+
+
+def test_normalize_name() -> None:
+    assert normalize_name("  Niš, Nišava  District ") == "nis nisava district"
+    assert normalize_name("ČAČAK") == "cacak"
+
+
+def test_suggest_prefix_word_starts_and_ranking() -> None:
+    index = PlaceSuggestIndex()
+    index.add(_place("Novi Sad, Serbia", 45.2671, 19.8335))
+    index.add(_place("Novi Pazar, Serbia", 43.1367, 20.5122))
+    index.add(_place("Sombor, Serbia", 45.7742, 19.1122))
+
+    assert [p.display_name for p in index.suggest("novi")] == ["Novi Pazar, Serbia", "Novi Sad, Serbia"]
+
+    # resolving a place again raises its rank
+    index.add(_place("Novi Sad, Serbia", 45.2671, 19.8335))
+    assert [p.display_name for p in index.suggest("Novi")][0] == "Novi Sad, Serbia"
+
+    # word starts, not substrings
+    assert [p.display_name for p in index.suggest("sad")] == ["Novi Sad, Serbia"]
+    assert index.suggest("ovi") == []
+    assert [p.display_name for p in index.suggest("s", limit=1)] == ["Novi Sad, Serbia"]
+    assert len(index) == 3
+
+
+def test_suggest_ranks_whole_prefix_range() -> None:
+    index = PlaceSuggestIndex(max_places=0)
+    for i in range(3_000):
+        index.add(_place(f"Be{i:04d}town", 10.0, i / 100))
+    index.add(_place("Berlin", 52.5, 13.4), popularity=6.0)
+
+    # Berlin sorts after every "be0..." key but is the most popular match
+    assert [p.display_name for p in index.suggest("be", limit=1)] == ["Berlin"]
+    assert [p.display_name for p in index.suggest("ber")] == ["Berlin"]
+    assert index.suggest("bf") == []
+
+
+def test_memoized_rankings_follow_adds_bumps_and_evictions(monkeypatch) -> None:
+    monkeypatch.setattr(place_suggest, "_MEMO_MIN_RANGE", 2)
+    rng = random.Random(5)
+    index = PlaceSuggestIndex(max_places=0, max_resolved=20)
+    index.add_gazetteer(
+        GazetteerEntry(name=f"B{rng.choice('aeiou')}{i}", lat=i / 100, lon=1.0, country_code="", population=i * 10)
+        for i in range(1, 200)
+    )
+    names = [f"B{a}{b} Town" for a in "aeiou" for b in "lmnrst"]
+
+    def expected(prefix: str) -> list[str]:
+        prefix = normalize_name(prefix)
+        entries = index._places.values()
+        matching = [e for e in entries if any(k.startswith(prefix) for k in e.keys)]
+        ranked = sorted(matching, key=lambda e: (-e.popularity, e.place.display_name, e.place.lat, e.place.lon))
+        return [e.place.display_name for e in ranked[:5]]
+
+    for _ in range(500):
+        name = rng.choice(names)
+        index.add(_place(name, 1.0, 2.0), popularity=rng.choice([1.0, 3.0]))
+        prefix = rng.choice(["b", "ba", "be", "bal", "ba town"[:rng.randint(1, 7)]])
+        assert [p.display_name for p in index.suggest(prefix)] == expected(prefix), prefix
+
+    assert len(index._resolved) == 20
+
+
+def test_suggest_full_seed_still_admits_resolved_places() -> None:
+    index = PlaceSuggestIndex(max_places=60_000, max_resolved=2)
+    index.add_gazetteer(
+        GazetteerEntry(name=f"Town{i}", lat=i / 1_000, lon=0.0, country_code="XX", population=i) for i in range(60_000)
+    )
+    assert len(index) == 60_000
+
+    index.add(_place("Zemun, Serbia", 44.843, 20.401))
+    assert [p.display_name for p in index.suggest("zem")] == ["Zemun, Serbia"]
+
+    # resolved places evict the least popular resolved one, never the seed
+    index.add(_place("Zemun, Serbia", 44.843, 20.401))
+    index.add(_place("Zrenjanin, Serbia", 45.381, 20.369))
+    index.add(_place("Zaječar, Serbia", 43.904, 22.284))
+    assert [p.display_name for p in index.suggest("z")] == ["Zemun, Serbia", "Zaječar, Serbia"]
+    assert len(index) == 60_002
+
+
+def test_suggest_seed_keeps_most_populous() -> None:
+    index = PlaceSuggestIndex(max_places=1)
+    index.add_gazetteer(
+        [
+            GazetteerEntry(name="Bor", lat=44.07, lon=22.1, country_code="RS", population=34_000),
+            GazetteerEntry(name="Belgrade", lat=44.8, lon=20.4, country_code="RS", population=1_200_000),
+        ]
+    )
+    assert [p.display_name for p in index.suggest("b")] == ["Belgrade, RS"]
+
+
+@respx.mock
+def test_suggest_endpoint_uses_seed_and_resolved_places(monkeypatch) -> None:
+    geocoder_gateway.clear_cache()
+    monkeypatch.setenv("GEOCODER_BASE_URL", NOMINATIM)
+    monkeypatch.setenv("GEOCODER_RL_MAX_CALLS", "10")
+    monkeypatch.setenv("GEOCODER_RL_PERIOD_S", "1")
+    monkeypatch.setenv("GEOCODER_SUGGEST_SEED_PATH", "bundled")
+    get_settings.cache_clear()
+
+    search = respx.get(SEARCH_URL).mock(
+        return_value=httpx.Response(
+            200,
+            json=[
+                {
+                    "display_name": "Zemun, City of Belgrade, Central Serbia, Serbia",
+                    "lat": "44.8430",
+                    "lon": "20.4011",
+                    "address": {"city": "Zemun", "country": "Serbia"},
+                }
+            ],
+        )
+    )
+
+    client = TestClient(app)
+
+    r = client.get("/v1/geocode/suggest", params={"q": "be", "limit": 2})
+    assert r.status_code == 200
+    names = [p["display_name"] for p in r.json()["results"]]
+    # seed places ranked by population
+    assert names == ["Berlin, DE", "Belgrade, RS"]
+
+    r = client.get("/v1/geocode/suggest", params={"q": "zem"})
+    assert r.json()["results"] == []
+
+    client.get("/v1/geocode", params={"q": "Zemun"})
+    r = client.get("/v1/geocode/suggest", params={"q": "zem"})
+    assert [p["city"] for p in r.json()["results"]] == ["Zemun"]
+
+    assert search.call_count == 1
+    assert client.get("/v1/geocode/suggest", params={"q": ""}).status_code == 422
@@ -0,0 +1,141 @@
+import random
+
+import httpx
+import pytest
+import respx
+from fastapi.testclient import TestClient
+
+from met_weather_service.core.config import get_settings
+from met_weather_service.main import app
+from met_weather_service.services import geocoder_gateway
+from met_weather_service.services.proximity_index import ProximityIndex, haversine_m
+
+NOMINATIM = "https://nominatim.openstreetmap.org"
+REVERSE_URL = f"{NOMINATIM}/reverse"
+
+
+def test_within_matches_brute_force() -> None:
+    rng = random.Random(3)
+    index = ProximityIndex(5_000)
+    points = [(rng.uniform(44.0, 46.0), rng.uniform(19.0, 22.0)) for _ in range(2_000)]
+    for p in points:
+        index.add(p)
+    assert len(index) == len(points)
+
+    for _ in range(100):
+        lat, lon = rng.uniform(44.0, 46.0), rng.uniform(19.0, 22.0)
+        expected = sorted(p for p in points if haversine_m(lat, lon, *p) <= 5_000)
+        assert sorted(p for _, p in index.within(lat, lon)) == expected
+
+
+def test_within_wraps_antimeridian_and_poles() -> None:
+    index = ProximityIndex(1_000)
+    index.add((0.0, 179.9999))
+    index.add((89.9995, 10.0))
+
+    found = index.within(0.0, -179.9999)
+    assert [p for _, p in found] == [(0.0, 179.9999)]
+    assert found[0][0] == pytest.approx(22.2, abs=0.5)
+
+    # near the pole the same 1 km spans many degrees of longitude
+    assert [p for _, p in index.within(89.9995, -170.0)] == [(89.9995, 10.0)]
+
+    index.discard((0.0, 179.9999))
+    assert index.within(0.0, -179.9999) == []
+    assert len(index) == 1
+
+
+def _reverse_mock() -> respx.Route:
+    return respx.get(REVERSE_URL).mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "display_name": "Belgrade, City of Belgrade, Central Serbia, Serbia",
+                "lat": "44.8125",
+                "lon": "20.4612",
+                "address": {"city": "Belgrade", "country": "Serbia", "state": "Central Serbia"},
+            },
+        )
+    )
+
+
+@respx.mock
+def test_reverse_reuses_result_within_radius(monkeypatch) -> None:
+    geocoder_gateway.clear_cache()
+    monkeypatch.setenv("GEOCODER_BASE_URL", NOMINATIM)
+    monkeypatch.setenv("GEOCODER_CACHE_TTL_S", "3600")
+    monkeypatch.setenv("GEOCODER_RL_MAX_CALLS", "10")
+    monkeypatch.setenv("GEOCODER_RL_PERIOD_S", "1")
+    monkeypatch.setenv("GEOCODER_REVERSE_REUSE_RADIUS_M", "100")
+    get_settings.cache_clear()
+
+    route = _reverse_mock()
+    client = TestClient(app)
+
+    r = client.get("/v1/reverse", params={"lat": 44.8125, "lon": 20.4612})
+    assert r.status_code == 200
+    assert route.call_count == 1
+
+    # ~30 m away: a different truncated key, served from the nearby entry
+    r = client.get("/v1/reverse", params={"lat": 44.8127, "lon": 20.4614})
+    assert r.status_code == 200
+    assert r.json()["place"]["city"] == "Belgrade"
+    assert route.call_count == 1
+
+    # ~1.5 km away: upstream again
+    r = client.get("/v1/reverse", params={"lat": 44.8260, "lon": 20.4612})
+    assert r.status_code == 200
+    assert route.call_count == 2
+
+    stats = geocoder_gateway.get_stats()["reverse_proximity"]
+    assert stats == {"points": 2, "hits": 1}
+
+
+@respx.mock
+def test_reverse_reuse_disabled_with_zero_radius(monkeypatch) -> None:
+    geocoder_gateway.clear_cache()
+    monkeypatch.setenv("GEOCODER_BASE_URL", NOMINATIM)
+    monkeypatch.setenv("GEOCODER_CACHE_TTL_S", "3600")
+    monkeypatch.setenv("GEOCODER_RL_MAX_CALLS", "10")
+    monkeypatch.setenv("GEOCODER_RL_PERIOD_S", "1")
+    monkeypatch.setenv("GEOCODER_REVERSE_REUSE_RADIUS_M", "0")
+    get_settings.cache_clear()
+
+    route = _reverse_mock()
+    client = TestClient(app)
+
+    client.get("/v1/reverse", params={"lat": 44.8125, "lon": 20.4612})
+    client.get("/v1/reverse", params={"lat": 44.8127, "lon": 20.4614})
+    assert route.call_count == 2
+
+
+@respx.mock
+def test_reverse_does_not_reuse_nearby_empty_result(monkeypatch) -> None:
+    geocoder_gateway.clear_cache()
+    monkeypatch.setenv("GEOCODER_BASE_URL", NOMINATIM)
+    monkeypatch.setenv("GEOCODER_CACHE_TTL_S", "3600")
+    monkeypatch.setenv("GEOCODER_RL_MAX_CALLS", "10")
+    monkeypatch.setenv("GEOCODER_RL_PERIOD_S", "1")
+    monkeypatch.setenv("GEOCODER_REVERSE_REUSE_RADIUS_M", "100")
+    get_settings.cache_clear()
+
+    route = respx.get(REVERSE_URL).mock(
+        side_effect=[
+            httpx.Response(200, json={"error": "Unable to geocode"}),
+            httpx.Response(200, json={"display_name": "Pier 1", "lat": "44.8127", "lon": "20.4614", "address": {}}),
+        ]
+    )
+    client = TestClient(app)
+
+    r = client.get("/v1/reverse", params={"lat": 44.8125, "lon": 20.4612})
+    assert r.json()["place"] is None
+
+    # the empty answer stays cached for its own key
+    client.get("/v1/reverse", params={"lat": 44.8125, "lon": 20.4612})
+    assert route.call_count == 1
+
+    # but does not stand in for a point 30 m away
+    r = client.get("/v1/reverse", params={"lat": 44.8127, "lon": 20.4614})
+    assert r.json()["place"]["display_name"] == "Pier 1"
+    assert route.call_count == 2
+    assert geocoder_gateway.get_stats()["reverse_proximity"]["hits"] == 0
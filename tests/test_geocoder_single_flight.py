@@ -0,0 +1,133 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import respx
+from fastapi.testclient import TestClient
+
+from met_weather_service.core.config import get_settings
+from met_weather_service.main import app
+from met_weather_service.services import geocoder_gateway
+
+NOMINATIM = "https://nominatim.openstreetmap.org"
+SEARCH_URL = f"{NOMINATIM}/search"
+REVERSE_URL = f"{NOMINATIM}/reverse"
+
+_REVERSE_PAYLOAD = {
+    "display_name": "Belgrade, City of Belgrade, Central Serbia, Serbia",
+    "lat": "44.8125",
+    "lon": "20.4612",
+    "address": {"city": "Belgrade", "country": "Serbia"},
+}
+
+
+def _setup(monkeypatch, *, max_calls: int, period_s: float, max_wait_s: float) -> None:
+    geocoder_gateway.clear_cache()
+    monkeypatch.setenv("GEOCODER_BASE_URL", NOMINATIM)
+    monkeypatch.setenv("GEOCODER_CACHE_TTL_S", "3600")
+    monkeypatch.setenv("GEOCODER_REVERSE_REUSE_RADIUS_M", "0")
+    monkeypatch.setenv("GEOCODER_RL_MAX_CALLS", str(max_calls))
+    monkeypatch.setenv("GEOCODER_RL_PERIOD_S", str(period_s))
+    monkeypatch.setenv("GEOCODER_RL_MAX_WAIT_S", str(max_wait_s))
+    get_settings.cache_clear()
+
+
+@respx.mock
+def test_concurrent_async_reverse_shares_one_upstream_call(monkeypatch) -> None:
+    _setup(monkeypatch, max_calls=1, period_s=60, max_wait_s=0)
+
+    async def slow_response(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, json=_REVERSE_PAYLOAD)
+
+    route = respx.get(REVERSE_URL).mock(side_effect=slow_response)
+
+    async def run() -> list:
+        return await asyncio.gather(*(geocoder_gateway.areverse_geocode(44.8125, 20.4612) for _ in range(5)))
+
+    results = asyncio.run(run())
+
+    assert [p.city for p in results] == ["Belgrade"] * 5
+    assert len(route.calls) == 1
+
+    stats = geocoder_gateway.get_stats()["reverse_flight"]
+    assert stats["leaders"] == 1
+    assert stats["coalesced"] == 4
+
+
+@respx.mock
+def test_concurrent_async_forward_shares_one_upstream_call(monkeypatch) -> None:
+    _setup(monkeypatch, max_calls=1, period_s=60, max_wait_s=0)
+
+    async def slow_response(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, json=[_REVERSE_PAYLOAD])
+
+    route = respx.get(SEARCH_URL).mock(side_effect=slow_response)
+
+    async def run() -> list:
+        # differently spelled queries normalize to the same key
+        queries = ["Belgrade", " belgrade", "BELGRADE ", "belgrade"]
+        return await asyncio.gather(*(geocoder_gateway.aforward_geocode(q, limit=1) for q in queries))
+
+    results = asyncio.run(run())
+
+    assert len(results) == 4
+    assert all(r[0].city == "Belgrade" for r in results)
+    assert len(route.calls) == 1
+
+
+@respx.mock
+def test_over_rate_callers_queue_instead_of_429(monkeypatch) -> None:
+    _setup(monkeypatch, max_calls=1, period_s=0.3, max_wait_s=2)
+    route = respx.get(REVERSE_URL).mock(return_value=httpx.Response(200, json=_REVERSE_PAYLOAD))
+
+    client = TestClient(app)
+    started = time.monotonic()
+    assert client.get("/v1/reverse", params={"lat": 44.81, "lon": 20.46}).status_code == 200
+    assert client.get("/v1/reverse", params={"lat": 45.26, "lon": 19.83}).status_code == 200
+    elapsed = time.monotonic() - started
+
+    assert len(route.calls) == 2
+    assert elapsed >= 0.25
+
+
+@respx.mock
+def test_zero_wait_rejects_over_rate_callers(monkeypatch) -> None:
+    _setup(monkeypatch, max_calls=1, period_s=60, max_wait_s=0)
+    respx.get(REVERSE_URL).mock(return_value=httpx.Response(200, json=_REVERSE_PAYLOAD))
+
+    client = TestClient(app)
+    assert client.get("/v1/reverse", params={"lat": 44.81, "lon": 20.46}).status_code == 200
+    assert client.get("/v1/reverse", params={"lat": 45.26, "lon": 19.83}).status_code == 429
+
+
+@respx.mock
+def test_sync_wrappers_share_cache_and_flights_with_async_path(monkeypatch) -> None:
+    _setup(monkeypatch, max_calls=2, period_s=60, max_wait_s=0)
+
+    async def slow_response(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, json=[_REVERSE_PAYLOAD])
+
+    search = respx.get(SEARCH_URL).mock(side_effect=slow_response)
+    reverse = respx.get(REVERSE_URL).mock(return_value=httpx.Response(200, json=_REVERSE_PAYLOAD))
+
+    results: list = []
+    threads = [
+        threading.Thread(target=lambda: results.append(geocoder_gateway.forward_geocode("Belgrade", limit=1)))
+        for _ in range(4)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert [r[0].city for r in results] == ["Belgrade"] * 4
+    assert len(search.calls) == 1
+
+    assert geocoder_gateway.reverse_geocode(44.8125, 20.4612).city == "Belgrade"
+    # the async path reuses what the sync wrapper cached
+    assert asyncio.run(geocoder_gateway.areverse_geocode(44.8125, 20.4612)).city == "Belgrade"
+    assert len(reverse.calls) == 1
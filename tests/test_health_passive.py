@@ -0,0 +1,93 @@
+import httpx
+import respx
+from fastapi.testclient import TestClient
+
+from met_weather_service.core.config import get_settings
+from met_weather_service.main import app
+from met_weather_service.services import forecast_memo, met_gateway
+
+MET_URL = "https://api.met.no/weatherapi/locationforecast/2.0/compact"
+
+
+def _payload() -> dict:
+    return {
+        "properties": {
+            "meta": {"updated_at": "2026-01-26T17:15:58Z"},
+            "timeseries": [
+                {"time": "2026-01-26T13:00:00Z", "data": {"instant": {"details": {"air_temperature": 2.0}}}},
+            ],
+        }
+    }
+
+
+@respx.mock
+def test_passive_probes_never_call_upstream() -> None:
+    met_gateway.clear_cache()
+    route = respx.get(MET_URL).mock(return_value=httpx.Response(200, json=_payload()))
+    client = TestClient(app)
+
+    ready = client.get("/health/ready")
+    assert ready.status_code == 200
+    assert ready.json()["status"] == "ready"
+    assert ready.json()["met"] == "unknown"
+
+    met = client.get("/health/met")
+    assert met.status_code == 200
+    assert met.json() == {"status": "ok", "met": "unknown", "updated_at": ""}
+    assert len(route.calls) == 0
+
+    # a user request fills the cache; probes then report from it
+    assert client.get("/v1/forecast").status_code == 200
+    assert client.get("/health/met").json()["updated_at"] == "2026-01-26T17:15:58Z"
+
+    body = client.get("/health/ready").json()
+    assert body["met"] == "ok"
+    assert body["recent_calls"] == 1
+    assert body["cache_entries"] == 1
+    assert 0.0 < body["limiter_headroom"] < 1.0
+    assert len(route.calls) == 1
+
+
+@respx.mock
+def test_passive_probes_report_upstream_errors() -> None:
+    met_gateway.clear_cache()
+    respx.get(MET_URL).mock(return_value=httpx.Response(503))
+    client = TestClient(app)
+
+    assert client.get("/v1/forecast").status_code == 502
+
+    ready = client.get("/health/ready")
+    assert ready.status_code == 200
+    assert ready.json()["status"] == "degraded"
+    assert ready.json()["error_rate"] == 1.0
+
+    assert client.get("/health/met").status_code == 502
+
+
+def test_readiness_fails_when_misconfigured(monkeypatch) -> None:
+    monkeypatch.delenv("MET_USER_AGENT", raising=False)
+    get_settings.cache_clear()
+
+    assert TestClient(app).get("/health/ready").status_code == 503
+
+
+@respx.mock
+def test_stats_endpoint_exposes_cache_and_coalescing_counters() -> None:
+    met_gateway.clear_cache()
+    forecast_memo.clear_memo()
+    route = respx.get(MET_URL).mock(return_value=httpx.Response(200, json=_payload()))
+    client = TestClient(app)
+
+    assert client.get("/v1/forecast").status_code == 200
+    assert client.get("/v1/forecast").status_code == 200
+
+    stats = client.get("/health/stats")
+    assert stats.status_code == 200
+    body = stats.json()
+    assert body["met"]["cache"]["entries"] == 1
+    assert body["met"]["cache"]["hits"] >= 1
+    assert body["met"]["single_flight"]["leaders"] == 1
+    assert body["met"]["rate_limiter"]["granted"] == 1
+    assert body["forecast_memo"]["hits"] >= 1
+    assert set(body["geocoder"]) >= {"forward_cache", "reverse_cache", "forward_flight", "reverse_flight"}
+    assert len(route.calls) == 1
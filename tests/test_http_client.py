@@ -0,0 +1,103 @@
+import asyncio
+
+import httpx
+import respx
+from fastapi.testclient import TestClient
+
+from met_weather_service.core.config import get_settings
+from met_weather_service.main import app
+from met_weather_service.services import http_client, met_gateway
+
+MET_URL = "https://api.met.no/weatherapi/locationforecast/2.0/compact"
+
+
+def _payload() -> dict:
+    return {
+        "properties": {
+            "timeseries": [
+                {"time": "2026-01-26T13:00:00Z", "data": {"instant": {"details": {"air_temperature": 2.0}}}},
+            ],
+        }
+    }
+
+
+@respx.mock
+def test_met_calls_reuse_shared_async_http_client(monkeypatch) -> None:
+    met_gateway.clear_cache()
+    monkeypatch.setenv("MET_CACHE_TTL_S", "0")
+    get_settings.cache_clear()
+
+    respx.get(MET_URL).mock(return_value=httpx.Response(200, json=_payload()))
+
+    # pools of other loops (e.g. the sync bridge) are not part of this test
+    before = list(http_client._async_clients.values())
+
+    def app_clients() -> list:
+        return [p.client for p in http_client._async_clients.values() if all(p is not b for b in before)]
+
+    with TestClient(app) as client:
+        assert client.get("/v1/forecast").status_code == 200
+        (shared,) = app_clients()
+
+        assert client.get("/v1/forecast").status_code == 200
+        assert app_clients() == [shared]
+
+    assert shared is not None
+    assert shared.is_closed
+
+
+def test_http_client_rebuilt_on_config_change_and_closed_by_last_user(monkeypatch) -> None:
+    monkeypatch.setenv("HTTP_MAX_CONNECTIONS", "10")
+    get_settings.cache_clear()
+
+    with TestClient(app):
+        with http_client.use_http_client() as first:
+            monkeypatch.setenv("HTTP_MAX_CONNECTIONS", "20")
+            get_settings.cache_clear()
+            second = http_client.get_http_client()
+
+            assert second is not first
+            # the call still holding the old client keeps it open ...
+            assert not first.is_closed
+
+        # ... and closes it when done, instead of keeping it until shutdown
+        assert first.is_closed
+        assert not second.is_closed
+
+    assert second.is_closed
+
+
+def test_async_http_client_replaced_on_config_change_is_closed(monkeypatch) -> None:
+    monkeypatch.setenv("HTTP_MAX_CONNECTIONS", "10")
+    get_settings.cache_clear()
+
+    async def scenario() -> tuple[httpx.AsyncClient, httpx.AsyncClient]:
+        first = await http_client.get_async_http_client()
+        monkeypatch.setenv("HTTP_MAX_CONNECTIONS", "20")
+        get_settings.cache_clear()
+        second = await http_client.get_async_http_client()
+        assert first.is_closed
+        assert not second.is_closed
+        await http_client.aclose_http_client()
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert first is not second
+    assert second.is_closed
+
+
+def test_missing_h2_is_resolved_and_warned_once(monkeypatch, caplog) -> None:
+    monkeypatch.setenv("HTTP_HTTP2", "true")
+    get_settings.cache_clear()
+    http_client._h2_available.cache_clear()
+    monkeypatch.setattr(http_client.importlib.util, "find_spec", lambda name: None)
+
+    try:
+        with caplog.at_level("WARNING", logger=http_client.__name__):
+            for _ in range(3):
+                assert http_client._client_config(get_settings())[3] is False
+    finally:
+        http_client._h2_available.cache_clear()
+
+    assert sum("'h2' package is not installed" in r.getMessage() for r in caplog.records) == 1
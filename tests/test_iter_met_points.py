@@ -1,4 +1,4 @@
-from met_weather_service.services.forecast import iter_met_points
+from met_weather_service.services.forecast import iter_met_points, parse_met_series
 
 
 def test_iter_met_points_skips_malformed_entries() -> None:
@@ -31,3 +31,20 @@ def test_iter_met_points_accepts_naive_datetime_assuming_utc() -> None:
     points = list(iter_met_points(data))
     assert len(points) == 1
     assert points[0].utc_dt.tzinfo is not None
+
+
+def test_parse_met_series_matches_iter_met_points() -> None:
+    data = {
+        "properties": {
+            "timeseries": [
+                {"time": "2026-01-26T13:00:00Z", "data": {"instant": {"details": {"air_temperature": 2.3}}}},
+                {"time": "2026-01-26T14:00:00Z", "data": {}},
+                {"time": "2026-01-26T15:00:00+01:00", "data": {"instant": {"details": {"air_temperature": -1.7}}}},
+            ]
+        }
+    }
+
+    series = parse_met_series(data)
+
+    assert len(series) == 2
+    assert list(series.iter_points()) == list(iter_met_points(data))
@@ -0,0 +1,64 @@
+import httpx
+import respx
+
+from met_weather_service.core.config import get_settings
+from met_weather_service.services import met_gateway
+
+MET_URL = "https://api.met.no/weatherapi/locationforecast/2.0/compact"
+DATE = "Mon, 26 Jan 2026 12:00:00 GMT"
+
+
+def _payload() -> dict:
+    return {
+        "properties": {
+            "timeseries": [
+                {"time": "2026-01-26T13:00:00Z", "data": {"instant": {"details": {"air_temperature": 2.0}}}},
+            ],
+        }
+    }
+
+
+def _setup(monkeypatch, **env: str) -> None:
+    met_gateway.clear_cache()
+    monkeypatch.setenv("MET_CACHE_TTL_S", "300")
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    get_settings.cache_clear()
+    monkeypatch.setattr(met_gateway.time, "time", lambda: 1000.0)
+
+
+@respx.mock
+def test_cache_freshness_follows_expires_minus_date(monkeypatch) -> None:
+    _setup(monkeypatch)
+    respx.get(MET_URL).mock(
+        return_value=httpx.Response(
+            200,
+            json=_payload(),
+            headers={"Date": DATE, "Expires": "Mon, 26 Jan 2026 12:40:00 GMT"},
+        )
+    )
+
+    result = met_gateway.get_locationforecast_compact_result(44.8125, 20.4612)
+    assert result.expires_at == 1000.0 + 2400
+
+
+@respx.mock
+def test_cache_freshness_is_clamped(monkeypatch) -> None:
+    _setup(monkeypatch, MET_CACHE_MIN_TTL_S="60", MET_CACHE_MAX_TTL_S="1800")
+    respx.get(MET_URL).mock(
+        side_effect=[
+            httpx.Response(200, json=_payload(), headers={"Date": DATE, "Expires": "Mon, 26 Jan 2026 15:00:00 GMT"}),
+            httpx.Response(200, json=_payload(), headers={"Date": DATE, "Expires": "Mon, 26 Jan 2026 11:00:00 GMT"}),
+        ]
+    )
+
+    assert met_gateway.get_locationforecast_compact_result(44.8125, 20.4612).expires_at == 1000.0 + 1800
+    assert met_gateway.get_locationforecast_compact_result(10.0, 10.0).expires_at == 1000.0 + 60
+
+
+@respx.mock
+def test_cache_freshness_falls_back_to_ttl_without_expires(monkeypatch) -> None:
+    _setup(monkeypatch)
+    respx.get(MET_URL).mock(return_value=httpx.Response(200, json=_payload(), headers={"Expires": "garbage"}))
+
+    assert met_gateway.get_locationforecast_compact_result(44.8125, 20.4612).expires_at == 1000.0 + 300
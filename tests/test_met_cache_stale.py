@@ -0,0 +1,94 @@
+import time
+
+import httpx
+import respx
+from fastapi.testclient import TestClient
+
+from met_weather_service.core.config import get_settings
+from met_weather_service.main import app
+from met_weather_service.services import met_gateway
+
+MET_URL = "https://api.met.no/weatherapi/locationforecast/2.0/compact"
+LAST_MOD = "Mon, 26 Jan 2026 12:00:00 GMT"
+
+
+def _payload(temp: float = 2.0) -> dict:
+    return {
+        "properties": {
+            "timeseries": [
+                {"time": "2026-01-26T13:00:00Z", "data": {"instant": {"details": {"air_temperature": temp}}}},
+            ],
+        }
+    }
+
+
+@respx.mock
+def test_stale_while_revalidate_returns_stale_and_refreshes_in_background(monkeypatch) -> None:
+    met_gateway.clear_cache()
+    monkeypatch.setenv("MET_CACHE_TTL_S", "10")
+    monkeypatch.setenv("MET_CACHE_STALE_WHILE_REVALIDATE_S", "60")
+    get_settings.cache_clear()
+
+    t = {"now": 1000.0}
+    monkeypatch.setattr(met_gateway.time, "time", lambda: t["now"])
+
+    route = respx.get(MET_URL).mock(
+        side_effect=[
+            httpx.Response(200, json=_payload(2.0), headers={"Last-Modified": LAST_MOD}),
+            httpx.Response(200, json=_payload(5.0), headers={"Last-Modified": LAST_MOD}),
+        ]
+    )
+
+    first = met_gateway.get_locationforecast_compact_result(44.8125, 20.4612)
+    assert first.stale is None
+
+    t["now"] = 1011.0
+    stale = met_gateway.get_locationforecast_compact_result(44.8125, 20.4612)
+    assert stale.stale == "revalidating"
+    assert stale.data == _payload(2.0)
+
+    deadline = time.monotonic() + 2.0
+    while len(route.calls) < 2 or met_gateway._flight.in_flight():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+    fresh = met_gateway.get_locationforecast_compact_result(44.8125, 20.4612)
+    assert fresh.stale is None
+    assert fresh.data == _payload(5.0)
+    assert route.calls[1].request.headers.get("If-Modified-Since") == LAST_MOD
+
+
+@respx.mock
+def test_stale_if_error_hides_upstream_failure(monkeypatch) -> None:
+    met_gateway.clear_cache()
+    monkeypatch.setenv("MET_CACHE_TTL_S", "10")
+    monkeypatch.setenv("MET_CACHE_STALE_IF_ERROR_S", "60")
+    get_settings.cache_clear()
+
+    t = {"now": 1000.0}
+    monkeypatch.setattr(met_gateway.time, "time", lambda: t["now"])
+
+    respx.get(MET_URL).mock(
+        side_effect=[
+            httpx.Response(200, json=_payload(), headers={"Last-Modified": LAST_MOD}),
+            httpx.Response(503),
+            httpx.Response(503),
+        ]
+    )
+
+    client = TestClient(app)
+
+    r1 = client.get("/v1/forecast")
+    assert r1.status_code == 200
+    assert "Warning" not in r1.headers
+
+    t["now"] = 1011.0
+    r2 = client.get("/v1/forecast")
+    assert r2.status_code == 200
+    assert r2.headers["Warning"].startswith("111")
+    assert r2.json() == r1.json()
+
+    # outside the stale-if-error window the error surfaces
+    t["now"] = 1071.0
+    r3 = client.get("/v1/forecast")
+    assert r3.status_code == 502
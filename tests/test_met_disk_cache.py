@@ -0,0 +1,111 @@
+import asyncio
+import threading
+
+import httpx
+import respx
+from fastapi.testclient import TestClient
+
+from met_weather_service.core.config import get_settings
+from met_weather_service.main import app
+from met_weather_service.services import met_gateway
+from met_weather_service.services.met_disk_cache import MetDiskCache
+
+MET_URL = "https://api.met.no/weatherapi/locationforecast/2.0/compact"
+LAST_MOD = "Mon, 26 Jan 2026 12:00:00 GMT"
+
+
+def _payload() -> dict:
+    return {
+        "properties": {
+            "timeseries": [
+                {"time": "2026-01-26T13:00:00Z", "data": {"instant": {"details": {"air_temperature": 2.0}}}},
+            ],
+        }
+    }
+
+
+def _setup(monkeypatch, tmp_path) -> None:
+    met_gateway.clear_cache()
+    monkeypatch.setenv("MET_CACHE_TTL_S", "300")
+    monkeypatch.setenv("MET_DISK_CACHE_PATH", str(tmp_path / "met.sqlite3"))
+    get_settings.cache_clear()
+
+
+@respx.mock
+def test_disk_cache_survives_restart(monkeypatch, tmp_path) -> None:
+    _setup(monkeypatch, tmp_path)
+    route = respx.get(MET_URL).mock(
+        return_value=httpx.Response(200, json=_payload(), headers={"Last-Modified": LAST_MOD})
+    )
+
+    met_gateway.get_locationforecast_compact(44.8125, 20.4612)
+
+    # simulated restart: L1 dropped, disk tier reopened
+    met_gateway.clear_cache()
+    assert met_gateway.warm_cache_from_disk() == 1
+
+    result = met_gateway.get_locationforecast_compact_result(44.8125, 20.4612)
+    assert result.data == _payload()
+    assert result.last_modified == LAST_MOD
+    assert len(route.calls) == 1
+
+
+@respx.mock
+def test_disk_cache_shared_without_warmup(monkeypatch, tmp_path) -> None:
+    _setup(monkeypatch, tmp_path)
+    route = respx.get(MET_URL).mock(return_value=httpx.Response(200, json=_payload()))
+
+    met_gateway.get_locationforecast_compact(44.8125, 20.4612)
+
+    # another worker with an empty L1 reads what the first one stored
+    met_gateway._cache.clear()
+    assert met_gateway.get_locationforecast_compact(44.8125, 20.4612) == _payload()
+    assert len(route.calls) == 1
+
+
+@respx.mock
+def test_async_fetch_keeps_disk_io_off_the_event_loop(monkeypatch, tmp_path) -> None:
+    _setup(monkeypatch, tmp_path)
+    monkeypatch.setenv("MET_CACHE_TTL_S", "0")
+    monkeypatch.setenv("MET_CACHE_MIN_TTL_S", "0")
+    get_settings.cache_clear()
+    respx.get(MET_URL).mock(return_value=httpx.Response(200, json=_payload()))
+
+    calls: list[tuple[str, bool]] = []
+
+    def spy(name: str):
+        original = getattr(MetDiskCache, name)
+
+        def wrapper(self, *args, **kwargs):
+            calls.append((name, threading.current_thread() is threading.main_thread()))
+            return original(self, *args, **kwargs)
+
+        return wrapper
+
+    for name in ("get", "put"):
+        monkeypatch.setattr(MetDiskCache, name, spy(name))
+
+    asyncio.run(met_gateway.aget_locationforecast_compact_result(44.8125, 20.4612))
+
+    assert {name for name, _ in calls} == {"get", "put"}
+    assert not any(on_loop for _, on_loop in calls)
+
+
+@respx.mock
+def test_unusable_disk_cache_is_disabled_not_fatal(monkeypatch, tmp_path, caplog) -> None:
+    corrupt = tmp_path / "met.sqlite3"
+    corrupt.write_bytes(b"not a database" * 100)
+    met_gateway.clear_cache()
+    monkeypatch.setenv("MET_CACHE_TTL_S", "0")
+    monkeypatch.setenv("MET_DISK_CACHE_PATH", str(corrupt))
+    get_settings.cache_clear()
+    respx.get(MET_URL).mock(return_value=httpx.Response(200, json=_payload()))
+
+    with TestClient(app) as client:
+        assert client.get("/v1/forecast").status_code == 200
+        assert client.get("/v1/forecast").status_code == 200
+        # logged once, not on every request
+        assert caplog.text.count("MET disk cache unavailable") == 1
+
+    # without the lifespan warm-up too
+    assert met_gateway.get_locationforecast_compact(44.8125, 20.4612) == _payload()
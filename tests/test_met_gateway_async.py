@@ -0,0 +1,34 @@
+import asyncio
+
+import httpx
+import respx
+
+from met_weather_service.core.config import get_settings
+from met_weather_service.services import met_gateway
+
+MET_URL = "https://api.met.no/weatherapi/locationforecast/2.0/compact"
+
+
+def _payload() -> dict:
+    return {
+        "properties": {
+            "timeseries": [
+                {"time": "2026-01-26T13:00:00Z", "data": {"instant": {"details": {"air_temperature": 2.0}}}},
+            ],
+        }
+    }
+
+
+@respx.mock
+def test_sync_and_async_gateway_share_cache(monkeypatch) -> None:
+    met_gateway.clear_cache()
+    monkeypatch.setenv("MET_CACHE_TTL_S", "300")
+    get_settings.cache_clear()
+
+    route = respx.get(MET_URL).mock(return_value=httpx.Response(200, json=_payload()))
+
+    data_async = asyncio.run(met_gateway.aget_locationforecast_compact(44.81259, 20.46129))
+    data_sync = met_gateway.get_locationforecast_compact(44.8125, 20.4612)
+
+    assert data_sync == data_async == _payload()
+    assert len(route.calls) == 1
@@ -0,0 +1,117 @@
+import asyncio
+import time
+
+import httpx
+import respx
+
+from met_weather_service.core.config import get_settings
+from met_weather_service.services import met_gateway, met_prefetch
+from met_weather_service.services.access_tracker import AccessTracker
+
+MET_URL = "https://api.met.no/weatherapi/locationforecast/2.0/compact"
+
+
+def _payload() -> dict:
+    return {
+        "properties": {
+            "timeseries": [
+                {"time": "2026-01-26T13:00:00Z", "data": {"instant": {"details": {"air_temperature": 2.0}}}},
+            ],
+        }
+    }
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _setup(monkeypatch, **env: str) -> _Clock:
+    met_gateway.clear_cache()
+    monkeypatch.setenv("MET_CACHE_TTL_S", "300")
+    monkeypatch.setenv("MET_PREFETCH_INTERVAL_S", "0.01")
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    get_settings.cache_clear()
+    clock = _Clock()
+    monkeypatch.setattr(time, "time", clock)
+    return clock
+
+
+def test_parse_watchlist() -> None:
+    assert met_prefetch.parse_watchlist(" 44.81259,20.46129; bad ;91,0;45,19;44.8125,20.4612") == [
+        (44.8125, 20.4612),
+        (45.0, 19.0),
+    ]
+
+
+def test_access_tracker_top_and_decay() -> None:
+    tracker = AccessTracker(max_keys=2)
+    for key in ["a", "a", "a", "b", "c"]:
+        tracker.record(key)
+
+    assert tracker.top(1) == ["a"]
+    assert len(tracker) == 2  # "c" ignored while full
+
+    for _ in range(6):
+        tracker.decay()
+    assert tracker.top(5) == ["a", "b"]
+
+    tracker.decay()
+    assert tracker.top(5) == ["a"]
+
+
+@respx.mock
+def test_hot_key_is_revalidated_only_once_expired(monkeypatch) -> None:
+    clock = _setup(monkeypatch, MET_PREFETCH_TOP_N="10")
+    route = respx.get(MET_URL).mock(
+        return_value=httpx.Response(200, json=_payload(), headers={"Last-Modified": "Mon, 26 Jan 2026 11:00:00 GMT"})
+    )
+
+    met_gateway.get_locationforecast_compact(44.8125, 20.4612)
+    assert len(route.calls) == 1
+
+    # never before Expires (MET terms of service), not even just before
+    clock.now = 1299.0
+    assert asyncio.run(met_prefetch.prefetch_once(get_settings())) == 0
+    assert len(route.calls) == 1
+
+    # once expired: revalidated with If-Modified-Since
+    clock.now = 1300.0
+    route.mock(return_value=httpx.Response(304))
+    assert asyncio.run(met_prefetch.prefetch_once(get_settings())) == 1
+    assert len(route.calls) == 2
+    assert route.calls[-1].request.headers["If-Modified-Since"] == "Mon, 26 Jan 2026 11:00:00 GMT"
+
+    # the user request after it is a hit
+    clock.now = 1310.0
+    met_gateway.get_locationforecast_compact(44.8125, 20.4612)
+    assert len(route.calls) == 2
+
+
+@respx.mock
+def test_watchlist_is_fetched_cold_within_budget(monkeypatch) -> None:
+    _setup(
+        monkeypatch,
+        MET_PREFETCH_WATCHLIST="44.8125,20.4612;45,19;46,18",
+        MET_RL_MAX_CALLS="4",
+        MET_RL_PERIOD_S="0.02",
+        MET_PREFETCH_BUDGET_FRACTION="0.5",
+    )
+    route = respx.get(MET_URL).mock(return_value=httpx.Response(200, json=_payload()))
+
+    # budget: 4 calls * 0.5 * (0.01 s tick / 0.02 s period) = 1 per tick
+    assert met_prefetch.tick_budget(get_settings()) == 1
+    assert asyncio.run(met_prefetch.prefetch_once(get_settings())) == 1
+    assert asyncio.run(met_prefetch.prefetch_once(get_settings())) == 1
+    assert len(route.calls) == 2
+    assert met_gateway.cache_expires_at((44.8125, 20.4612)) is not None
+
+
+def test_non_positive_interval_disables_prefetch(monkeypatch) -> None:
+    _setup(monkeypatch, MET_PREFETCH_TOP_N="10", MET_PREFETCH_INTERVAL_S="0")
+
+    assert not met_prefetch.is_enabled(get_settings())
@@ -1,3 +1,5 @@
+import asyncio
+
 import httpx
 import respx
 from fastapi.testclient import TestClient
@@ -5,6 +7,7 @@ from fastapi.testclient import TestClient
 from met_weather_service.core.config import get_settings
 from met_weather_service.main import app
 from met_weather_service.services import met_gateway
+from met_weather_service.services.rate_limiter import PRIORITY_BACKGROUND
 
 MET_URL = "https://api.met.no/weatherapi/locationforecast/2.0/compact"
 
@@ -45,3 +48,90 @@ def test_rate_limit_blocks_second_upstream_call(monkeypatch) -> None:
     assert r2.json()["detail"] == "Too many requests"
 
     assert len(route.calls) == 1
+
+
+@respx.mock
+def test_rate_limit_wait_smooths_short_bursts(monkeypatch) -> None:
+    met_gateway.clear_cache()
+    monkeypatch.setenv("MET_CACHE_TTL_S", "0")
+    monkeypatch.setenv("MET_CACHE_MIN_TTL_S", "0")
+    monkeypatch.setenv("MET_RL_MAX_CALLS", "1")
+    monkeypatch.setenv("MET_RL_PERIOD_S", "0.5")
+    monkeypatch.setenv("MET_RL_MAX_WAIT_S", "2")
+    get_settings.cache_clear()
+
+    route = respx.get(MET_URL).mock(return_value=httpx.Response(200, json=_payload()))
+
+    client = TestClient(app)
+
+    assert client.get("/v1/forecast").status_code == 200
+    assert client.get("/v1/forecast").status_code == 200
+    assert len(route.calls) == 2
+    assert met_gateway.get_stats()["rate_limiter"]["delayed"] == 1
+
+
+@respx.mock
+def test_health_probe_cannot_use_reserved_capacity(monkeypatch) -> None:
+    met_gateway.clear_cache()
+    monkeypatch.setenv("MET_CACHE_TTL_S", "0")
+    monkeypatch.setenv("MET_RL_MAX_CALLS", "4")
+    monkeypatch.setenv("MET_RL_PERIOD_S", "60")
+    monkeypatch.setenv("MET_RL_RESERVED_FRACTION", "0.5")
+    get_settings.cache_clear()
+
+    respx.get(MET_URL).mock(return_value=httpx.Response(200, json=_payload()))
+
+    client = TestClient(app)
+
+    assert client.get("/health/met", params={"active": "true"}).status_code == 200
+    assert client.get("/health/met", params={"active": "true"}).status_code == 200
+    assert client.get("/health/met", params={"active": "true"}).status_code == 429
+
+    # user requests still get the reserved tokens
+    assert client.get("/v1/forecast").status_code == 200
+    assert client.get("/v1/forecast").status_code == 200
+
+    by_priority = met_gateway.get_stats()["rate_limiter"]["by_priority"]
+    assert by_priority["health"]["rejected"] == 1
+    assert by_priority["interactive"]["granted"] == 2
+
+
+@respx.mock
+def test_interactive_caller_retries_after_shared_background_call_is_rejected(monkeypatch) -> None:
+    met_gateway.clear_cache()
+    monkeypatch.setenv("MET_CACHE_TTL_S", "0")
+    monkeypatch.setenv("MET_RL_MAX_CALLS", "4")
+    monkeypatch.setenv("MET_RL_PERIOD_S", "60")
+    monkeypatch.setenv("MET_RL_RESERVED_FRACTION", "0.5")
+    get_settings.cache_clear()
+
+    route = respx.get(MET_URL).mock(return_value=httpx.Response(200, json=_payload()))
+
+    # spend the unreserved capacity: only interactive calls can still get a token
+    limiter = met_gateway._get_limiter(get_settings())
+    assert limiter.allow() and limiter.allow()
+
+    original = met_gateway._acheck_rate_limit
+
+    async def slow_background_check(settings, priority: str) -> None:
+        # keep the background leader in flight long enough for the user request to join it
+        if priority == PRIORITY_BACKGROUND:
+            await asyncio.sleep(0.1)
+        await original(settings, priority)
+
+    monkeypatch.setattr(met_gateway, "_acheck_rate_limit", slow_background_check)
+
+    async def run() -> list:
+        refresh = asyncio.create_task(met_gateway.arevalidate(44.8125, 20.4612))
+        await asyncio.sleep(0.01)
+        user = asyncio.create_task(met_gateway.aget_locationforecast_compact_result(44.8125, 20.4612))
+        return await asyncio.gather(refresh, user, return_exceptions=True)
+
+    refresh_result, user_result = asyncio.run(run())
+
+    # the background leader is rejected,
+    # the interactive follower retries in its own class and is served
+    assert isinstance(refresh_result, met_gateway.MetRateLimitExceeded)
+    assert refresh_result.priority == PRIORITY_BACKGROUND
+    assert user_result.data == _payload()
+    assert len(route.calls) == 1
@@ -0,0 +1,148 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import respx
+
+from met_weather_service.core.config import get_settings
+from met_weather_service.services import met_gateway
+from met_weather_service.services.single_flight import SingleFlight
+
+MET_URL = "https://api.met.no/weatherapi/locationforecast/2.0/compact"
+
+
+def _payload() -> dict:
+    return {
+        "properties": {
+            "timeseries": [
+                {"time": "2026-01-26T13:00:00Z", "data": {"instant": {"details": {"air_temperature": 2.0}}}},
+            ],
+        }
+    }
+
+
+def _setup(monkeypatch) -> None:
+    met_gateway.clear_cache()
+    monkeypatch.setenv("MET_CACHE_TTL_S", "300")
+    monkeypatch.setenv("MET_RL_MAX_CALLS", "1")
+    monkeypatch.setenv("MET_RL_PERIOD_S", "60")
+    get_settings.cache_clear()
+
+
+@respx.mock
+def test_concurrent_threaded_misses_share_one_upstream_call(monkeypatch) -> None:
+    _setup(monkeypatch)
+
+    async def slow_response(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.2)
+        return httpx.Response(200, json=_payload())
+
+    route = respx.get(MET_URL).mock(side_effect=slow_response)
+
+    results: list[dict] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(met_gateway.get_locationforecast_compact(44.8125, 20.4612)))
+        for _ in range(5)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(results) == 5
+    assert all(r == _payload() for r in results)
+    assert len(route.calls) == 1
+
+    stats = met_gateway.get_stats()["single_flight"]
+    assert stats["leaders"] == 1
+    assert stats["coalesced"] == 4
+
+
+@respx.mock
+def test_concurrent_async_misses_share_result_and_error(monkeypatch) -> None:
+    _setup(monkeypatch)
+
+    async def failing_response(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.1)
+        return httpx.Response(500, request=request)
+
+    route = respx.get(MET_URL).mock(side_effect=failing_response)
+
+    async def run() -> list:
+        return await asyncio.gather(
+            *(met_gateway.aget_locationforecast_compact(44.8125, 20.4612) for _ in range(5)),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(run())
+
+    # one upstream call; every caller sees the upstream error, none hits the limiter
+    assert len(route.calls) == 1
+    assert all(isinstance(r, httpx.HTTPStatusError) for r in results)
+    assert met_gateway.get_stats()["single_flight"]["coalesced"] == 4
+
+
+def test_cancelled_leader_hands_the_call_to_a_waiter() -> None:
+    flight: SingleFlight[str] = SingleFlight()
+    calls: list[str] = []
+
+    async def slow(name: str) -> str:
+        calls.append(name)
+        await asyncio.sleep(0.1)
+        return name
+
+    async def run() -> list:
+        leader = asyncio.create_task(flight.ado("k", lambda: slow("leader")))
+        await asyncio.sleep(0.01)
+        waiters = [asyncio.create_task(flight.ado("k", lambda: slow("waiter"))) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        return await asyncio.gather(leader, *waiters, return_exceptions=True)
+
+    results = asyncio.run(run())
+
+    assert isinstance(results[0], asyncio.CancelledError)
+    # the waiters were not cancelled: one of them re-ran the call for the others
+    assert results[1:] == ["waiter"] * 3
+    assert calls == ["leader", "waiter"]
+    assert not flight.is_running("k")
+
+
+def test_waiters_get_the_error_without_leader_traceback() -> None:
+    flight: SingleFlight[str] = SingleFlight()
+    release = threading.Event()
+
+    def failing() -> str:
+        release.wait(1)
+        raise ValueError("boom")
+
+    errors: list[BaseException] = []
+
+    def waiter() -> None:
+        try:
+            flight.do("k", failing)
+        except ValueError as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=waiter) for _ in range(3)]
+    for t in threads:
+        t.start()
+    time.sleep(0.05)
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert len(errors) == 3
+    assert all(str(e) == "boom" for e in errors)
+
+    def frames(exc: BaseException) -> list[str]:
+        names = []
+        tb = exc.__traceback__
+        while tb is not None:
+            names.append(tb.tb_frame.f_code.co_name)
+            tb = tb.tb_next
+        return names
+
+    # only the leader's traceback reaches into failing()
+    assert sum("failing" in frames(e) for e in errors) == 1
@@ -56,7 +56,7 @@ def test_health_met_returns_502_on_timeout() -> None:
     respx.get(MET_URL).mock(side_effect=httpx.ReadTimeout("timeout", request=req))
 
     client = TestClient(app)
-    resp = client.get("/health/met")
+    resp = client.get("/health/met", params={"active": "true"})
 
     assert resp.status_code == 502
     assert resp.json()["detail"] == "MET upstream error"
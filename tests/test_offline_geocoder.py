@@ -0,0 +1,129 @@
+import math
+import random
+
+import httpx
+import pytest
+import respx
+from fastapi.testclient import TestClient
+
+from met_weather_service.core.config import get_settings
+from met_weather_service.main import app
+from met_weather_service.services import geocoder_gateway, met_gateway
+from met_weather_service.services.offline_geocoder import (
+    BUNDLED_GAZETTEER,
+    GazetteerEntry,
+    OfflineGeocoder,
+    load_gazetteer,
+    parse_gazetteer_line,
+)
+
+MET_URL = "https://api.met.no/weatherapi/locationforecast/2.0/compact"
+NOMINATIM = "https://nominatim.openstreetmap.org"
+REVERSE_URL = f"{NOMINATIM}/reverse"
+
+
+def _haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    dp, dl = p2 - p1, math.radians(lon2 - lon1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * 6371.0088 * math.asin(math.sqrt(a))
+
+
+def test_nearest_matches_brute_force() -> None:
+    rng = random.Random(7)
+    entries = [
+        GazetteerEntry(f"p{i}", math.degrees(math.asin(rng.uniform(-1, 1))), rng.uniform(-180, 180), "XX", i)
+        for i in range(3_000)
+    ]
+    geocoder = OfflineGeocoder(entries)
+    assert len(geocoder) == len(entries)
+
+    for _ in range(200):
+        lat, lon = rng.uniform(-90, 90), rng.uniform(-180, 180)
+        expected = min(entries, key=lambda e: _haversine_km(lat, lon, e.lat, e.lon))
+
+        place, distance_km = geocoder.nearest(lat, lon)
+        assert place.city == expected.name
+        assert distance_km == pytest.approx(_haversine_km(lat, lon, expected.lat, expected.lon), abs=1e-6)
+
+
+def test_nearest_across_antimeridian_and_max_distance() -> None:
+    geocoder = OfflineGeocoder(
+        [
+            GazetteerEntry("West", 0.0, 179.9, "AA", 0),
+            GazetteerEntry("Far", 0.0, 170.0, "BB", 0),
+        ]
+    )
+
+    place, distance_km = geocoder.nearest(0.0, -179.9)
+    assert place.city == "West"
+    assert distance_km < 25
+
+    assert geocoder.nearest(0.0, -179.9, max_distance_km=10) is None
+    assert OfflineGeocoder([]).nearest(0.0, 0.0) is None
+
+
+def test_parse_gazetteer_line_formats() -> None:
+    geonames = "\t".join(
+        ["792680", "Belgrade", "Belgrade", "Beograd", "44.80401", "20.46513", "P", "PPLC", "RS", "", "SE", "", "", "",
+         "1273651", "", "117", "Europe/Belgrade", "2022-09-17"]
+    )
+    e = parse_gazetteer_line(geonames + "\n")
+    assert e == GazetteerEntry("Belgrade", 44.80401, 20.46513, "RS", 1273651)
+
+    assert parse_gazetteer_line("Novi Sad\t45.2671\t19.8335\tRS\n") == GazetteerEntry("Novi Sad", 45.2671, 19.8335, "RS", 0)
+    assert parse_gazetteer_line("# comment\n") is None
+    assert parse_gazetteer_line("Broken\tnorth\t20\tRS\n") is None
+    assert parse_gazetteer_line("Nowhere\t95\t20\tRS\n") is None
+
+
+def test_bundled_gazetteer_loads() -> None:
+    geocoder = load_gazetteer(BUNDLED_GAZETTEER)
+    place, _ = geocoder.nearest(44.81, 20.46)
+    assert place.display_name == "Belgrade, RS"
+    assert place.raw["source"] == "offline"
+
+
+@respx.mock
+def test_include_place_uses_offline_index_before_nominatim(monkeypatch, tmp_path) -> None:
+    met_gateway.clear_cache()
+    geocoder_gateway.clear_cache()
+
+    gazetteer = tmp_path / "places.tsv"
+    gazetteer.write_text("Belgrade\t44.8178\t20.4569\tRS\t1200000\n", encoding="utf-8")
+
+    monkeypatch.setenv("MET_CACHE_TTL_S", "0")
+    monkeypatch.setenv("GEOCODER_BASE_URL", NOMINATIM)
+    monkeypatch.setenv("GEOCODER_OFFLINE_PATH", str(gazetteer))
+    monkeypatch.setenv("GEOCODER_OFFLINE_MAX_DISTANCE_KM", "25")
+    get_settings.cache_clear()
+
+    respx.get(MET_URL).mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "properties": {
+                    "timeseries": [
+                        {"time": "2026-01-26T13:00:00Z", "data": {"instant": {"details": {"air_temperature": 2.0}}}},
+                    ],
+                }
+            },
+        )
+    )
+    reverse = respx.get(REVERSE_URL).mock(
+        return_value=httpx.Response(200, json={"display_name": "Somewhere", "lat": "10", "lon": "10", "address": {}})
+    )
+
+    client = TestClient(app)
+    r = client.get("/v1/forecast", params={"lat": 44.8, "lon": 20.47, "include_place": "true"})
+    assert r.status_code == 200
+    assert r.json()["location"]["place_name"] == "Belgrade, RS"
+    assert reverse.call_count == 0
+
+    # beyond GEOCODER_OFFLINE_MAX_DISTANCE_KM -> Nominatim fallback
+    r = client.get("/v1/forecast", params={"lat": 10.0, "lon": 10.0, "include_place": "true"})
+    assert r.status_code == 200
+    assert r.json()["location"]["place_name"] == "Somewhere"
+    assert reverse.call_count == 1
+
+    assert geocoder_gateway.get_stats()["offline_index"]["places"] == 1
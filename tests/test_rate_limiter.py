@@ -0,0 +1,168 @@
+import asyncio
+import struct
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from met_weather_service.services import rate_limiter
+from met_weather_service.services.rate_limiter import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_HEALTH,
+    PRIORITY_INTERACTIVE,
+    SharedTokenBucketRateLimiter,
+    TokenBucketRateLimiter,
+    create_rate_limiter,
+)
+
+
+def test_token_bucket_allows_burst_then_rejects() -> None:
+    limiter = TokenBucketRateLimiter(max_calls=3, period_s=60)
+
+    assert [limiter.allow() for _ in range(4)] == [True, True, True, False]
+    assert limiter.stats()["rejected"] == 1
+
+
+def test_acquire_waits_for_next_token() -> None:
+    limiter = TokenBucketRateLimiter(max_calls=1, period_s=0.05)
+    assert limiter.acquire()
+
+    started = time.monotonic()
+    assert limiter.acquire(timeout=1.0)
+    assert time.monotonic() - started >= 0.04
+
+    # next slot is ~50 ms away: too far for a 10 ms timeout
+    assert not limiter.acquire(timeout=0.01)
+
+
+def test_waiters_are_served_fifo_and_bounded() -> None:
+    limiter = TokenBucketRateLimiter(max_calls=1, period_s=0.02, max_waiters=3)
+    assert limiter.allow()
+
+    order: list[int] = []
+
+    def worker(i: int) -> None:
+        if limiter.acquire(timeout=1.0):
+            order.append(i)
+
+    threads = []
+    for i in range(3):
+        t = threading.Thread(target=worker, args=(i,))
+        t.start()
+        threads.append(t)
+        time.sleep(0.002)  # fix arrival order
+
+    assert limiter.stats()["waiting"] == 3
+    assert not limiter.acquire(timeout=1.0)  # queue full
+
+    for t in threads:
+        t.join()
+
+    assert order == [0, 1, 2]
+    assert limiter.stats()["waiting"] == 0
+
+
+def test_cancelled_async_waiter_returns_its_token() -> None:
+    async def scenario() -> None:
+        limiter = TokenBucketRateLimiter(max_calls=1, period_s=0.2)
+        assert await limiter.aacquire()
+
+        waiter = asyncio.create_task(limiter.aacquire(timeout=1.0))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert limiter.stats()["waiting"] == 0
+        # the refunded reservation does not delay the next caller further
+        started = time.monotonic()
+        assert await limiter.aacquire(timeout=1.0)
+        assert time.monotonic() - started < 0.25
+
+    asyncio.run(scenario())
+
+
+def test_interrupted_sync_waiter_returns_its_token(monkeypatch) -> None:
+    limiter = TokenBucketRateLimiter(max_calls=1, period_s=60)
+    assert limiter.acquire()
+
+    def interrupted(_: float) -> None:
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(rate_limiter.time, "sleep", interrupted)
+    with pytest.raises(KeyboardInterrupt):
+        limiter.acquire(timeout=120.0)
+
+    stats = limiter.stats()
+    assert stats["waiting"] == 0
+    # the reservation was refunded instead of pushing the next slot a full period further out
+    assert -0.01 < stats["tokens"] < 0.01
+
+
+def test_shared_bucket_is_shared_between_instances_and_processes(tmp_path) -> None:
+    path = str(tmp_path / "met.bucket")
+    a = SharedTokenBucketRateLimiter(path, max_calls=3, period_s=60)
+    b = SharedTokenBucketRateLimiter(path, max_calls=3, period_s=60)
+
+    assert a.allow()
+    assert b.allow()
+
+    # another worker process takes the last token
+    code = (
+        "import sys; from met_weather_service.services.rate_limiter import SharedTokenBucketRateLimiter as L; "
+        "sys.exit(0 if L(sys.argv[1], max_calls=3, period_s=60).allow() else 1)"
+    )
+    assert subprocess.run([sys.executable, "-c", code, path]).returncode == 0
+
+    assert not a.allow()
+    assert not b.allow()
+    a.close()
+    b.close()
+
+
+def test_shared_bucket_recovers_from_timestamp_of_previous_boot(tmp_path) -> None:
+    path = tmp_path / "met.bucket"
+    # empty bucket stamped by a monotonic clock far ahead of this one
+    path.write_bytes(struct.pack("<dd", 0.0, time.monotonic() + 1e6))
+
+    limiter = SharedTokenBucketRateLimiter(str(path), max_calls=2, period_s=60)
+    assert limiter.allow()
+    assert limiter.allow()
+    assert not limiter.allow()
+    limiter.close()
+
+
+def test_create_rate_limiter_backends(tmp_path) -> None:
+    assert type(create_rate_limiter("met", 1, 1.0)) is TokenBucketRateLimiter
+
+    shared = create_rate_limiter("met", 1, 1.0, backend="file", directory=str(tmp_path))
+    assert isinstance(shared, SharedTokenBucketRateLimiter)
+    assert shared.path == str(tmp_path / "met.bucket")
+    shared.close()
+
+
+def test_reserved_capacity_is_kept_for_interactive_traffic() -> None:
+    limiter = TokenBucketRateLimiter(max_calls=4, period_s=60, reserved=2)
+
+    assert limiter.allow(PRIORITY_BACKGROUND)
+    assert limiter.allow(PRIORITY_HEALTH)
+    # only the reserve is left: background/health are turned away
+    assert not limiter.allow(PRIORITY_BACKGROUND)
+    assert not limiter.acquire(timeout=10.0, priority=PRIORITY_HEALTH)
+
+    assert limiter.allow()
+    assert limiter.allow()
+    assert not limiter.allow()
+
+    by_priority = limiter.stats()["by_priority"]
+    assert by_priority[PRIORITY_INTERACTIVE] == {"granted": 2, "delayed": 0, "rejected": 1}
+    assert by_priority[PRIORITY_BACKGROUND] == {"granted": 1, "delayed": 0, "rejected": 1}
+    assert by_priority[PRIORITY_HEALTH] == {"granted": 1, "delayed": 0, "rejected": 1}
+
+
+def test_reserve_never_blocks_low_priority_completely() -> None:
+    limiter = TokenBucketRateLimiter(max_calls=1, period_s=60, reserved=5)
+
+    assert limiter.allow(PRIORITY_HEALTH)